@@ -4,7 +4,8 @@ __version__ = "1.0.0"
 __author__ = "GhostTypes"
 __description__ = "A comprehensive MCP server for Pokemon Go events, raids, research, and eggs"
 
-from .server import main
+from typing import Any
+
 from .types import (
     EventInfo, RaidInfo, ResearchTaskInfo, EggInfo, PokemonInfo,
     TypeInfo, WeatherInfo, BonusInfo, RocketTrainerInfo, ShadowPokemonInfo, RocketLineupSlot
@@ -36,3 +37,12 @@ __all__ = [
     "format_research_summary",
     "format_egg_summary",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Importing the server pulls in FastMCP and registers every tool, so only
+    # do it when ``main`` is actually requested
+    if name == "main":
+        from .server import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,392 +1,617 @@
 """API client for fetching data from LeekDuck Pokemon Go API."""
 
-import json
+import asyncio
 import logging
+import mmap
+import os
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-from datetime import datetime, timezone
-from dateutil import parser
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+try:
+    # orjson parses straight from a buffer in native code; fall back to the stdlib
+    from orjson import loads as _parse_buffer
+except ImportError:
+    import json
+
+    def _parse_buffer(buffer: memoryview) -> Any:
+        """Parse a JSON document from a bytes-like buffer with the stdlib parser."""
+        return json.loads(buffer.tobytes())
 
 from .types import (
     EventInfo, RaidInfo, ResearchTaskInfo, EggInfo, PokemonInfo,
-    TypeInfo, WeatherInfo, BonusInfo, EventExtraData, ApiData,
-    RocketTrainerInfo, ShadowPokemonInfo, RocketLineupSlot,
+    TypeInfo, WeatherInfo, BonusInfo, EventExtraData, ApiData, EggIndex, RaidIndex, ResearchIndex,
+    RocketIndex, RocketTrainerInfo, ShadowPokemonInfo, RocketLineupSlot,
     PromoCodeInfo, PromoCodeReward
 )
+from .utils import format_json_output
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Endpoints backed by a <endpoint>.json file in the data directory
+DATA_ENDPOINTS = ("events", "raids", "research", "eggs", "rocket-lineups", "promo-codes")
+
+# Canonical copies of the small, heavily repeated vocabulary (type names, type and
+# weather icon URLs) so every record shares one string object per distinct value
+_canonical: Dict[str, str] = {}
+
+
+def _canon(value: str) -> str:
+    """Return the shared copy of a repeated string value."""
+    return _canonical.setdefault(value, value)
+
+
+def _canon_weaknesses(weaknesses: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Rebuild a {"double": [...], "single": [...]} weakness map over canonical type names."""
+    return {kind: [_canon(t) for t in types] for kind, types in weaknesses.items()}
+
+
+# Keys accepted by get_data and returned by get_all_data, mapped to their client getters
+ALL_DATA_KEYS = ("events", "raids", "research", "eggs", "rocket_lineups", "promo_codes")
+_DATA_GETTERS = {
+    "events": "get_events",
+    "raids": "get_raids",
+    "research": "get_research",
+    "eggs": "get_eggs",
+    "rocket_lineups": "get_rocket_lineups",
+    "promo_codes": "get_promo_codes",
+}
+
+# Shared default for optional list fields that are only iterated, never stored
+_EMPTY: Tuple = ()
+
+# Read-only defaults shared by every record instead of a fresh literal per item
+_NO_WEAKNESSES = MappingProxyType({"double": (), "single": ()})
+
+# Flat records map one JSON key to each dataclass field, in declaration order.
+# Keys are read with one itemgetter call; the defaults only fill in missing keys.
+_EVENT_DEFAULTS = {
+    "eventID": "", "name": "", "eventType": "", "heading": "", "link": "",
+    "image": "", "start": "", "end": "", "extraData": None,
+}
+_event_fields = itemgetter(*_EVENT_DEFAULTS)
+
+_EGG_DEFAULTS = {
+    "name": "", "eggType": "", "isAdventureSync": False, "image": "",
+    "canBeShiny": False, "combatPower": -1, "isRegional": False,
+    "isGiftExchange": False, "isRouteGift": False, "rarity": 1,
+}
+_egg_fields = itemgetter(*_EGG_DEFAULTS)
+
+# The {"name", "image"} pairs used by raid types and boosted weather
+_NAME_IMAGE_DEFAULTS = {"name": "", "image": ""}
+_name_image_fields = itemgetter(*_NAME_IMAGE_DEFAULTS)
+
+
+def _record_fields(fields: Callable[[Dict], Tuple], defaults: Dict, item: Dict) -> Tuple:
+    """Extract a record's fields, falling back to defaults for any missing key."""
+    try:
+        return fields(item)
+    except KeyError:
+        # Older or partial scrapes; complete records never take this path
+        return fields({**defaults, **item})
+
+
+def _name_image(entry: Dict) -> Tuple[str, str]:
+    """Return the shared name and image strings of a raid type or weather entry."""
+    name, image = _record_fields(_name_image_fields, _NAME_IMAGE_DEFAULTS, entry)
+    return _canon(name), _canon(image)
+
+
+# The builders below pass dataclass fields positionally, in the order they are
+# declared in types.py; keep the two in sync when adding fields
+def _build_event(item: Dict) -> EventInfo:
+    """Build an EventInfo from one scraped event entry."""
+    return EventInfo(*_record_fields(_event_fields, _EVENT_DEFAULTS, item))
+
+
+def _build_raid(item: Dict) -> RaidInfo:
+    """Build a RaidInfo from one scraped raid entry."""
+    get = item.get
+    return RaidInfo(
+        get("name", ""),
+        get("tier", ""),
+        get("canBeShiny", False),
+        [TypeInfo(*_name_image(t)) for t in get("types") or _EMPTY],
+        get("combatPower", {}),
+        [WeatherInfo(*_name_image(w)) for w in get("boostedWeather") or _EMPTY],
+        get("image", ""),
+        get("extra_data")
+    )
+
+
+def _build_research_task(item: Dict) -> ResearchTaskInfo:
+    """Build a ResearchTaskInfo from one scraped research entry."""
+    return ResearchTaskInfo(
+        item.get("text", ""),
+        [
+            PokemonInfo(
+                reward.get("name", ""),
+                reward.get("image", ""),
+                reward.get("can_be_shiny", False),
+                reward.get("combatPower")
+            )
+            for reward in item.get("rewards") or _EMPTY
+        ],
+        item.get("type")
+    )
+
+
+def _build_egg(item: Dict) -> EggInfo:
+    """Build an EggInfo from one scraped egg entry."""
+    return EggInfo(*_record_fields(_egg_fields, _EGG_DEFAULTS, item))
+
+
+def _build_rocket_slot(lineup_data: Dict) -> RocketLineupSlot:
+    """Build a RocketLineupSlot and its shadow Pokemon from one scraped lineup slot."""
+    return RocketLineupSlot(
+        lineup_data.get("slot", 0),
+        lineup_data.get("is_encounter", False),
+        [
+            ShadowPokemonInfo(
+                pokemon_data.get("name", ""),
+                [_canon(t) for t in pokemon_data.get("types") or _EMPTY],
+                _canon_weaknesses(pokemon_data.get("weaknesses") or _NO_WEAKNESSES),
+                pokemon_data.get("image", ""),
+                pokemon_data.get("can_be_shiny", False)
+            )
+            for pokemon_data in lineup_data.get("pokemon") or _EMPTY
+        ]
+    )
+
+
+def _build_rocket_trainer(item: Dict) -> RocketTrainerInfo:
+    """Build a RocketTrainerInfo from one scraped Team Rocket entry."""
+    get = item.get
+    return RocketTrainerInfo(
+        get("name", ""),
+        get("title", ""),
+        get("quote", ""),
+        get("image", ""),
+        get("type"),
+        [_build_rocket_slot(slot) for slot in get("lineups") or _EMPTY]
+    )
+
+
+def _parse_expiration(expiration: str) -> Optional[datetime]:
+    """Parse a promo code's ISO expiration timestamp, or return None if it is missing or malformed."""
+    if not expiration:
+        return None
+    try:
+        return datetime.fromisoformat(expiration.replace('Z', '+00:00'))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _build_promo_code(item: Dict) -> PromoCodeInfo:
+    """Build a PromoCodeInfo from one scraped promo code entry."""
+    get = item.get
+    expiration = get("expiration", "")
+    return PromoCodeInfo(
+        get("code", ""),
+        get("title", ""),
+        get("description", ""),
+        get("redemption_url", ""),
+        [
+            PromoCodeReward(
+                reward.get("name", ""),
+                reward.get("url", ""),
+                reward.get("type", "")
+            )
+            for reward in get("rewards") or _EMPTY
+        ],
+        expiration,
+        _parse_expiration(expiration)
+    )
+
+
+# Legendary bosses that appear in event raid lists; matched anywhere in the name
+_LEGENDARY_RE = re.compile(
+    "palkia|dialga|giratina|rayquaza|kyogre|groudon|lugia|ho-oh|mewtwo|mew|celebi|"
+    "jirachi|deoxys|reshiram|zekrom|kyurem|xerneas|yveltal|zygarde",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=1024)
+def _infer_raid_tier(name: str) -> str:
+    """Infer a raid tier from a boss name; the same bosses recur across events."""
+    if name[:5].lower() == "mega ":
+        return "Mega"
+    if _LEGENDARY_RE.search(name):
+        return "5*"
+    return "Unknown"
+
+
+def _build_fallback_raid(event: EventInfo, boss: Dict) -> RaidInfo:
+    """Build a RaidInfo from a boss listed in an event's raid battle data."""
+    boss_name = boss.get("name", "Unknown")
+    return RaidInfo(
+        boss_name,
+        _infer_raid_tier(boss_name),
+        boss.get("canBeShiny", False),
+        [],  # Would need to lookup types elsewhere
+        {"normal": {"min": -1, "max": -1}, "boosted": {"min": -1, "max": -1}},
+        [],
+        boss.get("image", ""),
+        {
+            "source": "events_fallback",
+            "event_name": event.name,
+            "event_end": event.end
+        }
+    )
+
+
+# Typed-object builder for each data file
+_ENDPOINT_BUILDERS: Dict[str, Callable[[Dict], Any]] = {
+    "events": _build_event,
+    "raids": _build_raid,
+    "research": _build_research_task,
+    "eggs": _build_egg,
+    "rocket-lineups": _build_rocket_trainer,
+    "promo-codes": _build_promo_code,
+}
+
+
+def _index_events_by_id(events: List[EventInfo]) -> Dict[str, EventInfo]:
+    """Map event IDs to events, keeping the first event if an ID repeats."""
+    by_id: Dict[str, EventInfo] = {}
+    for event in events:
+        by_id.setdefault(event.event_id, event)
+    return by_id
+
+
+def _index_event_search_text(events: List[EventInfo]) -> List[Tuple[EventInfo, str]]:
+    """Pair each event with the lowercased text that search_events matches against.
+
+    Name, type and heading are joined with NUL so one substring test covers all
+    three fields without a query matching across a field boundary.
+    """
+    return [(event, f"{event.name}\x00{event.event_type}\x00{event.heading}".lower()) for event in events]
+
+
+class _EventTypeSlices(dict):
+    """Events whose lowercased type contains a given fragment, filtered on first request."""
+    
+    # Fragments come from tool arguments, so don't let the map grow without bound
+    MAX_SLICES = 64
+    
+    def __init__(self, events: List[EventInfo]):
+        super().__init__()
+        self._events = events
+    
+    def __missing__(self, fragment: str) -> List[EventInfo]:
+        if len(self) >= self.MAX_SLICES:
+            self.clear()
+        matched = self[fragment] = [e for e in self._events if fragment in e.event_type.lower()]
+        return matched
+
 
 class LeekDuckAPIClient:
     """Client for fetching Pokemon Go data using local scraper."""
     
+    # The scraper rewrites data files in place, so a read can catch one half-written.
+    # Unreadable files are retried with exponential backoff before giving up.
+    LOAD_ATTEMPTS = 3
+    LOAD_RETRY_DELAY = 0.3  # seconds before the first retry, doubled after each
+    
     def __init__(self, timeout: int = 30):
         """Initialize the API client."""
         self.timeout = timeout
         self._cache: Dict[str, List[Dict]] = {}
-        self._cache_timestamp: Dict[str, datetime] = {}
-        self._cache_duration = 86400  # 24 hours cache
+        self._cache_timestamp: Dict[str, float] = {}  # time.monotonic() of last load
+        self._cache_validator: Dict[str, Tuple[int, int]] = {}
+        self._typed_cache: Dict[str, Tuple[List[Dict], list]] = {}  # endpoint -> (raw list, typed objects)
+        self._pending_loads: Dict[str, asyncio.Future] = {}  # endpoint -> in-flight file load
+        self._index_cache: Dict[Callable, Tuple[List[Dict], object]] = {}  # index builder -> (raw list, lookup index)
+        self._extra_data_json: Optional[Tuple[List[Dict], Dict[str, str]]] = None  # (raw events list, event ID -> formatted extra data)
         
         # Path to local scraped data directory
         self._local_data_dir = Path(__file__).parent.parent / "data"
+        self._data_paths: Dict[str, str] = {
+            endpoint: str(self._local_data_dir / f"{endpoint}.json") for endpoint in DATA_ENDPOINTS
+        }
+    
+    def _data_path(self, endpoint: str) -> str:
+        """Return the absolute path of an endpoint's local data file."""
+        path = self._data_paths.get(endpoint)
+        if path is None:
+            path = self._data_paths[endpoint] = str(self._local_data_dir / f"{endpoint}.json")
+        return path
+    
+    def _file_validator(self, endpoint: str) -> Optional[Tuple[int, int]]:
+        """Return an (mtime, size) validator for an endpoint's local file, like an ETag."""
+        try:
+            stat = os.stat(self._data_path(endpoint))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _read_local_file(self, local_file: str) -> Tuple[List[Dict], Tuple[int, int]]:
+        """Parse a local JSON data file, returning the data and the (mtime, size) of the file read."""
+        # Parse straight from a read-only mapping; no copy of the file contents is made
+        with open(local_file, 'rb') as f:
+            # Stat the open file so the validator describes exactly the bytes parsed,
+            # even if the path is replaced while we read
+            stat = os.fstat(f.fileno())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return _parse_buffer(view), (stat.st_mtime_ns, stat.st_size)
     
-    def _load_local_data(self, endpoint: str) -> List[Dict]:
-        """Load data from local JSON files."""
-        local_file = self._local_data_dir / f"{endpoint}.json"
+    def _load_local_data(self, endpoint: str) -> Tuple[List[Dict], Optional[Tuple[int, int]]]:
+        """Load data from local JSON files, retrying files that can't be parsed yet.
         
-        if not local_file.exists():
-            logger.error(f"Local file {local_file} does not exist. Run the scraper first.")
-            return []
+        Returns the data with the validator of the file it was parsed from. Runs in a
+        worker thread, so sleeping between attempts doesn't block the event loop.
+        A file that still fails is cached as empty until it changes on disk, so a broken
+        file isn't re-read on every request.
+        """
+        local_file = self._data_path(endpoint)
+        delay = self.LOAD_RETRY_DELAY
         
-        try:
-            with open(local_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.info(f"Loaded {len(data)} items from local {endpoint} data")
-                return data
-        except Exception as e:
-            logger.error(f"Error loading local {endpoint} data: {e}")
-            return []
+        for attempt in range(1, self.LOAD_ATTEMPTS + 1):
+            try:
+                data, validator = self._read_local_file(local_file)
+                logger.info("Loaded %s items from local %s data", len(data), endpoint)
+                return data, validator
+            except FileNotFoundError:
+                logger.error("Local file %s does not exist. Run the scraper first.", local_file)
+                return [], None
+            except Exception as e:
+                if attempt == self.LOAD_ATTEMPTS:
+                    logger.error("Error loading local %s data: %s", endpoint, e)
+                    return [], self._file_validator(endpoint)
+                logger.warning("Error loading local %s data (attempt %s of %s), retrying in %.1fs: %s", endpoint, attempt, self.LOAD_ATTEMPTS, delay, e)
+                time.sleep(delay)
+                delay *= 2
+        
+        return [], None
     
     async def _fetch_data(self, endpoint: str) -> List[Dict]:
-        """Fetch data from local files with simple caching."""
-        now = datetime.now(timezone.utc)
-        
-        # Check if we have fresh cached data
-        if (endpoint in self._cache and 
-            endpoint in self._cache_timestamp and
-            (now - self._cache_timestamp[endpoint]).seconds < self._cache_duration):
-            logger.info(f"Using cached data for {endpoint}")
+        """Fetch data from local files, reusing the cached copy until the file changes."""
+        # One stat per call: a re-scrape invalidates the cache as soon as it lands
+        validator = self._file_validator(endpoint)
+        if (endpoint in self._cache and
+            validator is not None and
+            self._cache_validator.get(endpoint) == validator):
+            logger.info("Using cached data for %s", endpoint)
             return self._cache[endpoint]
         
-        # Load from local file
-        data = self._load_local_data(endpoint)
+        # Load from local file off the event loop so concurrent fetches overlap.
+        # Callers that miss while a load is already running share it instead of
+        # starting their own.
+        load = self._pending_loads.get(endpoint)
+        if load is None:
+            load = asyncio.ensure_future(asyncio.to_thread(self._load_local_data, endpoint))
+            self._pending_loads[endpoint] = load
+            load.add_done_callback(lambda _: self._pending_loads.pop(endpoint, None))
+        # The validator comes from the load itself: a caller that joined a running
+        # load may have seen a newer file than the one actually parsed
+        data, validator = await asyncio.shield(load)
         
         # Cache the data
         self._cache[endpoint] = data
-        self._cache_timestamp[endpoint] = now
+        self._cache_timestamp[endpoint] = time.monotonic()
+        if validator is not None:
+            self._cache_validator[endpoint] = validator
+        else:
+            self._cache_validator.pop(endpoint, None)
         
         return data
     
-    async def get_events(self) -> List[EventInfo]:
-        """Get all Pokemon Go events."""
-        data = await self._fetch_data("events")
-        events = []
+    async def _fetch_typed(self, endpoint: str, build: Callable[[Dict], T]) -> List[T]:
+        """Fetch an endpoint and build its typed objects, reusing them while the raw data is cached."""
+        data = await self._fetch_data(endpoint)
         
-        for item in data:
-            # Parse extra data if present
-            extra_data = None
-            if "extraData" in item:
-                extra_data = item["extraData"]
-            
-            event = EventInfo(
-                event_id=item.get("eventID", ""),
-                name=item.get("name", ""),
-                event_type=item.get("eventType", ""),
-                heading=item.get("heading", ""),
-                link=item.get("link", ""),
-                image=item.get("image", ""),
-                start=item.get("start", ""),
-                end=item.get("end", ""),
-                extra_data=extra_data
-            )
-            events.append(event)
+        # The typed list is only valid for the exact raw list it was built from
+        cached = self._typed_cache.get(endpoint)
+        if cached is not None and cached[0] is data:
+            return list(cached[1])
         
-        return events
+        items = list(map(build, data))
+        self._typed_cache[endpoint] = (data, items)
+        return list(items)
     
-    async def get_raids(self) -> List[RaidInfo]:
-        """Get all current raid bosses."""
-        data = await self._fetch_data("raids")
-        raids = []
+    async def _fetch_index(self, endpoint: str, build: Callable[[Dict], T], make_index: Callable[[List[T]], Any]) -> Any:
+        """Fetch an endpoint's typed objects and return a lookup index over them, rebuilt only when the data changes."""
+        items = await self._fetch_typed(endpoint, build)
+        data = self._cache.get(endpoint)
         
-        for item in data:
-            # Parse types
-            types = []
-            for type_data in item.get("types", []):
-                types.append(TypeInfo(
-                    name=type_data.get("name", ""),
-                    image=type_data.get("image", "")
-                ))
-            
-            # Parse boosted weather
-            weather = []
-            for weather_data in item.get("boostedWeather", []):
-                weather.append(WeatherInfo(
-                    name=weather_data.get("name", ""),
-                    image=weather_data.get("image", "")
-                ))
-            
-            raid = RaidInfo(
-                name=item.get("name", ""),
-                tier=item.get("tier", ""),
-                can_be_shiny=item.get("canBeShiny", False),
-                types=types,
-                combat_power=item.get("combatPower", {}),
-                boosted_weather=weather,
-                image=item.get("image", ""),
-                extra_data=item.get("extra_data")
-            )
-            raids.append(raid)
+        # Several indexes can be built over one endpoint, so key by the builder
+        cached = self._index_cache.get(make_index)
+        if cached is not None and cached[0] is data:
+            return cached[1]
         
-        return raids
+        index = make_index(items)
+        self._index_cache[make_index] = (data, index)
+        return index
     
-    async def get_research(self) -> List[ResearchTaskInfo]:
-        """Get all current field research tasks."""
-        data = await self._fetch_data("research")
-        research_tasks = []
+    async def get_rendered(self, endpoint: str, render: Callable[[list], Any]) -> Any:
+        """Render an endpoint's typed objects, reusing the output until the data file changes.
         
-        for item in data:
-            # Parse rewards
-            rewards = []
-            for reward_data in item.get("rewards", []):
-                pokemon = PokemonInfo(
-                    name=reward_data.get("name", ""),
-                    image=reward_data.get("image", ""),
-                    can_be_shiny=reward_data.get("can_be_shiny", False),
-                    combat_power=reward_data.get("combatPower")
-                )
-                rewards.append(pokemon)
-            
-            task = ResearchTaskInfo(
-                text=item.get("text", ""),
-                rewards=rewards,
-                task_type=item.get("type")
-            )
-            research_tasks.append(task)
+        ``render`` must be a pure function of the objects (no clock reads) and must not
+        mutate them; each render function gets its own cache slot. The output, text or
+        sections of text, is shared between callers and must not be mutated.
+        """
+        return await self._fetch_index(endpoint, _ENDPOINT_BUILDERS[endpoint], render)
+    
+    async def get_events(self, event_type: Optional[str] = None) -> List[EventInfo]:
+        """Get all Pokemon Go events, optionally only those whose type contains ``event_type``.
         
-        return research_tasks
+        The type filter is case-insensitive and each distinct filter is computed
+        once per data load.
+        """
+        if not event_type:
+            return await self._fetch_typed("events", _build_event)
+        
+        slices = await self._fetch_index("events", _build_event, _EventTypeSlices)
+        return list(slices[event_type.lower()])
+    
+    async def get_events_by_id(self) -> Dict[str, EventInfo]:
+        """Get all Pokemon Go events keyed by event ID."""
+        return await self._fetch_index("events", _build_event, _index_events_by_id)
+    
+    async def get_event_search_index(self) -> List[Tuple[EventInfo, str]]:
+        """Get all events paired with their lowercased name, type and heading for text search."""
+        return await self._fetch_index("events", _build_event, _index_event_search_text)
+    
+    async def get_event_extra_data_json(self, event: EventInfo) -> str:
+        """Get an event's extra data as pretty-printed JSON, formatted at most once per data load."""
+        data = await self._fetch_data("events")
+        
+        # Filled in as events are viewed, and started afresh whenever the events file is reloaded
+        cached = self._extra_data_json
+        if cached is None or cached[0] is not data:
+            cached = self._extra_data_json = (data, {})
+        formatted = cached[1]
+        text = formatted.get(event.event_id)
+        if text is None:
+            # Large nested payloads take a while to pretty-print; do it off the event loop
+            text = formatted[event.event_id] = await asyncio.to_thread(format_json_output, event.extra_data)
+        return text
+    
+    async def get_raids(self) -> List[RaidInfo]:
+        """Get all current raid bosses."""
+        return await self._fetch_typed("raids", _build_raid)
+    
+    async def get_raid_index(self) -> RaidIndex:
+        """Get all current raid bosses grouped by tier, type and boosting weather."""
+        return await self._fetch_index("raids", _build_raid, RaidIndex.from_raids)
+    
+    async def get_research(self) -> List[ResearchTaskInfo]:
+        """Get all current field research tasks."""
+        return await self._fetch_typed("research", _build_research_task)
+    
+    async def get_research_index(self) -> ResearchIndex:
+        """Get all current field research tasks with their searchable text lowercased."""
+        return await self._fetch_index("research", _build_research_task, ResearchIndex.from_tasks)
     
     async def get_eggs(self) -> List[EggInfo]:
         """Get all Pokemon available from eggs."""
-        data = await self._fetch_data("eggs")
-        eggs = []
-
-        for item in data:
-            egg = EggInfo(
-                name=item.get("name", ""),
-                egg_type=item.get("eggType", ""),
-                is_adventure_sync=item.get("isAdventureSync", False),
-                image=item.get("image", ""),
-                can_be_shiny=item.get("canBeShiny", False),
-                combat_power=item.get("combatPower", -1),
-                is_regional=item.get("isRegional", False),
-                is_gift_exchange=item.get("isGiftExchange", False),
-                is_route_gift=item.get("isRouteGift", False),
-                rarity=item.get("rarity", 1)
-            )
-            eggs.append(egg)
+        return await self._fetch_typed("eggs", _build_egg)
 
-        return eggs
+    async def get_egg_index(self) -> EggIndex:
+        """Get all egg Pokemon grouped by egg type and feature flag."""
+        return await self._fetch_index("eggs", _build_egg, EggIndex.from_eggs)
 
     async def get_rocket_lineups(self) -> List[RocketTrainerInfo]:
         """Get all Team Rocket trainer lineups."""
-        data = await self._fetch_data("rocket-lineups")
-        trainers = []
-
-        for item in data:
-            # Parse lineup slots
-            lineups = []
-            for lineup_data in item.get("lineups", []):
-                # Parse Pokemon in each slot
-                pokemon_list = []
-                for pokemon_data in lineup_data.get("pokemon", []):
-                    shadow_pokemon = ShadowPokemonInfo(
-                        name=pokemon_data.get("name", ""),
-                        types=pokemon_data.get("types", []),
-                        weaknesses=pokemon_data.get("weaknesses", {"double": [], "single": []}),
-                        image=pokemon_data.get("image", ""),
-                        can_be_shiny=pokemon_data.get("can_be_shiny", False)
-                    )
-                    pokemon_list.append(shadow_pokemon)
-
-                lineup_slot = RocketLineupSlot(
-                    slot=lineup_data.get("slot", 0),
-                    is_encounter=lineup_data.get("is_encounter", False),
-                    pokemon=pokemon_list
-                )
-                lineups.append(lineup_slot)
-
-            trainer = RocketTrainerInfo(
-                name=item.get("name", ""),
-                title=item.get("title", ""),
-                quote=item.get("quote", ""),
-                image=item.get("image", ""),
-                type=item.get("type"),
-                lineups=lineups
-            )
-            trainers.append(trainer)
-
-        return trainers
+        return await self._fetch_typed("rocket-lineups", _build_rocket_trainer)
+    
+    async def get_rocket_index(self) -> RocketIndex:
+        """Get all Team Rocket trainer lineups, shared by every rocket tool until the data changes."""
+        return await self._fetch_index("rocket-lineups", _build_rocket_trainer, RocketIndex.from_trainers)
     
     async def get_promo_codes(self) -> List[PromoCodeInfo]:
         """Get all active promo codes."""
-        data = await self._fetch_data("promo-codes")
-        promo_codes = []
-
-        for item in data:
-            # Parse rewards
-            rewards = []
-            for reward_data in item.get("rewards", []):
-                reward = PromoCodeReward(
-                    name=reward_data.get("name", ""),
-                    url=reward_data.get("url", ""),
-                    type=reward_data.get("type", "")
-                )
-                rewards.append(reward)
-
-            promo_code = PromoCodeInfo(
-                code=item.get("code", ""),
-                title=item.get("title", ""),
-                description=item.get("description", ""),
-                redemption_url=item.get("redemption_url", ""),
-                rewards=rewards,
-                expiration=item.get("expiration", "")
-            )
-            promo_codes.append(promo_code)
-
-        return promo_codes
+        return await self._fetch_typed("promo-codes", _build_promo_code)
     
     def extract_raids_from_events(self, events_data: List[EventInfo]) -> List[RaidInfo]:
         """Extract raid boss data from events as fallback when raids.json is unavailable."""
-        extracted_raids = []
-        current_time = datetime.now(timezone.utc)
-        
-        # Simple tier inference based on common patterns
-        def infer_tier(name: str) -> str:
-            name_lower = name.lower()
-            if name_lower.startswith("mega "):
-                return "Mega"
-            elif any(legendary in name_lower for legendary in [
-                "palkia", "dialga", "giratina", "rayquaza", "kyogre", "groudon",
-                "lugia", "ho-oh", "mewtwo", "mew", "celebi", "jirachi", "deoxys",
-                "reshiram", "zekrom", "kyurem", "xerneas", "yveltal", "zygarde"
-            ]):
-                return "5*"
-            else:
-                return "Unknown"
+        # Only events carrying raid data contribute (skip time check for now - let server handle filtering)
+        extracted_raids = [
+            _build_fallback_raid(event, boss)
+            for event in events_data
+            if event.extra_data and "raidbattles" in event.extra_data
+            for boss in event.extra_data["raidbattles"].get("bosses") or _EMPTY
+        ]
         
-        for event in events_data:
-            # Check if event contains raid data (skip time check for now - let server handle filtering)
-            if (event.extra_data and "raidbattles" in event.extra_data):
-
-                raid_data = event.extra_data["raidbattles"]
-                bosses = raid_data.get("bosses", [])
-
-                for boss in bosses:
-                    boss_name = boss.get("name", "Unknown")
-                    # Create RaidInfo object from event boss data
-                    raid = RaidInfo(
-                        name=boss_name,
-                        tier=infer_tier(boss_name),
-                        can_be_shiny=boss.get("canBeShiny", False),
-                        types=[],  # Would need to lookup types elsewhere
-                        combat_power={"normal": {"min": -1, "max": -1}, "boosted": {"min": -1, "max": -1}},
-                        boosted_weather=[],
-                        image=boss.get("image", ""),
-                        extra_data={
-                            "source": "events_fallback",
-                            "event_name": event.name,
-                            "event_end": event.end
-                        }
-                    )
-                    extracted_raids.append(raid)
-                    
-        logger.info(f"Extracted {len(extracted_raids)} raid bosses from {len(events_data)} events")
+        logger.info("Extracted %s raid bosses from %s events", len(extracted_raids), len(events_data))
         return extracted_raids
     
     async def get_all_data(self) -> Dict[str, Union[List[EventInfo], List[RaidInfo], List[ResearchTaskInfo], List[EggInfo], List[RocketTrainerInfo], List[PromoCodeInfo]]]:
         """Get all data from all endpoints with individual error handling."""
-        logger.info("Fetching all Pokemon Go data...")
-
-        # Initialize results with empty lists
-        events = []
-        raids = []
-        research = []
-        eggs = []
-        rocket_lineups = []
-        promo_codes = []
+        return await self.get_data(*ALL_DATA_KEYS)
+    
+    async def get_data(self, *keys: str) -> Dict[str, list]:
+        """Get several data sources at once, keyed like get_all_data.
         
-        # Fetch each data source individually with error handling
-        try:
-            events = await self.get_events()
-            logger.info(f"Successfully fetched {len(events)} events")
-        except Exception as e:
-            logger.warning(f"Failed to fetch events data: {e}")
-            events = []
+        Tools that need more than one source should use this rather than awaiting
+        getters one after another: the sources load concurrently, so the wait is
+        the slowest load rather than the sum of them.
+        """
+        logger.info("Fetching Pokemon Go data: %s", ', '.join(keys))
+
+        # Fetch every data source concurrently; exceptions come back as results
+        # so one failing endpoint doesn't affect the others
+        results = await asyncio.gather(
+            *(getattr(self, _DATA_GETTERS[name])() for name in keys),
+            return_exceptions=True
+        )
         
-        try:
-            raids = await self.get_raids()
-            if len(raids) > 0:
-                logger.info(f"Successfully fetched {len(raids)} raids from raids.json")
+        all_data = {}
+        for name, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to fetch %s data: %s", name, result)
+                all_data[name] = []
             else:
-                logger.warning("No raids data found in raids.json - attempting fallback...")
-                raise Exception("Empty raids data")
-        except Exception as e:
-            logger.warning(f"Failed to fetch raids data from raids.json: {e}")
-            logger.info("Attempting to extract raid data from events as fallback...")
+                logger.info("Successfully fetched %s %s", len(result), name)
+                all_data[name] = result
+        
+        # Raids are the one source with a fallback: pull bosses out of the events
+        if "raids" in all_data and not all_data["raids"]:
+            logger.warning("No raids data found in raids.json - attempting fallback...")
             try:
+                events = all_data["events"] if "events" in all_data else await self.get_events()
                 raids = self.extract_raids_from_events(events)
                 if raids:
-                    logger.info(f"Successfully extracted {len(raids)} raid bosses from events data")
+                    logger.info("Successfully extracted %s raid bosses from events data", len(raids))
                 else:
                     logger.warning("No raid data found in events either")
             except Exception as extract_error:
-                logger.error(f"Failed to extract raids from events: {extract_error}")
+                logger.error("Failed to extract raids from events: %s", extract_error)
                 raids = []
-        
-        try:
-            research = await self.get_research()
-            logger.info(f"Successfully fetched {len(research)} research tasks")
-        except Exception as e:
-            logger.warning(f"Failed to fetch research data: {e}")
-            research = []
-        
-        try:
-            eggs = await self.get_eggs()
-            logger.info(f"Successfully fetched {len(eggs)} egg data")
-        except Exception as e:
-            logger.warning(f"Failed to fetch eggs data: {e}")
-            eggs = []
-
-        try:
-            rocket_lineups = await self.get_rocket_lineups()
-            logger.info(f"Successfully fetched {len(rocket_lineups)} Team Rocket trainers")
-        except Exception as e:
-            logger.warning(f"Failed to fetch rocket lineups data: {e}")
-            rocket_lineups = []
-
-        try:
-            promo_codes = await self.get_promo_codes()
-            logger.info(f"Successfully fetched {len(promo_codes)} promo codes")
-        except Exception as e:
-            logger.warning(f"Failed to fetch promo codes data: {e}")
-            promo_codes = []
+            all_data["raids"] = raids
 
         logger.info("Completed fetching Pokemon Go data with individual error handling")
 
-        return {
-            "events": events,
-            "raids": raids,
-            "research": research,
-            "eggs": eggs,
-            "rocket_lineups": rocket_lineups,
-            "promo_codes": promo_codes
-        }
+        return all_data
+    
+    async def warm_caches(self) -> None:
+        """Load every data file and build the lookup indexes ahead of the first request."""
+        results = await asyncio.gather(
+            self.get_events_by_id(),
+            self.get_event_search_index(),
+            self.get_raid_index(),
+            self.get_research_index(),
+            self.get_egg_index(),
+            self.get_rocket_index(),
+            self.get_promo_codes(),
+            return_exceptions=True
+        )
+        
+        failures = [result for result in results if isinstance(result, BaseException)]
+        for failure in failures:
+            logger.warning("Failed to warm cache: %s", failure)
+        logger.info("Warmed caches for %s of %s lookups", len(results) - len(failures), len(results))
     
     def clear_cache(self):
         """Clear the data cache."""
         self._cache.clear()
         self._cache_timestamp.clear()
+        self._cache_validator.clear()
+        self._typed_cache.clear()
+        self._index_cache.clear()
+        self._extra_data_json = None
         logger.info("Cache cleared")
 
 
-# Global API client instance - using a function to ensure proper initialization
+# Global API client instance - created on first use rather than at import
+@lru_cache(maxsize=1)
 def get_api_client() -> 'LeekDuckAPIClient':
     """Get the global API client instance."""
-    global _api_client_instance
-    if _api_client_instance is None:
-        _api_client_instance = LeekDuckAPIClient()
-    return _api_client_instance
-
-# Initialize the global instance
-_api_client_instance: Optional['LeekDuckAPIClient'] = None
-api_client = get_api_client()
+    return LeekDuckAPIClient()
+
+
+def __getattr__(name: str) -> "LeekDuckAPIClient":
+    # Backwards compatibility for ``from pogo_mcp.api_client import api_client``;
+    # the shared client is created on first access instead of at import
+    if name == "api_client":
+        return get_api_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,19 +1,26 @@
 """Egg-related tools for the Pokemon Go MCP server."""
 
 import logging
-from typing import List, Optional
+from collections import defaultdict
+from itertools import islice
+from typing import TYPE_CHECKING, List, Optional
 
-from mcp.server.fastmcp import FastMCP
-
-from .api_client import api_client
+from .api_client import get_api_client
 from .types import EggInfo
 from .utils import (
     filter_eggs_by_distance, format_egg_summary, get_current_time_str,
     validate_pokemon_name, search_pokemon_by_name
 )
 
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
 logger = logging.getLogger(__name__)
 
+# Display order for egg types; types not listed here are shown after these
+_DISTANCE_ORDER = ("2 km", "5 km", "7 km", "10 km", "12 km", "Adventure Sync")
+_DISTANCE_SET = frozenset(_DISTANCE_ORDER)
+
 
 def _normalize_distance_display(distance: str) -> str:
     """Normalize distance for display purposes."""
@@ -32,7 +39,7 @@ def _normalize_distance_display(distance: str) -> str:
     return distance.title()
 
 
-def register_egg_tools(mcp: FastMCP) -> None:
+def register_egg_tools(mcp: "FastMCP") -> None:
     """Register all egg-related tools with the MCP server."""
     
     @mcp.tool()
@@ -43,51 +50,41 @@ def register_egg_tools(mcp: FastMCP) -> None:
         organized by egg distance with CP ranges, shiny availability, and special features.
         """
         try:
-            eggs = await api_client.get_eggs()
+            # Eggs come pre-grouped by egg type; the index is shared, so only read it
+            index = await get_api_client().get_egg_index()
+            eggs = index.eggs
             
             if not eggs:
                 return "No egg hatch data available."
             
-            # Organize by egg type
-            egg_types = {}
-            for egg in eggs:
-                egg_type = egg.egg_type
-                if egg_type not in egg_types:
-                    egg_types[egg_type] = []
-                egg_types[egg_type].append(egg)
+            egg_types = index.by_type
             
-            result = f"# Current Egg Hatches (as of {get_current_time_str()})\n\n"
+            parts = [f"# Current Egg Hatches (as of {get_current_time_str()})\n\n"]
             
             # Sort egg types by distance
-            distance_order = ["2 km", "5 km", "7 km", "10 km", "12 km", "Adventure Sync"]
-            sorted_types = []
-            
-            for distance in distance_order:
-                if distance in egg_types:
-                    sorted_types.append((distance, egg_types[distance]))
-                    del egg_types[distance]
+            sorted_types = [(distance, egg_types[distance]) for distance in _DISTANCE_ORDER if distance in egg_types]
             
             # Add any remaining egg types
-            for egg_type, egg_list in egg_types.items():
-                sorted_types.append((egg_type, egg_list))
+            sorted_types.extend(
+                (egg_type, egg_list) for egg_type, egg_list in egg_types.items() if egg_type not in _DISTANCE_SET
+            )
             
             for egg_type, egg_list in sorted_types:
-                result += f"## {egg_type} Eggs ({len(egg_list)} Pokemon)\n\n"
+                parts.append(f"## {egg_type} Eggs ({len(egg_list)} Pokemon)\n\n")
                 
-                for egg in egg_list:
-                    result += format_egg_summary(egg) + "\n\n"
+                parts.extend(format_egg_summary(egg) + "\n\n" for egg in egg_list)
             
             # Summary statistics
             total_eggs = len(eggs)
-            shiny_eggs = len([e for e in eggs if e.can_be_shiny])
-            regional_eggs = len([e for e in eggs if e.is_regional])
+            shiny_eggs = len(index.shiny)
+            regional_eggs = len(index.regional)
             
-            result += f"**Summary:** {total_eggs} Pokemon in eggs, {shiny_eggs} can be shiny, {regional_eggs} are regional\n"
+            parts.append(f"**Summary:** {total_eggs} Pokemon in eggs, {shiny_eggs} can be shiny, {regional_eggs} are regional\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching egg hatches: {e}")
+            logger.error("Error fetching egg hatches: %s", e)
             return f"Error fetching egg hatches: {str(e)}"
     
     @mcp.tool()
@@ -103,7 +100,7 @@ def register_egg_tools(mcp: FastMCP) -> None:
         Returns Pokemon that can hatch from eggs of the specified distance.
         """
         try:
-            eggs = await api_client.get_eggs()
+            eggs = await get_api_client().get_eggs()
             filtered_eggs = filter_eggs_by_distance(eggs, distance)
 
             # Normalize distance for display
@@ -112,22 +109,25 @@ def register_egg_tools(mcp: FastMCP) -> None:
             if not filtered_eggs:
                 return f"No Pokemon found in {normalized_distance} eggs."
 
-            result = f"# {normalized_distance} Egg Hatches ({len(filtered_eggs)} Pokemon)\n\n"
+            parts = [f"# {normalized_distance} Egg Hatches ({len(filtered_eggs)} Pokemon)\n\n"]
             
+            # Statistics for this distance are counted while listing
+            shiny_count = 0
+            regional_count = 0
             for egg in filtered_eggs:
-                result += format_egg_summary(egg) + "\n\n"
+                parts.append(format_egg_summary(egg) + "\n\n")
+                if egg.can_be_shiny:
+                    shiny_count += 1
+                if egg.is_regional:
+                    regional_count += 1
             
-            # Statistics for this distance
-            shiny_count = len([e for e in filtered_eggs if e.can_be_shiny])
-            regional_count = len([e for e in filtered_eggs if e.is_regional])
+            parts.append(f"**Summary:** {len(filtered_eggs)} Pokemon in {distance} eggs, ")
+            parts.append(f"{shiny_count} can be shiny, {regional_count} are regional\n")
             
-            result += f"**Summary:** {len(filtered_eggs)} Pokemon in {distance} eggs, "
-            result += f"{shiny_count} can be shiny, {regional_count} are regional\n"
-            
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching {distance} egg hatches: {e}")
+            logger.error("Error fetching %s egg hatches: %s", distance, e)
             return f"Error fetching {distance} egg hatches: {str(e)}"
     
     @mcp.tool()
@@ -138,42 +138,36 @@ def register_egg_tools(mcp: FastMCP) -> None:
         organized by egg distance for efficient shiny hunting planning.
         """
         try:
-            eggs = await api_client.get_eggs()
-            shiny_eggs = [e for e in eggs if e.can_be_shiny]
+            index = await get_api_client().get_egg_index()
+            eggs = index.eggs
+            shiny_eggs = index.shiny
             
             if not shiny_eggs:
                 return "No shiny-eligible Pokemon found in eggs."
             
             # Organize by egg type
-            egg_types = {}
+            egg_types = defaultdict(list)
             for egg in shiny_eggs:
-                egg_type = egg.egg_type
-                if egg_type not in egg_types:
-                    egg_types[egg_type] = []
-                egg_types[egg_type].append(egg)
+                egg_types[egg.egg_type].append(egg)
             
-            result = f"# ✨ Shiny-Eligible Egg Hatches (as of {get_current_time_str()})\n\n"
+            parts = [f"# ✨ Shiny-Eligible Egg Hatches (as of {get_current_time_str()})\n\n"]
             
-            shiny_pokemon = sorted(list(set(e.name for e in shiny_eggs)))
-            result += f"**Shiny Pokemon Available:** {', '.join(shiny_pokemon)}\n\n"
+            parts.append(f"**Shiny Pokemon Available:** {', '.join(index.shiny_names)}\n\n")
             
             # Sort by distance
-            distance_order = ["2 km", "5 km", "7 km", "10 km", "12 km", "Adventure Sync"]
-            
-            for distance in distance_order:
+            for distance in _DISTANCE_ORDER:
                 if distance in egg_types:
                     egg_list = egg_types[distance]
-                    result += f"## {distance} Eggs ({len(egg_list)} shiny-eligible)\n\n"
+                    parts.append(f"## {distance} Eggs ({len(egg_list)} shiny-eligible)\n\n")
                     
-                    for egg in egg_list:
-                        result += format_egg_summary(egg) + "\n\n"
+                    parts.extend(format_egg_summary(egg) + "\n\n" for egg in egg_list)
             
-            result += f"**Total:** {len(shiny_eggs)} shiny-eligible Pokemon out of {len(eggs)} total in eggs\n"
+            parts.append(f"**Total:** {len(shiny_eggs)} shiny-eligible Pokemon out of {len(eggs)} total in eggs\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching shiny egg hatches: {e}")
+            logger.error("Error fetching shiny egg hatches: %s", e)
             return f"Error fetching shiny egg hatches: {str(e)}"
     
     @mcp.tool()
@@ -185,32 +179,32 @@ def register_egg_tools(mcp: FastMCP) -> None:
             
         Returns information about the Pokemon if it's available from eggs.
         """
+        # Reject bad input and normalise the query before touching the data
+        if not validate_pokemon_name(pokemon_name):
+            return f"Invalid Pokemon name: '{pokemon_name}'"
+        name_lower = pokemon_name.lower()
+        
         try:
-            if not validate_pokemon_name(pokemon_name):
-                return f"Invalid Pokemon name: '{pokemon_name}'"
-            
-            eggs = await api_client.get_eggs()
-            name_lower = pokemon_name.lower()
+            index = await get_api_client().get_egg_index()
             
-            matching_eggs = [e for e in eggs if name_lower in e.name.lower()]
+            matching_eggs = [e for e, egg_name in zip(index.eggs, index.names_lower) if name_lower in egg_name]
             
             if not matching_eggs:
                 return f"'{pokemon_name}' is not currently available from eggs."
             
-            result = f"# Egg Availability: {pokemon_name.title()}\n\n"
+            parts = [f"# Egg Availability: {pokemon_name.title()}\n\n"]
             
-            for egg in matching_eggs:
-                result += format_egg_summary(egg) + "\n\n"
+            parts.extend(format_egg_summary(egg) + "\n\n" for egg in matching_eggs)
             
             # Additional info if multiple distances
             if len(matching_eggs) > 1:
                 distances = [e.egg_type for e in matching_eggs]
-                result += f"**Available from:** {', '.join(distances)}\n"
+                parts.append(f"**Available from:** {', '.join(distances)}\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error searching egg Pokemon: {e}")
+            logger.error("Error searching egg Pokemon: %s", e)
             return f"Error searching egg Pokemon: {str(e)}"
     
     @mcp.tool()
@@ -221,38 +215,35 @@ def register_egg_tools(mcp: FastMCP) -> None:
         useful for planning trades or travel.
         """
         try:
-            eggs = await api_client.get_eggs()
-            regional_eggs = [e for e in eggs if e.is_regional]
+            index = await get_api_client().get_egg_index()
+            regional_eggs = index.regional
             
             if not regional_eggs:
                 return "No regional Pokemon found in current egg pools."
             
-            result = f"# 🌍 Regional Pokemon in Eggs ({len(regional_eggs)} found)\n\n"
-            result += "These Pokemon are region-locked and may require trading to obtain:\n\n"
+            parts = [f"# 🌍 Regional Pokemon in Eggs ({len(regional_eggs)} found)\n\n"]
+            parts.append("These Pokemon are region-locked and may require trading to obtain:\n\n")
             
             # Group by egg type
-            egg_types = {}
+            egg_types = defaultdict(list)
             for egg in regional_eggs:
-                egg_type = egg.egg_type
-                if egg_type not in egg_types:
-                    egg_types[egg_type] = []
-                egg_types[egg_type].append(egg)
-            
-            for egg_type in sorted(egg_types.keys()):
-                egg_list = egg_types[egg_type]
-                result += f"## {egg_type} Eggs\n\n"
+                egg_types[egg.egg_type].append(egg)
+            
+            for egg_type in index.egg_types:
+                egg_list = egg_types.get(egg_type)
+                if not egg_list:
+                    continue
+                parts.append(f"## {egg_type} Eggs\n\n")
                 
-                for egg in egg_list:
-                    result += format_egg_summary(egg) + "\n\n"
+                parts.extend(format_egg_summary(egg) + "\n\n" for egg in egg_list)
             
             # List just the names for quick reference
-            regional_names = sorted([e.name for e in regional_eggs])
-            result += f"**Regional Pokemon:** {', '.join(regional_names)}\n"
+            parts.append(f"**Regional Pokemon:** {', '.join(index.regional_names)}\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching regional egg Pokemon: {e}")
+            logger.error("Error fetching regional egg Pokemon: %s", e)
             return f"Error fetching regional egg Pokemon: {str(e)}"
     
     @mcp.tool()
@@ -263,29 +254,31 @@ def register_egg_tools(mcp: FastMCP) -> None:
         which often contain regional Pokemon and special variants.
         """
         try:
-            eggs = await api_client.get_eggs()
-            gift_eggs = [e for e in eggs if e.is_gift_exchange]
+            gift_eggs = (await get_api_client().get_egg_index()).gift_exchange
             
             if not gift_eggs:
                 return "No gift exchange Pokemon found in current egg pools."
             
-            result = f"# 🎁 Gift Exchange Pokemon ({len(gift_eggs)} found)\n\n"
-            result += "These Pokemon can be hatched from 7km eggs received from friends:\n\n"
+            parts = [f"# 🎁 Gift Exchange Pokemon ({len(gift_eggs)} found)\n\n"]
+            parts.append("These Pokemon can be hatched from 7km eggs received from friends:\n\n")
             
+            # Statistics are counted while listing
+            shiny_count = 0
+            regional_count = 0
             for egg in gift_eggs:
-                result += format_egg_summary(egg) + "\n\n"
-            
-            # Statistics
-            shiny_count = len([e for e in gift_eggs if e.can_be_shiny])
-            regional_count = len([e for e in gift_eggs if e.is_regional])
+                parts.append(format_egg_summary(egg) + "\n\n")
+                if egg.can_be_shiny:
+                    shiny_count += 1
+                if egg.is_regional:
+                    regional_count += 1
             
-            result += f"**Summary:** {len(gift_eggs)} Pokemon from gifts, "
-            result += f"{shiny_count} can be shiny, {regional_count} are regional\n"
+            parts.append(f"**Summary:** {len(gift_eggs)} Pokemon from gifts, ")
+            parts.append(f"{shiny_count} can be shiny, {regional_count} are regional\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching gift exchange Pokemon: {e}")
+            logger.error("Error fetching gift exchange Pokemon: %s", e)
             return f"Error fetching gift exchange Pokemon: {str(e)}"
 
     @mcp.tool()
@@ -296,29 +289,31 @@ def register_egg_tools(mcp: FastMCP) -> None:
         which often contain special variants.
         """
         try:
-            eggs = await api_client.get_eggs()
-            route_gift_eggs = [e for e in eggs if e.is_route_gift]
+            route_gift_eggs = (await get_api_client().get_egg_index()).route_gift
             
             if not route_gift_eggs:
                 return "No route gift Pokemon found in current egg pools."
             
-            result = f"# 🎁 Route Gift Pokemon ({len(route_gift_eggs)} found)\n\n"
-            result += "These Pokemon can be hatched from 7km eggs received from route gifts:\n\n"
+            parts = [f"# 🎁 Route Gift Pokemon ({len(route_gift_eggs)} found)\n\n"]
+            parts.append("These Pokemon can be hatched from 7km eggs received from route gifts:\n\n")
             
+            # Statistics are counted while listing
+            shiny_count = 0
+            regional_count = 0
             for egg in route_gift_eggs:
-                result += format_egg_summary(egg) + "\n\n"
+                parts.append(format_egg_summary(egg) + "\n\n")
+                if egg.can_be_shiny:
+                    shiny_count += 1
+                if egg.is_regional:
+                    regional_count += 1
             
-            # Statistics
-            shiny_count = len([e for e in route_gift_eggs if e.can_be_shiny])
-            regional_count = len([e for e in route_gift_eggs if e.is_regional])
+            parts.append(f"**Summary:** {len(route_gift_eggs)} Pokemon from route gifts, ")
+            parts.append(f"{shiny_count} can be shiny, {regional_count} are regional\n")
             
-            result += f"**Summary:** {len(route_gift_eggs)} Pokemon from route gifts, "
-            result += f"{shiny_count} can be shiny, {regional_count} are regional\n"
-            
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching route gift Pokemon: {e}")
+            logger.error("Error fetching route gift Pokemon: %s", e)
             return f"Error fetching route gift Pokemon: {str(e)}"
     
     @mcp.tool()
@@ -329,28 +324,28 @@ def register_egg_tools(mcp: FastMCP) -> None:
         which are earned by walking specific distances each week.
         """
         try:
-            eggs = await api_client.get_eggs()
-            as_eggs = [e for e in eggs if e.is_adventure_sync]
+            as_eggs = (await get_api_client().get_egg_index()).adventure_sync
             
             if not as_eggs:
                 return "No Adventure Sync reward Pokemon found."
             
-            result = f"# 🏃 Adventure Sync Rewards ({len(as_eggs)} found)\n\n"
-            result += "These Pokemon can be obtained from Adventure Sync reward eggs:\n\n"
+            parts = [f"# 🏃 Adventure Sync Rewards ({len(as_eggs)} found)\n\n"]
+            parts.append("These Pokemon can be obtained from Adventure Sync reward eggs:\n\n")
             
+            # Statistics are counted while listing
+            shiny_count = 0
             for egg in as_eggs:
-                result += format_egg_summary(egg) + "\n\n"
-            
-            # Statistics
-            shiny_count = len([e for e in as_eggs if e.can_be_shiny])
+                parts.append(format_egg_summary(egg) + "\n\n")
+                if egg.can_be_shiny:
+                    shiny_count += 1
             
-            result += f"**Summary:** {len(as_eggs)} Adventure Sync Pokemon, {shiny_count} can be shiny\n"
-            result += "\n**Tip:** Walk 25km or 50km per week to earn Adventure Sync rewards!\n"
+            parts.append(f"**Summary:** {len(as_eggs)} Adventure Sync Pokemon, {shiny_count} can be shiny\n")
+            parts.append("\n**Tip:** Walk 25km or 50km per week to earn Adventure Sync rewards!\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching Adventure Sync rewards: {e}")
+            logger.error("Error fetching Adventure Sync rewards: %s", e)
             return f"Error fetching Adventure Sync rewards: {str(e)}"
     
     @mcp.tool()
@@ -364,71 +359,73 @@ def register_egg_tools(mcp: FastMCP) -> None:
         Returns recommended eggs to prioritize based on the criteria.
         """
         try:
-            eggs = await api_client.get_eggs()
+            index = await get_api_client().get_egg_index()
+            eggs = index.eggs
             
-            result = f"# Egg Incubation Recommendations ({priority.title()} Priority)\n\n"
+            parts = [f"# Egg Incubation Recommendations ({priority.title()} Priority)\n\n"]
+            priority_lower = priority.lower()
             
-            if priority.lower() == "shiny":
-                recommended = [e for e in eggs if e.can_be_shiny]
-                result += "Prioritize these eggs for shiny hunting:\n\n"
+            if priority_lower == "shiny":
+                recommended = index.shiny
+                parts.append("Prioritize these eggs for shiny hunting:\n\n")
                 
-            elif priority.lower() == "rare":
+            elif priority_lower == "rare":
                 # Consider regional and gift exchange as "rare"
                 recommended = [e for e in eggs if e.is_regional or e.is_gift_exchange]
-                result += "These eggs contain rare or region-exclusive Pokemon:\n\n"
+                parts.append("These eggs contain rare or region-exclusive Pokemon:\n\n")
                 
-            elif priority.lower() == "quick":
+            elif priority_lower == "quick":
                 recommended = filter_eggs_by_distance(eggs, "2 km")
-                result += "Quick hatches - 2km eggs for fast turnover:\n\n"
+                parts.append("Quick hatches - 2km eggs for fast turnover:\n\n")
                 
             else:  # distance-based or default
                 # Focus on 10km eggs as they typically have the best Pokemon
                 recommended = filter_eggs_by_distance(eggs, "10 km")
                 if not recommended:
                     recommended = filter_eggs_by_distance(eggs, "5 km")
-                result += "Best overall value eggs:\n\n"
+                parts.append("Best overall value eggs:\n\n")
             
             if not recommended:
                 return f"No eggs found matching {priority} priority criteria."
             
             # Organize by distance for better recommendations
-            distances = {}
+            distances = defaultdict(list)
             for egg in recommended:
-                dist = egg.egg_type
-                if dist not in distances:
-                    distances[dist] = []
-                distances[dist].append(egg)
-            
-            for distance in sorted(distances.keys()):
-                egg_list = distances[distance]
-                result += f"## {distance} Priority\n\n"
+                distances[egg.egg_type].append(egg)
+            
+            for distance in index.egg_types:
+                egg_list = distances.get(distance)
+                if not egg_list:
+                    continue
+                parts.append(f"## {distance} Priority\n\n")
                 
-                # Show top recommendations for each distance
-                shiny_eggs = [e for e in egg_list if e.can_be_shiny]
-                other_eggs = [e for e in egg_list if not e.can_be_shiny]
+                # Show top recommendations for each distance, stopping as soon
+                # as enough eggs have been found rather than filtering the whole list
+                shiny_eggs = list(islice((e for e in egg_list if e.can_be_shiny), 5))  # Top 5
+                other_eggs = [] if priority_lower == "shiny" else list(islice((e for e in egg_list if not e.can_be_shiny), 3))  # Top 3
                 
                 if shiny_eggs:
-                    result += "**🌟 High Priority (Shiny Potential):**\n"
-                    for egg in shiny_eggs[:5]:  # Top 5
-                        result += f"• {egg.name}\n"
-                    result += "\n"
+                    parts.append("**🌟 High Priority (Shiny Potential):**\n")
+                    for egg in shiny_eggs:
+                        parts.append(f"• {egg.name}\n")
+                    parts.append("\n")
                 
-                if other_eggs and priority.lower() != "shiny":
-                    result += "**⭐ Standard Priority:**\n"
-                    for egg in other_eggs[:3]:  # Top 3
-                        result += f"• {egg.name}\n"
-                    result += "\n"
+                if other_eggs:
+                    parts.append("**⭐ Standard Priority:**\n")
+                    for egg in other_eggs:
+                        parts.append(f"• {egg.name}\n")
+                    parts.append("\n")
             
             # General advice based on priority
-            if priority.lower() == "shiny":
-                result += "💡 **Tip:** Use premium incubators on 10km eggs with shiny potential!\n"
-            elif priority.lower() == "quick":
-                result += "💡 **Tip:** Use infinite incubator on 2km eggs to maximize hatches!\n"
-            elif priority.lower() == "rare":
-                result += "💡 **Tip:** Save super incubators for rare regional Pokemon!\n"
+            if priority_lower == "shiny":
+                parts.append("💡 **Tip:** Use premium incubators on 10km eggs with shiny potential!\n")
+            elif priority_lower == "quick":
+                parts.append("💡 **Tip:** Use infinite incubator on 2km eggs to maximize hatches!\n")
+            elif priority_lower == "rare":
+                parts.append("💡 **Tip:** Save super incubators for rare regional Pokemon!\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error getting egg recommendations: {e}")
+            logger.error("Error getting egg recommendations: %s", e)
             return f"Error getting egg recommendations: {str(e)}"
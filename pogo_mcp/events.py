@@ -1,22 +1,54 @@
 """Event-related tools for the Pokemon Go MCP server."""
 
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 from datetime import datetime, timezone
 
-from mcp.server.fastmcp import FastMCP
-
-from .api_client import api_client
+from .api_client import get_api_client
 from .types import EventInfo
 from .utils import (
-    is_event_active, is_event_upcoming, format_event_summary,
-    get_current_time_str, extract_community_day_info, extract_raid_day_info, format_json_output
+    is_event_active, classify_event, format_event_summary,
+    get_current_time_str, extract_community_day_info, extract_raid_day_info
 )
 
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
 logger = logging.getLogger(__name__)
 
 
-def register_event_tools(mcp: FastMCP) -> None:
+def _render_current_events(events: List[EventInfo], current_time: datetime) -> str:
+    """Render the active and upcoming events listing for get_current_events."""
+    # One pass, parsing each event's dates once
+    active_events = []
+    upcoming_events = []
+    for event in events:
+        status = classify_event(event, current_time)
+        if status == "active":
+            active_events.append(event)
+        elif status == "upcoming":
+            upcoming_events.append(event)
+    
+    parts = [f"# Pokemon Go Events (as of {get_current_time_str(current_time)})\n\n"]
+    
+    if active_events:
+        parts.append("## 🟢 Currently Active Events\n\n")
+        parts.extend(format_event_summary(event) + "\n\n" for event in active_events)
+    
+    if upcoming_events:
+        parts.append("## 🔵 Upcoming Events\n\n")
+        parts.extend(format_event_summary(event) + "\n\n" for event in upcoming_events)
+    
+    if not active_events and not upcoming_events:
+        parts.append("No active or upcoming events found.\n")
+    
+    parts.append(f"\nTotal events found: {len(events)} (Active: {len(active_events)}, Upcoming: {len(upcoming_events)})")
+    
+    return "".join(parts)
+
+
+def register_event_tools(mcp: "FastMCP") -> None:
     """Register all event-related tools with the MCP server."""
     
     @mcp.tool()
@@ -30,47 +62,24 @@ def register_event_tools(mcp: FastMCP) -> None:
             logger.info("Fetching current events...")
             
             # Debug: Check api_client type
-            logger.debug(f"api_client type: {type(api_client)}")
+            logger.debug("api_client type: %s", type(get_api_client()))
             
             # Get events with explicit error handling
             logger.info("Calling api_client.get_events()...")
-            events = await api_client.get_events()
-            logger.info(f"Received events: {type(events)} with {len(events) if isinstance(events, list) else 'NOT A LIST'} items")
+            events = await get_api_client().get_events()
+            logger.info("Received events: %s with %s items", type(events), len(events) if isinstance(events, list) else 'NOT A LIST')
             
             # Verify data structure
             if not isinstance(events, list):
                 raise TypeError(f"Expected list from get_events(), got {type(events)}")
-                
-            current_time = datetime.now(timezone.utc)
-            
-            active_events = [e for e in events if is_event_active(e, current_time)]
-            upcoming_events = [e for e in events if is_event_upcoming(e, current_time)]
-            
-            result = f"# Pokemon Go Events (as of {get_current_time_str()})\n\n"
-            
-            if active_events:
-                result += "## 🟢 Currently Active Events\n\n"
-                for event in active_events:
-                    result += format_event_summary(event) + "\n\n"
             
-            if upcoming_events:
-                result += "## 🔵 Upcoming Events\n\n"
-                for event in upcoming_events:
-                    result += format_event_summary(event) + "\n\n"
-            
-            if not active_events and not upcoming_events:
-                result += "No active or upcoming events found.\n"
-            
-            result += f"\nTotal events found: {len(events)} (Active: {len(active_events)}, Upcoming: {len(upcoming_events)})"
-            
-            return result
+            # Date parsing and formatting for every event is CPU-bound, so keep
+            # it off the event loop
+            return await asyncio.to_thread(_render_current_events, events, datetime.now(timezone.utc))
             
         except Exception as e:
             error_msg = f"Error fetching events: {str(e)}"
-            logger.error(error_msg)
-            logger.error(f"Exception type: {type(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(error_msg)
             return error_msg
     
     @mcp.tool()
@@ -83,72 +92,72 @@ def register_event_tools(mcp: FastMCP) -> None:
         Returns detailed information including spawns, bonuses, and special research if available.
         """
         try:
-            events = await api_client.get_events()
-            event = next((e for e in events if e.event_id == event_id), None)
+            event = (await get_api_client().get_events_by_id()).get(event_id)
             
             if not event:
                 return f"Event with ID '{event_id}' not found."
             
-            result = format_event_summary(event) + "\n\n"
+            parts = [format_event_summary(event) + "\n\n"]
             
             # Add extra details if available
             if event.extra_data:
-                result += "## Additional Details\n\n"
+                parts.append("## Additional Details\n\n")
 
                 # Community Day specific info
                 cd_info = extract_community_day_info(event)
                 if cd_info:
                     if cd_info["featured_pokemon"]:
-                        result += f"**Featured Pokemon:** {', '.join(cd_info['featured_pokemon'])}\n\n"
+                        parts.append(f"**Featured Pokemon:** {', '.join(cd_info['featured_pokemon'])}\n\n")
 
                     if cd_info["bonuses"]:
-                        result += "**Event Bonuses:**\n"
+                        parts.append("**Event Bonuses:**\n")
                         for bonus in cd_info["bonuses"]:
-                            result += f"• {bonus}\n"
-                        result += "\n"
+                            parts.append(f"• {bonus}\n")
+                        parts.append("\n")
 
                     if cd_info["shiny_available"]:
-                        result += f"**Shiny Available:** {', '.join(cd_info['shiny_available'])}\n\n"
+                        parts.append(f"**Shiny Available:** {', '.join(cd_info['shiny_available'])}\n\n")
 
                 # Raid Day specific info
                 rd_info = extract_raid_day_info(event)
                 if rd_info:
                     if rd_info["raid_bosses"]:
-                        result += f"**Raid Bosses:** {', '.join(rd_info['raid_bosses'])}\n\n"
+                        parts.append(f"**Raid Bosses:** {', '.join(rd_info['raid_bosses'])}\n\n")
 
                     if rd_info["bonuses"]:
-                        result += "**Free Bonuses:**\n"
+                        parts.append("**Free Bonuses:**\n")
                         for bonus in rd_info["bonuses"]:
-                            result += f"• {bonus}\n"
-                        result += "\n"
+                            parts.append(f"• {bonus}\n")
+                        parts.append("\n")
 
                     if rd_info["ticket_bonuses"]:
-                        result += "**Ticket Bonuses:**\n"
+                        parts.append("**Ticket Bonuses:**\n")
                         for bonus in rd_info["ticket_bonuses"]:
-                            result += f"• {bonus}\n"
-                        result += "\n"
+                            parts.append(f"• {bonus}\n")
+                        parts.append("\n")
 
                     if rd_info["research"]:
-                        result += "**Timed Research:**\n"
+                        parts.append("**Timed Research:**\n")
                         for research_step in rd_info["research"]:
-                            result += f"• {research_step.get('name', 'Unknown')}\n"
+                            parts.append(f"• {research_step.get('name', 'Unknown')}\n")
                             tasks = research_step.get('tasks', [])
                             if tasks:
                                 for task in tasks:
-                                    result += f"  - {task.get('text', 'Unknown task')}\n"
-                        result += "\n"
+                                    parts.append(f"  - {task.get('text', 'Unknown task')}\n")
+                        parts.append("\n")
 
                     if rd_info["shiny_available"]:
-                        result += f"**Shiny Available:** {', '.join(rd_info['shiny_available'])}\n\n"
+                        parts.append(f"**Shiny Available:** {', '.join(rd_info['shiny_available'])}\n\n")
 
                 # Raw extra data
-                result += "**Raw Event Data:**\n"
-                result += f"```json\n{format_json_output(event.extra_data)}\n```\n"
+                parts.append("**Raw Event Data:**\n")
+                raw_json = await get_api_client().get_event_extra_data_json(event)
+                parts.append(f"```json\n{raw_json}\n```\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching event details: {e}")
+            logger.error("Error fetching event details: %s", e)
             return f"Error fetching event details: {str(e)}"
     
     @mcp.tool()
@@ -159,42 +168,41 @@ def register_event_tools(mcp: FastMCP) -> None:
         bonuses, exclusive moves, and special research tasks.
         """
         try:
-            events = await api_client.get_events()
+            events = await get_api_client().get_events(event_type="community")
             current_time = datetime.now(timezone.utc)
             
             cd_events = [
-                e for e in events 
-                if "community" in e.event_type.lower() and 
-                (is_event_active(e, current_time) or is_event_upcoming(e, current_time))
+                e for e in events
+                if classify_event(e, current_time) in ("active", "upcoming")
             ]
             
             if not cd_events:
                 return "No active or upcoming Community Day events found."
             
-            result = f"# Community Day Events (as of {get_current_time_str()})\n\n"
+            parts = [f"# Community Day Events (as of {get_current_time_str(current_time)})\n\n"]
             
             for event in cd_events:
-                result += format_event_summary(event) + "\n\n"
+                parts.append(format_event_summary(event) + "\n\n")
                 
                 cd_info = extract_community_day_info(event)
                 if cd_info:
                     if cd_info["featured_pokemon"]:
-                        result += f"**Featured:** {', '.join(cd_info['featured_pokemon'])}\n"
+                        parts.append(f"**Featured:** {', '.join(cd_info['featured_pokemon'])}\n")
                     
                     if cd_info["bonuses"]:
-                        result += "**Bonuses:**\n"
+                        parts.append("**Bonuses:**\n")
                         for bonus in cd_info["bonuses"]:
-                            result += f"• {bonus}\n"
+                            parts.append(f"• {bonus}\n")
                     
                     if cd_info["shiny_available"]:
-                        result += f"**Shiny Pokemon:** {', '.join(cd_info['shiny_available'])}\n"
+                        parts.append(f"**Shiny Pokemon:** {', '.join(cd_info['shiny_available'])}\n")
                 
-                result += "\n---\n\n"
+                parts.append("\n---\n\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching Community Day info: {e}")
+            logger.error("Error fetching Community Day info: %s", e)
             return f"Error fetching Community Day info: {str(e)}"
     
     @mcp.tool()
@@ -207,15 +215,12 @@ def register_event_tools(mcp: FastMCP) -> None:
         Returns information about Pokemon that are currently spawning more frequently due to events.
         """
         try:
-            events = await api_client.get_events()
+            events = await get_api_client().get_events(event_type=event_type)
             current_time = datetime.now(timezone.utc)
             
             active_events = [e for e in events if is_event_active(e, current_time)]
             
-            if event_type:
-                active_events = [e for e in active_events if event_type.lower() in e.event_type.lower()]
-            
-            result = f"# Event Spawns (as of {get_current_time_str()})\n\n"
+            parts = [f"# Event Spawns (as of {get_current_time_str(current_time)})\n\n"]
             
             spawns_found = False
             for event in active_events:
@@ -229,19 +234,19 @@ def register_event_tools(mcp: FastMCP) -> None:
                 
                 if event_spawns:
                     spawns_found = True
-                    result += f"## {event.name}\n"
-                    result += f"**Increased Spawns:** {', '.join(event_spawns)}\n\n"
+                    parts.append(f"## {event.name}\n")
+                    parts.append(f"**Increased Spawns:** {', '.join(event_spawns)}\n\n")
             
             if not spawns_found:
                 if event_type:
-                    result += f"No spawn information found for active {event_type} events.\n"
+                    parts.append(f"No spawn information found for active {event_type} events.\n")
                 else:
-                    result += "No spawn information found for active events.\n"
+                    parts.append("No spawn information found for active events.\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching event spawns: {e}")
+            logger.error("Error fetching event spawns: %s", e)
             return f"Error fetching event spawns: {str(e)}"
     
     @mcp.tool()
@@ -252,12 +257,12 @@ def register_event_tools(mcp: FastMCP) -> None:
         that are currently active from events.
         """
         try:
-            events = await api_client.get_events()
+            events = await get_api_client().get_events()
             current_time = datetime.now(timezone.utc)
             
             active_events = [e for e in events if is_event_active(e, current_time)]
             
-            result = f"# Active Event Bonuses (as of {get_current_time_str()})\n\n"
+            parts = [f"# Active Event Bonuses (as of {get_current_time_str(current_time)})\n\n"]
             
             bonuses_found = False
             for event in active_events:
@@ -282,18 +287,18 @@ def register_event_tools(mcp: FastMCP) -> None:
 
                 if event_bonuses:
                     bonuses_found = True
-                    result += f"## {event.name}\n"
+                    parts.append(f"## {event.name}\n")
                     for bonus in event_bonuses:
-                        result += f"• {bonus}\n"
-                    result += "\n"
+                        parts.append(f"• {bonus}\n")
+                    parts.append("\n")
             
             if not bonuses_found:
-                result += "No bonus information found for active events.\n"
+                parts.append("No bonus information found for active events.\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching event bonuses: {e}")
+            logger.error("Error fetching event bonuses: %s", e)
             return f"Error fetching event bonuses: {str(e)}"
     
     @mcp.tool()
@@ -306,26 +311,21 @@ def register_event_tools(mcp: FastMCP) -> None:
         Returns events that match the search criteria.
         """
         try:
-            events = await api_client.get_events()
+            search_index = await get_api_client().get_event_search_index()
             query_lower = query.lower()
             
-            matching_events = [
-                e for e in events 
-                if (query_lower in e.name.lower() or 
-                    query_lower in e.event_type.lower() or
-                    query_lower in e.heading.lower())
-            ]
+            # Name, type and heading are lowercased once per data load, not per query
+            matching_events = [e for e, text in search_index if query_lower in text]
             
             if not matching_events:
                 return f"No events found matching '{query}'."
             
-            result = f"# Events matching '{query}' ({len(matching_events)} found)\n\n"
+            parts = [f"# Events matching '{query}' ({len(matching_events)} found)\n\n"]
             
-            for event in matching_events:
-                result += format_event_summary(event) + "\n\n"
+            parts.extend(format_event_summary(event) + "\n\n" for event in matching_events)
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error searching events: {e}")
+            logger.error("Error searching events: %s", e)
             return f"Error searching events: {str(e)}"
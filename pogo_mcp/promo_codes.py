@@ -1,16 +1,47 @@
 """Promo codes tools for Pokemon Go MCP server."""
 
 import logging
-from typing import List
-from datetime import datetime
+from typing import List, Optional
 
-from .api_client import api_client
+from .api_client import get_api_client
 from .types import PromoCodeInfo
 from .utils import get_current_time_str, format_json_output
 
 logger = logging.getLogger(__name__)
 
 
+def _render_promo_codes(promo_codes: List[PromoCodeInfo]) -> Optional[str]:
+    """Render the active promo codes, below the timestamped header."""
+    if not promo_codes:
+        return None
+    
+    parts = [f"**Total Active Codes:** {len(promo_codes)}\n\n"]
+    
+    for code in promo_codes:
+        parts.append(f"## **{code.code}**\n")
+        parts.append(f"**{code.title}**\n\n")
+        parts.append(f"{code.description}\n\n")
+        
+        # Rewards
+        if code.rewards:
+            parts.append("**Rewards:**\n")
+            parts.extend(f"• {reward.name}\n" for reward in code.rewards)
+            parts.append("\n")
+        
+        # Expiration
+        if code.expiration_dt:
+            parts.append(f"**Expires:** {code.expiration_dt.strftime('%B %d, %Y at %I:%M %p %Z')}\n")
+        elif code.expiration:
+            # Not a parseable timestamp; show it as scraped
+            parts.append(f"**Expires:** {code.expiration}\n")
+        
+        # Redemption link
+        parts.append(f"\n[Redeem Code]({code.redemption_url})\n\n")
+        parts.append("---\n\n")
+    
+    return "".join(parts)
+
+
 def register_promo_code_tools(mcp):
     """Register promo code related tools with the MCP server."""
     
@@ -23,41 +54,14 @@ def register_promo_code_tools(mcp):
         """
         try:
             logger.info("Fetching active promo codes...")
-            promo_codes = await api_client.get_promo_codes()
+            # The listing only changes with the data; the header carries the current time
+            body = await get_api_client().get_rendered("promo-codes", _render_promo_codes)
             
-            if not promo_codes:
+            if body is None:
                 return "No active promo codes found."
             
-            result = f"# 🎁 Active Pokemon GO Promo Codes ({get_current_time_str()})\n\n"
-            result += f"**Total Active Codes:** {len(promo_codes)}\n\n"
-            
-            for code in promo_codes:
-                result += f"## **{code.code}**\n"
-                result += f"**{code.title}**\n\n"
-                result += f"{code.description}\n\n"
-                
-                # Rewards
-                if code.rewards:
-                    result += "**Rewards:**\n"
-                    for reward in code.rewards:
-                        result += f"• {reward.name}\n"
-                    result += "\n"
-                
-                # Expiration
-                if code.expiration:
-                    try:
-                        # Parse expiration date
-                        exp_date = datetime.fromisoformat(code.expiration.replace('Z', '+00:00'))
-                        result += f"**Expires:** {exp_date.strftime('%B %d, %Y at %I:%M %p %Z')}\n"
-                    except Exception:
-                        result += f"**Expires:** {code.expiration}\n"
-                
-                # Redemption link
-                result += f"\n[Redeem Code]({code.redemption_url})\n\n"
-                result += "---\n\n"
-            
-            return result
+            return f"# 🎁 Active Pokemon GO Promo Codes ({get_current_time_str()})\n\n" + body
             
         except Exception as e:
-            logger.error(f"Error fetching promo codes: {e}")
+            logger.error("Error fetching promo codes: %s", e)
             return f"Error fetching promo codes: {str(e)}"
\ No newline at end of file
@@ -1,72 +1,114 @@
 """Raid-related tools for the Pokemon Go MCP server."""
 
 import logging
-from typing import List, Optional
+from collections import defaultdict
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from mcp.server.fastmcp import FastMCP
-
-from .api_client import api_client
+from .api_client import get_api_client
 from .types import RaidInfo
 from .utils import (
-    filter_raids_by_tier, filter_raids_by_type, filter_shiny_pokemon,
+    append_limited, count_shiny_pokemon, filter_shiny_pokemon,
     format_raid_summary, get_current_time_str, normalize_tier_name,
     search_pokemon_by_name, validate_pokemon_name
 )
 
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
 logger = logging.getLogger(__name__)
 
+# Display rank for raid tiers; any other tiers follow in data order
+_TIER_RANK = {tier: rank for rank, tier in enumerate(("Tier 1", "Tier 3", "Tier 5", "Mega", "Shadow"))}
+
 
-def register_raid_tools(mcp: FastMCP) -> None:
+def _render_current_raids(raids: List[RaidInfo]) -> Optional[Tuple[List[Tuple[str, List[str]]], str]]:
+    """Render every raid boss as (tier heading, raid entries) sections plus a summary line.
+    
+    The sections are kept apart so callers can cap how many entries each tier shows.
+    """
+    if not raids:
+        return None
+    
+    # Organize raids by tier
+    tiers = defaultdict(list)
+    for raid in raids:
+        tier = raid.tier
+        tiers[tier].append(raid)
+    
+    # Sort tiers for better display; the sort is stable, so unranked tiers keep data order
+    sorted_tiers = sorted(tiers.items(), key=lambda item: _TIER_RANK.get(item[0], len(_TIER_RANK)))
+    
+    sections = [
+        (f"## {tier} Raids ({len(raid_list)} bosses)\n\n", [format_raid_summary(raid) + "\n\n" for raid in raid_list])
+        for tier, raid_list in sorted_tiers
+    ]
+    
+    total_shiny = count_shiny_pokemon(raids)
+    summary = f"**Summary:** {len(raids)} total raid bosses, {total_shiny} can be shiny\n"
+    
+    return sections, summary
+
+
+def _render_shiny_raids(raids: List[RaidInfo]) -> Optional[str]:
+    """Render the shiny-eligible raid bosses grouped by tier, below the timestamped header."""
+    shiny_raids = filter_shiny_pokemon(raids)
+    
+    if not shiny_raids:
+        return None
+    
+    # Organize by tier
+    tiers = defaultdict(list)
+    for raid in shiny_raids:
+        tier = raid.tier
+        tiers[tier].append(raid)
+    
+    parts = []
+    
+    for tier in sorted(tiers.keys()):
+        raid_list = tiers[tier]
+        parts.append(f"## {tier} ({len(raid_list)} shiny-eligible)\n\n")
+        parts.extend(format_raid_summary(raid) + "\n\n" for raid in raid_list)
+    
+    parts.append(f"**Total:** {len(shiny_raids)} shiny-eligible raid bosses out of {len(raids)} total\n")
+    
+    return "".join(parts)
+
+
+def register_raid_tools(mcp: "FastMCP") -> None:
     """Register all raid-related tools with the MCP server."""
     
     @mcp.tool()
-    async def get_current_raids() -> str:
+    async def get_current_raids(limit: int = 50) -> str:
         """Get all current raid bosses in Pokemon Go.
         
+        Args:
+            limit: Maximum number of raid bosses to show per tier (default 50)
+        
         Returns a comprehensive list of all raid bosses currently available,
         organized by tier with CP ranges, types, weather boosts, and shiny availability.
         """
         try:
-            raids = await api_client.get_raids()
+            # The entries only change with the data; the header carries the current time
+            rendered = await get_api_client().get_rendered("raids", _render_current_raids)
             
-            if not raids:
+            if rendered is None:
                 return "No raid data available."
             
-            # Organize raids by tier
-            tiers = {}
-            for raid in raids:
-                tier = raid.tier
-                if tier not in tiers:
-                    tiers[tier] = []
-                tiers[tier].append(raid)
-            
-            result = f"# Current Raid Bosses (as of {get_current_time_str()})\n\n"
-            
-            # Sort tiers for better display
-            tier_order = ["Tier 1", "Tier 3", "Tier 5", "Mega", "Shadow"]
-            sorted_tiers = []
+            sections, summary = rendered
+            limit = max(limit, 1)
             
-            for tier in tier_order:
-                if tier in tiers:
-                    sorted_tiers.append((tier, tiers[tier]))
-                    del tiers[tier]
+            parts = [f"# Current Raid Bosses (as of {get_current_time_str()})\n\n"]
             
-            # Add any remaining tiers
-            for tier, raid_list in tiers.items():
-                sorted_tiers.append((tier, raid_list))
+            for heading, entries in sections:
+                parts.append(heading)
+                append_limited(parts, entries, limit)
             
-            for tier, raid_list in sorted_tiers:
-                result += f"## {tier} Raids ({len(raid_list)} bosses)\n\n"
-                for raid in raid_list:
-                    result += format_raid_summary(raid) + "\n\n"
-            
-            total_shiny = len([r for r in raids if r.can_be_shiny])
-            result += f"**Summary:** {len(raids)} total raid bosses, {total_shiny} can be shiny\n"
+            parts.append(summary)
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching raids: {e}")
+            logger.error("Error fetching raids: %s", e)
             return f"Error fetching raids: {str(e)}"
     
     @mcp.tool()
@@ -79,26 +121,29 @@ def register_raid_tools(mcp: FastMCP) -> None:
         Returns raid bosses of the specified tier with full details.
         """
         try:
-            raids = await api_client.get_raids()
+            index = await get_api_client().get_raid_index()
             normalized_tier = normalize_tier_name(tier)
             
-            filtered_raids = filter_raids_by_tier(raids, normalized_tier)
+            filtered_raids = index.matching(index.by_tier, normalized_tier)
             
             if not filtered_raids:
                 return f"No raid bosses found for tier '{tier}'."
             
-            result = f"# {tier.title()} Raid Bosses ({len(filtered_raids)} found)\n\n"
+            parts = [f"# {tier.title()} Raid Bosses ({len(filtered_raids)} found)\n\n"]
             
+            # Shiny bosses are counted while listing
+            shiny_count = 0
             for raid in filtered_raids:
-                result += format_raid_summary(raid) + "\n\n"
+                parts.append(format_raid_summary(raid) + "\n\n")
+                if raid.can_be_shiny:
+                    shiny_count += 1
             
-            shiny_count = len([r for r in filtered_raids if r.can_be_shiny])
-            result += f"**Summary:** {len(filtered_raids)} {tier} raids, {shiny_count} can be shiny\n"
+            parts.append(f"**Summary:** {len(filtered_raids)} {tier} raids, {shiny_count} can be shiny\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching {tier} raids: {e}")
+            logger.error("Error fetching %s raids: %s", tier, e)
             return f"Error fetching {tier} raids: {str(e)}"
     
     @mcp.tool()
@@ -109,34 +154,15 @@ def register_raid_tools(mcp: FastMCP) -> None:
         perfect for shiny hunters planning their raid activities.
         """
         try:
-            raids = await api_client.get_raids()
-            shiny_raids = [r for r in raids if r.can_be_shiny]
+            body = await get_api_client().get_rendered("raids", _render_shiny_raids)
             
-            if not shiny_raids:
+            if body is None:
                 return "No shiny-eligible raid bosses found."
             
-            # Organize by tier
-            tiers = {}
-            for raid in shiny_raids:
-                tier = raid.tier
-                if tier not in tiers:
-                    tiers[tier] = []
-                tiers[tier].append(raid)
-            
-            result = f"# ✨ Shiny-Eligible Raid Bosses (as of {get_current_time_str()})\n\n"
-            
-            for tier in sorted(tiers.keys()):
-                raid_list = tiers[tier]
-                result += f"## {tier} ({len(raid_list)} shiny-eligible)\n\n"
-                for raid in raid_list:
-                    result += format_raid_summary(raid) + "\n\n"
-            
-            result += f"**Total:** {len(shiny_raids)} shiny-eligible raid bosses out of {len(raids)} total\n"
-            
-            return result
+            return f"# ✨ Shiny-Eligible Raid Bosses (as of {get_current_time_str()})\n\n" + body
             
         except Exception as e:
-            logger.error(f"Error fetching shiny raids: {e}")
+            logger.error("Error fetching shiny raids: %s", e)
             return f"Error fetching shiny raids: {str(e)}"
     
     @mcp.tool()
@@ -152,23 +178,26 @@ def register_raid_tools(mcp: FastMCP) -> None:
             if not validate_pokemon_name(pokemon_name):
                 return f"Invalid Pokemon name: '{pokemon_name}'"
             
-            raids = await api_client.get_raids()
+            index = await get_api_client().get_raid_index()
             name_lower = pokemon_name.lower()
             
-            matching_raids = [r for r in raids if name_lower in r.name.lower()]
+            # Valid names contain no NUL, so a hit in the joined names is a hit in one name
+            if name_lower in index.names_blob:
+                matching_raids = [r for r, raid_name in zip(index.raids, index.names_lower) if name_lower in raid_name]
+            else:
+                matching_raids = []
             
             if not matching_raids:
                 return f"'{pokemon_name}' is not currently available as a raid boss."
             
-            result = f"# Raid Boss: {pokemon_name}\n\n"
+            parts = [f"# Raid Boss: {pokemon_name}\n\n"]
             
-            for raid in matching_raids:
-                result += format_raid_summary(raid) + "\n\n"
+            parts.extend(format_raid_summary(raid) + "\n\n" for raid in matching_raids)
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error searching for raid boss: {e}")
+            logger.error("Error searching for raid boss: %s", e)
             return f"Error searching for raid boss: {str(e)}"
     
     @mcp.tool()
@@ -181,24 +210,27 @@ def register_raid_tools(mcp: FastMCP) -> None:
         Returns raid bosses that have the specified type.
         """
         try:
-            raids = await api_client.get_raids()
-            filtered_raids = filter_raids_by_type(raids, pokemon_type)
+            index = await get_api_client().get_raid_index()
+            filtered_raids = index.matching(index.by_type, pokemon_type)
             
             if not filtered_raids:
                 return f"No {pokemon_type}-type raid bosses found."
             
-            result = f"# {pokemon_type.title()}-Type Raid Bosses ({len(filtered_raids)} found)\n\n"
+            parts = [f"# {pokemon_type.title()}-Type Raid Bosses ({len(filtered_raids)} found)\n\n"]
             
+            # Shiny bosses are counted while listing
+            shiny_count = 0
             for raid in filtered_raids:
-                result += format_raid_summary(raid) + "\n\n"
+                parts.append(format_raid_summary(raid) + "\n\n")
+                if raid.can_be_shiny:
+                    shiny_count += 1
             
-            shiny_count = len([r for r in filtered_raids if r.can_be_shiny])
-            result += f"**Summary:** {len(filtered_raids)} {pokemon_type}-type raids, {shiny_count} can be shiny\n"
+            parts.append(f"**Summary:** {len(filtered_raids)} {pokemon_type}-type raids, {shiny_count} can be shiny\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching {pokemon_type} raids: {e}")
+            logger.error("Error fetching %s raids: %s", pokemon_type, e)
             return f"Error fetching {pokemon_type} raids: {str(e)}"
     
     @mcp.tool()
@@ -211,29 +243,27 @@ def register_raid_tools(mcp: FastMCP) -> None:
         Returns raid bosses that receive a weather boost in the specified weather.
         """
         try:
-            raids = await api_client.get_raids()
-            weather_lower = weather.lower()
-            
-            boosted_raids = [
-                r for r in raids 
-                if any(weather_lower in w.name.lower() for w in r.boosted_weather)
-            ]
+            index = await get_api_client().get_raid_index()
+            boosted_raids = index.matching(index.by_weather, weather)
             
             if not boosted_raids:
                 return f"No raid bosses are boosted by {weather} weather."
             
-            result = f"# {weather.title()}-Boosted Raid Bosses ({len(boosted_raids)} found)\n\n"
+            parts = [f"# {weather.title()}-Boosted Raid Bosses ({len(boosted_raids)} found)\n\n"]
             
+            # Shiny bosses are counted while listing
+            shiny_count = 0
             for raid in boosted_raids:
-                result += format_raid_summary(raid) + "\n\n"
+                parts.append(format_raid_summary(raid) + "\n\n")
+                if raid.can_be_shiny:
+                    shiny_count += 1
             
-            shiny_count = len([r for r in boosted_raids if r.can_be_shiny])
-            result += f"**Summary:** {len(boosted_raids)} raids boosted by {weather}, {shiny_count} can be shiny\n"
+            parts.append(f"**Summary:** {len(boosted_raids)} raids boosted by {weather}, {shiny_count} can be shiny\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching weather boosted raids: {e}")
+            logger.error("Error fetching weather boosted raids: %s", e)
             return f"Error fetching weather boosted raids: {str(e)}"
     
     @mcp.tool()
@@ -247,14 +277,16 @@ def register_raid_tools(mcp: FastMCP) -> None:
         Returns recommended raids to focus on based on the criteria.
         """
         try:
-            raids = await api_client.get_raids()
+            index = await get_api_client().get_raid_index()
+            raids = index.raids
             
             # Apply filters
             if tier:
-                raids = filter_raids_by_tier(raids, normalize_tier_name(tier))
+                raids = index.matching(index.by_tier, normalize_tier_name(tier))
             
             if shiny_only:
-                raids = [r for r in raids if r.can_be_shiny]
+                # The index already holds the shiny subset of the full list
+                raids = filter_shiny_pokemon(raids) if tier else index.shiny
             
             if not raids:
                 filter_desc = []
@@ -264,41 +296,42 @@ def register_raid_tools(mcp: FastMCP) -> None:
                     filter_desc.append("shiny-eligible")
                 return f"No raids found matching criteria: {', '.join(filter_desc)}"
             
-            result = f"# Raid Recommendations (as of {get_current_time_str()})\n\n"
+            parts = [f"# Raid Recommendations (as of {get_current_time_str()})\n\n"]
             
             if shiny_only:
-                result += "## ✨ Priority: Shiny Hunting\n\n"
+                parts.append("## ✨ Priority: Shiny Hunting\n\n")
             
             if tier:
-                result += f"## Tier {tier} Focus\n\n"
+                parts.append(f"## Tier {tier} Focus\n\n")
             
             # Organize by tier for recommendations
-            tiers = {}
+            tiers = defaultdict(list)
             for raid in raids:
                 tier_name = raid.tier
-                if tier_name not in tiers:
-                    tiers[tier_name] = []
                 tiers[tier_name].append(raid)
             
-            for tier_name in sorted(tiers.keys()):
-                raid_list = tiers[tier_name]
-                result += f"### {tier_name}\n\n"
+            # The index keeps every tier name pre-sorted; skip the ones filtered out
+            for tier_name in index.tiers:
+                raid_list = tiers.get(tier_name)
+                if not raid_list:
+                    continue
+                parts.append(f"### {tier_name}\n\n")
                 
                 for raid in raid_list:
                     priority = "🌟 High Priority" if raid.can_be_shiny else "⭐ Standard Priority"
-                    result += f"**{raid.name}** - {priority}\n"
+                    parts.append(f"**{raid.name}** - {priority}\n")
                     
                     # Quick summary
                     types_str = ", ".join([t.name.title() for t in raid.types])
-                    result += f"Types: {types_str}"
+                    parts.append(f"Types: {types_str}")
                     
                     if raid.can_be_shiny:
-                        result += " | ✨ Shiny Available"
+                        parts.append(" | ✨ Shiny Available")
                     
-                    result += "\n\n"
+                    parts.append("\n\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error getting raid recommendations: {e}")
+            logger.error("Error getting raid recommendations: %s", e)
             return f"Error getting raid recommendations: {str(e)}"
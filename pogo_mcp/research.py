@@ -1,81 +1,147 @@
 """Research-related tools for the Pokemon Go MCP server."""
 
 import logging
-from typing import List, Optional
+import re
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
-from mcp.server.fastmcp import FastMCP
-
-from .api_client import api_client
+from .api_client import get_api_client
 from .types import ResearchTaskInfo
 from .utils import (
-    filter_research_by_reward, format_research_summary, get_current_time_str,
+    append_limited, format_research_summary, get_current_time_str,
     validate_pokemon_name, search_pokemon_by_name
 )
 
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
 logger = logging.getLogger(__name__)
 
+# Task types grouped under "Battle Tasks"
+_BATTLE_TASK_TYPES = frozenset({"battle", "raid"})
+
+# Task text fragments that mark an easy task
+_EASY_TASK_RE = re.compile("catch [1-5]|make [1-3]|spin [1-5]|transfer|favorite|trade|snapshot|buddy|power up")
+
+# Stricter set of easy-task fragments used by the recommendations tool
+_QUICK_TASK_RE = re.compile("catch [1-3]|make [12]|spin")
+
+# Rewards treated as rare (a simplified heuristic)
+_RARE_REWARD_RE = re.compile("dratini|larvitar|beldum|gible|deino|axew")
+
+# Task counts that make a task too grindy for balanced recommendations
+_LARGE_TASK_COUNT_RE = re.compile("10|15|20|25|30")
+
+
+def _render_current_research(research_tasks: List[ResearchTaskInfo]) -> Optional[Tuple[List[Tuple[str, List[str]]], str]]:
+    """Render every research task as (task type heading, task entries) sections plus a summary."""
+    if not research_tasks:
+        return None
+    
+    # One pass: format each task into its section and count shiny rewards
+    catch_parts = []
+    battle_parts = []
+    other_parts = []
+    total_shiny_tasks = 0
+    
+    for task in research_tasks:
+        if task.task_type == "catch":
+            section = catch_parts
+        elif task.task_type in _BATTLE_TASK_TYPES:
+            section = battle_parts
+        else:
+            section = other_parts
+        section.append(format_research_summary(task) + "\n\n")
+        if any(r.can_be_shiny for r in task.rewards):
+            total_shiny_tasks += 1
+    
+    sections = [
+        (heading, section)
+        for heading, section in (
+            ("## 🎯 Catch Tasks\n\n", catch_parts),
+            ("## ⚔️ Battle/Raid Tasks\n\n", battle_parts),
+            ("## 🎮 Other Tasks\n\n", other_parts),
+        )
+        if section
+    ]
+    
+    summary = (f"**Summary:** {len(research_tasks)} research tasks available, "
+               f"{total_shiny_tasks} have potential shiny rewards\n")
+    
+    return sections, summary
+
 
-def register_research_tools(mcp: FastMCP) -> None:
+def _render_shiny_research(research_tasks: List[ResearchTaskInfo]) -> Optional[Tuple[str, List[str]]]:
+    """Render the research tasks with shiny rewards as an overview plus one entry per task."""
+    shiny_tasks = [
+        t for t in research_tasks 
+        if any(r.can_be_shiny for r in t.rewards)
+    ]
+    
+    if not shiny_tasks:
+        return None
+    
+    parts = [f"Found {len(shiny_tasks)} tasks with potential shiny rewards:\n\n"]
+    
+    # Group shiny Pokemon by task
+    shiny_pokemon = set()
+    for task in shiny_tasks:
+        for reward in task.rewards:
+            if reward.can_be_shiny:
+                shiny_pokemon.add(reward.name)
+    
+    parts.append(f"**Shiny Pokemon Available:** {', '.join(sorted(shiny_pokemon))}\n\n")
+    
+    entries = []
+    for task in shiny_tasks:
+        entry = format_research_summary(task)
+        
+        # Highlight which rewards can be shiny
+        shiny_rewards = [r.name for r in task.rewards if r.can_be_shiny]
+        if shiny_rewards:
+            entry += f"**✨ Shiny Possible:** {', '.join(shiny_rewards)}\n"
+        
+        entries.append(entry + "\n")
+    
+    return "".join(parts), entries
+
+
+def register_research_tools(mcp: "FastMCP") -> None:
     """Register all research-related tools with the MCP server."""
     
     @mcp.tool()
-    async def get_current_research() -> str:
+    async def get_current_research(limit: int = 50) -> str:
         """Get all current field research tasks in Pokemon Go.
         
+        Args:
+            limit: Maximum number of tasks to show per task category (default 50)
+        
         Returns a comprehensive list of all field research tasks currently available
         from PokeStops, including task requirements and possible Pokemon rewards.
         Note: You receive ONE of the possible rewards, not all of them.
         """
         try:
-            research_tasks = await api_client.get_research()
+            # The entries only change with the data; the header carries the current time
+            rendered = await get_api_client().get_rendered("research", _render_current_research)
             
-            if not research_tasks:
+            if rendered is None:
                 return "No field research data available."
             
-            result = f"# Current Field Research Tasks (as of {get_current_time_str()})\n\n"
-            result += "**Important:** You get ONE of the possible rewards listed for each task, not all of them.\n\n"
+            sections, summary = rendered
+            limit = max(limit, 1)
             
-            # Group by task type if available
-            catch_tasks = []
-            battle_tasks = []
-            other_tasks = []
+            parts = [f"# Current Field Research Tasks (as of {get_current_time_str()})\n\n"]
+            parts.append("**Important:** You get ONE of the possible rewards listed for each task, not all of them.\n\n")
             
-            for task in research_tasks:
-                if task.task_type == "catch":
-                    catch_tasks.append(task)
-                elif task.task_type in ["battle", "raid"]:
-                    battle_tasks.append(task)
-                else:
-                    other_tasks.append(task)
+            for heading, entries in sections:
+                parts.append(heading)
+                append_limited(parts, entries, limit)
             
-            if catch_tasks:
-                result += "## 🎯 Catch Tasks\n\n"
-                for task in catch_tasks:
-                    result += format_research_summary(task) + "\n\n"
+            parts.append(summary)
             
-            if battle_tasks:
-                result += "## ⚔️ Battle/Raid Tasks\n\n"
-                for task in battle_tasks:
-                    result += format_research_summary(task) + "\n\n"
-            
-            if other_tasks:
-                result += "## 🎮 Other Tasks\n\n"
-                for task in other_tasks:
-                    result += format_research_summary(task) + "\n\n"
-            
-            # Summary statistics
-            total_shiny_tasks = len([
-                t for t in research_tasks 
-                if any(r.can_be_shiny for r in t.rewards)
-            ])
-            
-            result += f"**Summary:** {len(research_tasks)} research tasks available, "
-            result += f"{total_shiny_tasks} have potential shiny rewards\n"
-            
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching research tasks: {e}")
+            logger.error("Error fetching research tasks: %s", e)
             return f"Error fetching research tasks: {str(e)}"
     
     @mcp.tool()
@@ -91,31 +157,36 @@ def register_research_tools(mcp: FastMCP) -> None:
             if not validate_pokemon_name(pokemon_name):
                 return f"Invalid Pokemon name: '{pokemon_name}'"
             
-            research_tasks = await api_client.get_research()
-            matching_tasks = filter_research_by_reward(research_tasks, pokemon_name)
+            index = await get_api_client().get_research_index()
+            name_lower = pokemon_name.lower()
+            
+            matching = [
+                (t, reward_names) for t, reward_names in zip(index.tasks, index.reward_names_lower)
+                if any(name_lower in reward_name for reward_name in reward_names)
+            ]
+            matching_tasks = [t for t, _ in matching]
             
             if not matching_tasks:
                 return f"No field research tasks found that reward '{pokemon_name}'."
             
-            result = f"# Research Tasks Rewarding {pokemon_name.title()}\n\n"
-            result += f"Found {len(matching_tasks)} task(s) that can reward {pokemon_name}:\n\n"
+            parts = [f"# Research Tasks Rewarding {pokemon_name.title()}\n\n"]
+            parts.append(f"Found {len(matching_tasks)} task(s) that can reward {pokemon_name}:\n\n")
             
-            for task in matching_tasks:
-                result += format_research_summary(task) + "\n\n"
+            parts.extend(format_research_summary(task) + "\n\n" for task in matching_tasks)
             
             # Check if any can be shiny
             shiny_tasks = [
-                t for t in matching_tasks 
-                if any(r.name.lower() == pokemon_name.lower() and r.can_be_shiny for r in t.rewards)
+                t for t, reward_names in matching
+                if any(reward_name == name_lower and r.can_be_shiny for r, reward_name in zip(t.rewards, reward_names))
             ]
             
             if shiny_tasks:
-                result += f"✨ **Shiny Alert:** {len(shiny_tasks)} of these tasks can reward shiny {pokemon_name}!\n"
+                parts.append(f"✨ **Shiny Alert:** {len(shiny_tasks)} of these tasks can reward shiny {pokemon_name}!\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error searching research by reward: {e}")
+            logger.error("Error searching research by reward: %s", e)
             return f"Error searching research by reward: {str(e)}"
     
     @mcp.tool()
@@ -128,81 +199,61 @@ def register_research_tools(mcp: FastMCP) -> None:
         Returns research tasks that match the specified task type.
         """
         try:
-            research_tasks = await api_client.get_research()
+            index = await get_api_client().get_research_index()
             task_type_lower = task_type.lower()
             
             # Filter by task type in the text or explicit type field
-            matching_tasks = [
-                t for t in research_tasks 
-                if (t.task_type and task_type_lower in t.task_type.lower()) or
-                   task_type_lower in t.text.lower()
+            matching = [
+                (t, has_shiny)
+                for t, type_lower, text_lower, has_shiny in zip(index.tasks, index.task_types_lower, index.texts_lower, index.has_shiny)
+                if (type_lower and task_type_lower in type_lower) or
+                   task_type_lower in text_lower
             ]
+            matching_tasks = [t for t, _ in matching]
             
             if not matching_tasks:
                 return f"No field research tasks found for task type '{task_type}'."
             
-            result = f"# {task_type.title()} Research Tasks ({len(matching_tasks)} found)\n\n"
+            parts = [f"# {task_type.title()} Research Tasks ({len(matching_tasks)} found)\n\n"]
             
-            for task in matching_tasks:
-                result += format_research_summary(task) + "\n\n"
+            parts.extend(format_research_summary(task) + "\n\n" for task in matching_tasks)
             
             # Summary
-            shiny_tasks = len([
-                t for t in matching_tasks 
-                if any(r.can_be_shiny for r in t.rewards)
-            ])
+            shiny_tasks = sum(1 for _, has_shiny in matching if has_shiny)
             
-            result += f"**Summary:** {len(matching_tasks)} {task_type} tasks, {shiny_tasks} have potential shiny rewards\n"
+            parts.append(f"**Summary:** {len(matching_tasks)} {task_type} tasks, {shiny_tasks} have potential shiny rewards\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching {task_type} research: {e}")
+            logger.error("Error fetching %s research: %s", task_type, e)
             return f"Error fetching {task_type} research: {str(e)}"
     
     @mcp.tool()
-    async def get_shiny_research_rewards() -> str:
+    async def get_shiny_research_rewards(limit: int = 50) -> str:
         """Get all field research tasks that can reward shiny Pokemon.
         
+        Args:
+            limit: Maximum number of tasks to show (default 50)
+        
         Returns research tasks where at least one of the possible rewards
         can be encountered as a shiny, perfect for shiny hunters.
         """
         try:
-            research_tasks = await api_client.get_research()
-            shiny_tasks = [
-                t for t in research_tasks 
-                if any(r.can_be_shiny for r in t.rewards)
-            ]
+            rendered = await get_api_client().get_rendered("research", _render_shiny_research)
             
-            if not shiny_tasks:
+            if rendered is None:
                 return "No field research tasks with shiny rewards found."
             
-            result = f"# ✨ Research Tasks with Shiny Rewards (as of {get_current_time_str()})\n\n"
-            result += f"Found {len(shiny_tasks)} tasks with potential shiny rewards:\n\n"
+            overview, entries = rendered
             
-            # Group shiny Pokemon by task
-            shiny_pokemon = set()
-            for task in shiny_tasks:
-                for reward in task.rewards:
-                    if reward.can_be_shiny:
-                        shiny_pokemon.add(reward.name)
+            parts = [f"# ✨ Research Tasks with Shiny Rewards (as of {get_current_time_str()})\n\n", overview]
+            append_limited(parts, entries, max(limit, 1))
             
-            result += f"**Shiny Pokemon Available:** {', '.join(sorted(shiny_pokemon))}\n\n"
-            
-            for task in shiny_tasks:
-                result += format_research_summary(task)
-                
-                # Highlight which rewards can be shiny
-                shiny_rewards = [r.name for r in task.rewards if r.can_be_shiny]
-                if shiny_rewards:
-                    result += f"**✨ Shiny Possible:** {', '.join(shiny_rewards)}\n"
-                
-                result += "\n"
-            
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching shiny research: {e}")
+            logger.error("Error fetching shiny research: %s", e)
             return f"Error fetching shiny research: {str(e)}"
     
     @mcp.tool()
@@ -213,45 +264,32 @@ def register_research_tools(mcp: FastMCP) -> None:
         perfect for players who want to stack rewards efficiently.
         """
         try:
-            research_tasks = await api_client.get_research()
-            
-            # Define easy task patterns
-            easy_patterns = [
-                "catch 1", "catch 2", "catch 3", "catch 4", "catch 5",
-                "make 1", "make 2", "make 3",
-                "spin 1", "spin 2", "spin 3", "spin 4", "spin 5",
-                "transfer", "favorite", "trade",
-                "snapshot", "buddy", "power up"
-            ]
+            index = await get_api_client().get_research_index()
             
-            easy_tasks = []
-            for task in research_tasks:
-                task_text_lower = task.text.lower()
-                if any(pattern in task_text_lower for pattern in easy_patterns):
-                    easy_tasks.append(task)
+            easy = [
+                (t, has_shiny) for t, text_lower, has_shiny in zip(index.tasks, index.texts_lower, index.has_shiny)
+                if _EASY_TASK_RE.search(text_lower)
+            ]
+            easy_tasks = [t for t, _ in easy]
             
             if not easy_tasks:
                 return "No easy research tasks found with current criteria."
             
-            result = f"# 🚀 Easy Research Tasks ({len(easy_tasks)} found)\n\n"
-            result += "These tasks can typically be completed quickly:\n\n"
+            parts = [f"# 🚀 Easy Research Tasks ({len(easy_tasks)} found)\n\n"]
+            parts.append("These tasks can typically be completed quickly:\n\n")
             
-            for task in easy_tasks:
-                result += format_research_summary(task) + "\n\n"
+            parts.extend(format_research_summary(task) + "\n\n" for task in easy_tasks)
             
             # Highlight valuable easy tasks
-            valuable_easy = [
-                t for t in easy_tasks 
-                if any(r.can_be_shiny for r in t.rewards)
-            ]
+            valuable_easy = sum(has_shiny for _, has_shiny in easy)
             
             if valuable_easy:
-                result += f"⭐ **High Value:** {len(valuable_easy)} of these easy tasks have shiny potential!\n"
+                parts.append(f"⭐ **High Value:** {valuable_easy} of these easy tasks have shiny potential!\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching easy research: {e}")
+            logger.error("Error fetching easy research: %s", e)
             return f"Error fetching easy research: {str(e)}"
     
     @mcp.tool()
@@ -264,96 +302,87 @@ def register_research_tools(mcp: FastMCP) -> None:
         Returns research tasks that match the search criteria.
         """
         try:
-            research_tasks = await api_client.get_research()
+            index = await get_api_client().get_research_index()
             query_lower = query.lower()
             
-            matching_tasks = [
-                t for t in research_tasks 
-                if query_lower in t.text.lower()
-            ]
+            matching_tasks = [t for t, text_lower in zip(index.tasks, index.texts_lower) if query_lower in text_lower]
             
             if not matching_tasks:
                 return f"No research tasks found matching '{query}'."
             
-            result = f"# Research Tasks matching '{query}' ({len(matching_tasks)} found)\n\n"
+            parts = [f"# Research Tasks matching '{query}' ({len(matching_tasks)} found)\n\n"]
             
-            for task in matching_tasks:
-                result += format_research_summary(task) + "\n\n"
+            parts.extend(format_research_summary(task) + "\n\n" for task in matching_tasks)
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error searching research tasks: {e}")
+            logger.error("Error searching research tasks: %s", e)
             return f"Error searching research tasks: {str(e)}"
     
     @mcp.tool()
-    async def get_research_recommendations(priority: str = "balanced") -> str:
+    async def get_research_recommendations(priority: str = "balanced", limit: int = 15) -> str:
         """Get research task recommendations based on specified priority.
         
         Args:
             priority: Priority type - "shiny" for shiny hunters, "easy" for quick completion, 
                      "rare" for uncommon Pokemon, or "balanced" for general recommendations
+            limit: Maximum number of tasks to recommend (default 15)
             
         Returns recommended research tasks to focus on based on the priority.
         """
         try:
-            research_tasks = await api_client.get_research()
+            index = await get_api_client().get_research_index()
+            
+            # Candidates are (task, has_shiny) pairs, so the shiny flag is looked up once per task
+            candidates = zip(index.tasks, index.has_shiny)
             
-            result = f"# Research Task Recommendations ({priority.title()} Priority)\n\n"
+            parts = [f"# Research Task Recommendations ({priority.title()} Priority)\n\n"]
             
             if priority.lower() == "shiny":
-                tasks = [t for t in research_tasks if any(r.can_be_shiny for r in t.rewards)]
-                result += "Focus on these tasks for shiny hunting:\n\n"
+                tasks = [(t, True) for t in index.shiny_tasks]
+                parts.append("Focus on these tasks for shiny hunting:\n\n")
                 
             elif priority.lower() == "easy":
-                easy_patterns = ["catch 1", "catch 2", "catch 3", "make 1", "make 2", "spin"]
-                tasks = [
-                    t for t in research_tasks 
-                    if any(pattern in t.text.lower() for pattern in easy_patterns)
-                ]
-                result += "These tasks are quick and easy to complete:\n\n"
+                tasks = [c for c, text_lower in zip(candidates, index.texts_lower) if _QUICK_TASK_RE.search(text_lower)]
+                parts.append("These tasks are quick and easy to complete:\n\n")
                 
             elif priority.lower() == "rare":
-                # Tasks with uncommon Pokemon (this is a simplified heuristic)
-                rare_pokemon = ["dratini", "larvitar", "beldum", "gible", "deino", "axew"]
-                tasks = []
-                for task in research_tasks:
-                    for reward in task.rewards:
-                        if any(rare in reward.name.lower() for rare in rare_pokemon):
-                            tasks.append(task)
-                            break
-                result += "These tasks reward rare or pseudo-legendary Pokemon:\n\n"
+                # Tasks with uncommon Pokemon
+                tasks = [
+                    c for c, reward_names in zip(candidates, index.reward_names_lower)
+                    if any(_RARE_REWARD_RE.search(reward_name) for reward_name in reward_names)
+                ]
+                parts.append("These tasks reward rare or pseudo-legendary Pokemon:\n\n")
                 
             else:  # balanced
                 # Mix of shiny potential and reasonable difficulty
-                tasks = []
-                for task in research_tasks:
-                    has_shiny = any(r.can_be_shiny for r in task.rewards)
-                    is_moderate = not any(num in task.text for num in ["10", "15", "20", "25", "30"])
-                    
-                    if has_shiny or is_moderate:
-                        tasks.append(task)
+                tasks = [
+                    (task, has_shiny) for task, has_shiny in candidates
+                    if has_shiny or not _LARGE_TASK_COUNT_RE.search(task.text)
+                ]
                 
-                result += "Balanced recommendations considering effort vs. reward:\n\n"
+                parts.append("Balanced recommendations considering effort vs. reward:\n\n")
             
             if not tasks:
                 return f"No research tasks found matching {priority} priority criteria."
             
             # Sort by potential value (shiny tasks first)
-            tasks.sort(key=lambda t: any(r.can_be_shiny for r in t.rewards), reverse=True)
+            tasks.sort(key=lambda c: not c[1])
             
-            for i, task in enumerate(tasks[:15]):  # Limit to top 15
-                priority_marker = "🌟" if any(r.can_be_shiny for r in task.rewards) else "⭐"
-                result += f"{priority_marker} **{task.text}**\n"
+            limit = max(limit, 1)
+            for task, has_shiny in tasks[:limit]:
+                priority_marker = "🌟" if has_shiny else "⭐"
+                parts.append(f"{priority_marker} **{task.text}**\n")
                 
                 rewards = [f"{r.name}{'✨' if r.can_be_shiny else ''}" for r in task.rewards]
-                result += f"Rewards: {', '.join(rewards)}\n\n"
+                parts.append(f"Rewards: {', '.join(rewards)}\n\n")
             
-            if len(tasks) > 15:
-                result += f"... and {len(tasks) - 15} more tasks match your criteria.\n"
+            if len(tasks) > limit:
+                parts.append(f"... and {len(tasks) - limit} more tasks match your criteria.\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error getting research recommendations: {e}")
+            logger.error("Error getting research recommendations: %s", e)
             return f"Error getting research recommendations: {str(e)}"
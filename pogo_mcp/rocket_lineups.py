@@ -1,22 +1,34 @@
 """Team Rocket lineups tools for the Pokemon Go MCP server."""
 
 import logging
-from typing import List, Optional, Dict, Any
+from collections import defaultdict
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 
-from mcp.server.fastmcp import FastMCP
-
-from .api_client import api_client
+from .api_client import get_api_client
 from .types import RocketTrainerInfo, ShadowPokemonInfo, RocketLineupSlot
 from .utils import (
-    format_rocket_summary, filter_trainers_by_type, search_rocket_trainers_by_pokemon,
+    format_rocket_summary, filter_trainers_by_type,
     get_shiny_shadow_pokemon as get_shiny_shadow_pokemon_util, get_rocket_encounters as get_rocket_encounters_util, calculate_type_effectiveness,
-    get_current_time_str, validate_pokemon_name
+    filter_shiny_pokemon, get_current_time_str, validate_pokemon_name
 )
 
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+
 logger = logging.getLogger(__name__)
 
+# Damage multiplier -> (result label, description); descriptions may name the attacking and defending types
+_EFFECTIVENESS_RESULTS = {
+    0.0: ("No Effect (0× damage) 🚫", "{attacking} attacks have no effect on {defending} types."),
+    0.25: ("Not Very Effective (0.25× damage) 🔴", "This is a very poor matchup."),
+    0.5: ("Not Very Effective (0.5× damage) 🟠", "This attack is resisted."),
+    1.0: ("Normal Effectiveness (1× damage) ⚪", "This attack deals normal damage."),
+    2.0: ("Super Effective (2× damage) 🟢", "This attack is super effective!"),
+    4.0: ("Super Effective (4× damage) 🟢🟢", "This attack is super effective against both types!"),
+}
+
 
-def register_rocket_tools(mcp: FastMCP) -> None:
+def register_rocket_tools(mcp: "FastMCP") -> None:
     """Register all Team Rocket lineup tools with the MCP server."""
 
     @mcp.tool()
@@ -27,63 +39,67 @@ def register_rocket_tools(mcp: FastMCP) -> None:
         their Pokemon lineups, types, and encounter rewards.
         """
         try:
-            trainers = await api_client.get_rocket_lineups()
+            trainers = (await get_api_client().get_rocket_index()).trainers
 
             if not trainers:
                 return "No Team Rocket lineup data available."
 
-            result = f"# Team Rocket Lineups (as of {get_current_time_str()})\n\n"
-            result += f"**Total Trainers:** {len(trainers)}\n\n"
+            parts = [f"# Team Rocket Lineups (as of {get_current_time_str()})\n\n"]
+            parts.append(f"**Total Trainers:** {len(trainers)}\n\n")
 
             # Organize trainers by type
-            leaders = [t for t in trainers if 'leader' in t.title.lower() or 'boss' in t.title.lower()]
-            grunts_by_type = {}
+            # Sort trainers into leaders, typed grunts and others in one pass
+            leaders = []
+            grunts_by_type = defaultdict(list)
             other_trainers = []
 
             for trainer in trainers:
-                if trainer in leaders:
-                    continue
+                title_lower = trainer.title.lower()
+                if 'leader' in title_lower or 'boss' in title_lower:
+                    leaders.append(trainer)
                 elif trainer.type:
-                    trainer_type = trainer.type.title()
-                    if trainer_type not in grunts_by_type:
-                        grunts_by_type[trainer_type] = []
-                    grunts_by_type[trainer_type].append(trainer)
+                    grunts_by_type[trainer.type.title()].append(trainer)
                 else:
                     other_trainers.append(trainer)
 
             # Display leaders first
             if leaders:
-                result += "## 🎯 Leaders\n\n"
-                for leader in leaders:
-                    result += format_rocket_summary(leader) + "\n\n"
+                parts.append("## 🎯 Leaders\n\n")
+                parts.extend(format_rocket_summary(leader) + "\n\n" for leader in leaders)
 
             # Display grunts by type
+            # The keys are already title-cased
             for trainer_type in sorted(grunts_by_type.keys()):
-                result += f"## {trainer_type.title()} Type Grunts\n\n"
-                for trainer in grunts_by_type[trainer_type]:
-                    result += format_rocket_summary(trainer) + "\n\n"
+                parts.append(f"## {trainer_type} Type Grunts\n\n")
+                parts.extend(format_rocket_summary(trainer) + "\n\n" for trainer in grunts_by_type[trainer_type])
 
             # Display other trainers
             if other_trainers:
-                result += "## Other Trainers\n\n"
-                for trainer in other_trainers:
-                    result += format_rocket_summary(trainer) + "\n\n"
+                parts.append("## Other Trainers\n\n")
+                parts.extend(format_rocket_summary(trainer) + "\n\n" for trainer in other_trainers)
 
-            # Summary statistics
-            total_pokemon = sum(sum(len(slot.pokemon) for slot in trainer.lineups) for trainer in trainers)
-            total_encounters = sum(sum(len(slot.pokemon) for slot in trainer.lineups if slot.is_encounter) for trainer in trainers)
-            shiny_count = len(get_shiny_shadow_pokemon_util(trainers))
+            # Summary statistics, gathered in one walk over the lineups
+            total_pokemon = 0
+            total_encounters = 0
+            shiny_names = set()  # shiny Shadow Pokemon are counted once per name
+            for trainer in trainers:
+                for slot in trainer.lineups:
+                    total_pokemon += len(slot.pokemon)
+                    if slot.is_encounter:
+                        total_encounters += len(slot.pokemon)
+                    shiny_names.update(p.name for p in slot.pokemon if p.can_be_shiny)
+            shiny_count = len(shiny_names)
 
-            result += "## 📊 Summary\n\n"
-            result += f"• **{len(trainers)}** trainers total\n"
-            result += f"• **{total_pokemon}** Pokemon options\n"
-            result += f"• **{total_encounters}** possible encounters\n"
-            result += f"• **{shiny_count}** shiny-eligible Shadow Pokemon\n"
+            parts.append("## 📊 Summary\n\n")
+            parts.append(f"• **{len(trainers)}** trainers total\n")
+            parts.append(f"• **{total_pokemon}** Pokemon options\n")
+            parts.append(f"• **{total_encounters}** possible encounters\n")
+            parts.append(f"• **{shiny_count}** shiny-eligible Shadow Pokemon\n")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
-            logger.error(f"Error fetching Team Rocket lineups: {e}")
+            logger.error("Error fetching Team Rocket lineups: %s", e)
             return f"Error fetching Team Rocket lineups: {str(e)}"
 
     @mcp.tool()
@@ -99,37 +115,39 @@ def register_rocket_tools(mcp: FastMCP) -> None:
             if not validate_pokemon_name(pokemon_name):
                 return f"Invalid Pokemon name: '{pokemon_name}'"
 
-            trainers = await api_client.get_rocket_lineups()
-            matching_trainers = search_rocket_trainers_by_pokemon(trainers, pokemon_name)
+            index = await get_api_client().get_rocket_index()
+            name_lower = pokemon_name.lower()
+            positions = index.positions_using(pokemon_name)
 
-            if not matching_trainers:
+            if not positions:
                 return f"No Team Rocket trainers found using {pokemon_name.title()}."
 
-            result = f"# Team Rocket Trainers with {pokemon_name.title()}\n\n"
-            result += f"Found **{len(matching_trainers)}** trainers using {pokemon_name.title()}:\n\n"
+            parts = [f"# Team Rocket Trainers with {pokemon_name.title()}\n\n"]
+            parts.append(f"Found **{len(positions)}** trainers using {pokemon_name.title()}:\n\n")
 
-            for trainer in matching_trainers:
-                result += format_rocket_summary(trainer)
+            for position in positions:
+                trainer = index.trainers[position]
+                parts.append(format_rocket_summary(trainer))
 
                 # Show which slots have this Pokemon
                 matching_slots = []
-                for slot in trainer.lineups:
-                    slot_pokemon = [p for p in slot.pokemon if pokemon_name.lower() in p.name.lower()]
+                for slot, names_lower in zip(trainer.lineups, index.slot_names_lower[position]):
+                    slot_pokemon = [p for p, p_name_lower in zip(slot.pokemon, names_lower) if name_lower in p_name_lower]
                     if slot_pokemon:
                         encounter_text = " (Encounter)" if slot.is_encounter else ""
-                        shiny_pokemon = [p for p in slot_pokemon if p.can_be_shiny]
+                        shiny_pokemon = filter_shiny_pokemon(slot_pokemon)
                         shiny_text = f" - {len(shiny_pokemon)} can be shiny" if shiny_pokemon else ""
                         matching_slots.append(f"Slot {slot.slot}{encounter_text}: {len(slot_pokemon)} options{shiny_text}")
 
                 if matching_slots:
-                    result += "\n  " + "\n  ".join(matching_slots)
+                    parts.append("\n  " + "\n  ".join(matching_slots))
 
-                result += "\n\n"
+                parts.append("\n\n")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
-            logger.error(f"Error searching for Pokemon in Team Rocket lineups: {e}")
+            logger.error("Error searching for Pokemon in Team Rocket lineups: %s", e)
             return f"Error searching for Pokemon: {str(e)}"
 
     @mcp.tool()
@@ -140,22 +158,22 @@ def register_rocket_tools(mcp: FastMCP) -> None:
         with their types, weaknesses, and which trainers use them.
         """
         try:
-            trainers = await api_client.get_rocket_lineups()
-            shiny_pokemon = get_shiny_shadow_pokemon_util(trainers)
+            index = await get_api_client().get_rocket_index()
+            shiny_pokemon = get_shiny_shadow_pokemon_util(index.trainers)
 
             if not shiny_pokemon:
                 return "No shiny Shadow Pokemon found in current Team Rocket lineups."
 
-            result = f"# ✨ Shiny Shadow Pokemon (as of {get_current_time_str()})\n\n"
-            result += f"**Total Shiny Shadow Pokemon:** {len(shiny_pokemon)}\n\n"
+            parts = [f"# ✨ Shiny Shadow Pokemon (as of {get_current_time_str()})\n\n"]
+            parts.append(f"**Total Shiny Shadow Pokemon:** {len(shiny_pokemon)}\n\n")
 
             for pokemon in shiny_pokemon:
-                result += f"## {pokemon.name}\n\n"
+                parts.append(f"## {pokemon.name}\n\n")
 
                 # Types
                 if pokemon.types:
                     types_str = " / ".join(pokemon.types).title()
-                    result += f"**Types:** {types_str}\n"
+                    parts.append(f"**Types:** {types_str}\n")
 
                 # Weaknesses
                 if pokemon.weaknesses:
@@ -163,22 +181,22 @@ def register_rocket_tools(mcp: FastMCP) -> None:
                     single_weak = pokemon.weaknesses.get('single', [])
 
                     if double_weak:
-                        result += f"**Double Weakness:** {', '.join(double_weak).title()}\n"
+                        parts.append(f"**Double Weakness:** {', '.join(double_weak).title()}\n")
                     if single_weak:
-                        result += f"**Weakness:** {', '.join(single_weak).title()}\n"
+                        parts.append(f"**Weakness:** {', '.join(single_weak).title()}\n")
 
                 # Find which trainers have this Pokemon
-                using_trainers = search_rocket_trainers_by_pokemon(trainers, pokemon.name)
+                using_trainers = index.trainers_using(pokemon.name)
                 if using_trainers:
                     trainer_names = [t.name for t in using_trainers]
-                    result += f"**Available from:** {', '.join(trainer_names)}\n"
+                    parts.append(f"**Available from:** {', '.join(trainer_names)}\n")
 
-                result += "\n"
+                parts.append("\n")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
-            logger.error(f"Error fetching shiny Shadow Pokemon: {e}")
+            logger.error("Error fetching shiny Shadow Pokemon: %s", e)
             return f"Error fetching shiny Shadow Pokemon: {str(e)}"
 
     @mcp.tool()
@@ -189,13 +207,13 @@ def register_rocket_tools(mcp: FastMCP) -> None:
         Team Rocket trainers, organized by trainer.
         """
         try:
-            trainers = await api_client.get_rocket_lineups()
+            trainers = (await get_api_client().get_rocket_index()).trainers
             encounters = get_rocket_encounters_util(trainers)
 
             if not encounters:
                 return "No Team Rocket encounter data found."
 
-            result = f"# 🎁 Team Rocket Encounter Rewards (as of {get_current_time_str()})\n\n"
+            parts = [f"# 🎁 Team Rocket Encounter Rewards (as of {get_current_time_str()})\n\n"]
 
             total_encounters = sum(len(pokemon_list) for _, pokemon_list in encounters)
             shiny_encounters = 0
@@ -204,28 +222,28 @@ def register_rocket_tools(mcp: FastMCP) -> None:
                 shiny_count = sum(1 for p in encounter_pokemon if p.can_be_shiny)
                 shiny_encounters += shiny_count
 
-                result += f"## {trainer_name}\n\n"
-                result += f"**Possible Encounters:** {len(encounter_pokemon)}"
+                parts.append(f"## {trainer_name}\n\n")
+                parts.append(f"**Possible Encounters:** {len(encounter_pokemon)}")
                 if shiny_count > 0:
-                    result += f" ({shiny_count} can be shiny ✨)"
-                result += "\n\n"
+                    parts.append(f" ({shiny_count} can be shiny ✨)")
+                parts.append("\n\n")
 
                 for pokemon in encounter_pokemon:
                     shiny_indicator = " ✨" if pokemon.can_be_shiny else ""
                     types_str = f" ({'/'.join(pokemon.types)})" if pokemon.types else ""
-                    result += f"• **{pokemon.name}**{types_str}{shiny_indicator}\n"
+                    parts.append(f"• **{pokemon.name}**{types_str}{shiny_indicator}\n")
 
-                result += "\n"
+                parts.append("\n")
 
-            result += f"## 📊 Summary\n\n"
-            result += f"• **{len(encounters)}** trainers offer encounters\n"
-            result += f"• **{total_encounters}** total encounter options\n"
-            result += f"• **{shiny_encounters}** can be shiny ✨\n"
+            parts.append(f"## 📊 Summary\n\n")
+            parts.append(f"• **{len(encounters)}** trainers offer encounters\n")
+            parts.append(f"• **{total_encounters}** total encounter options\n")
+            parts.append(f"• **{shiny_encounters}** can be shiny ✨\n")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
-            logger.error(f"Error fetching Team Rocket encounters: {e}")
+            logger.error("Error fetching Team Rocket encounters: %s", e)
             return f"Error fetching Team Rocket encounters: {str(e)}"
 
     @mcp.tool()
@@ -238,43 +256,41 @@ def register_rocket_tools(mcp: FastMCP) -> None:
         Returns information about Team Rocket trainers specialized in that type.
         """
         try:
-            trainers = await api_client.get_rocket_lineups()
+            trainers = (await get_api_client().get_rocket_index()).trainers
             filtered_trainers = filter_trainers_by_type(trainers, trainer_type)
 
             if not filtered_trainers:
                 return f"No {trainer_type.title()} type Team Rocket trainers found."
 
-            result = f"# {trainer_type.title()} Type Team Rocket Trainers\n\n"
-            result += f"Found **{len(filtered_trainers)}** {trainer_type.lower()} type trainers:\n\n"
+            type_title = trainer_type.title()
+            type_lower = trainer_type.lower()
+
+            parts = [f"# {type_title} Type Team Rocket Trainers\n\n"]
+            parts.append(f"Found **{len(filtered_trainers)}** {type_lower} type trainers:\n\n")
 
             for trainer in filtered_trainers:
-                result += format_rocket_summary(trainer) + "\n"
+                parts.append(format_rocket_summary(trainer) + "\n")
 
                 # Show type-specific Pokemon
                 type_pokemon = []
                 for slot in trainer.lineups:
                     for pokemon in slot.pokemon:
-                        if trainer_type.lower() in [t.lower() for t in pokemon.types]:
+                        if any(t.lower() == type_lower for t in pokemon.types):
                             shiny_indicator = " ✨" if pokemon.can_be_shiny else ""
                             type_pokemon.append(f"{pokemon.name}{shiny_indicator}")
 
                 if type_pokemon:
                     # Remove duplicates while preserving order
-                    seen = set()
-                    unique_pokemon = []
-                    for p in type_pokemon:
-                        if p not in seen:
-                            unique_pokemon.append(p)
-                            seen.add(p)
+                    unique_pokemon = list(dict.fromkeys(type_pokemon))
 
-                    result += f"  **{trainer_type.title()} Pokemon:** {', '.join(unique_pokemon)}\n"
+                    parts.append(f"  **{type_title} Pokemon:** {', '.join(unique_pokemon)}\n")
 
-                result += "\n"
+                parts.append("\n")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
-            logger.error(f"Error filtering Team Rocket trainers by type: {e}")
+            logger.error("Error filtering Team Rocket trainers by type: %s", e)
             return f"Error filtering Team Rocket trainers: {str(e)}"
 
     @mcp.tool()
@@ -291,20 +307,8 @@ def register_rocket_tools(mcp: FastMCP) -> None:
             if not validate_pokemon_name(pokemon_name):
                 return f"Invalid Pokemon name: '{pokemon_name}'"
 
-            trainers = await api_client.get_rocket_lineups()
-
             # Find the Pokemon in Team Rocket lineups
-            target_pokemon = None
-            for trainer in trainers:
-                for slot in trainer.lineups:
-                    for pokemon in slot.pokemon:
-                        if pokemon_name.lower() in pokemon.name.lower():
-                            target_pokemon = pokemon
-                            break
-                    if target_pokemon:
-                        break
-                if target_pokemon:
-                    break
+            target_pokemon = (await get_api_client().get_rocket_index()).find_pokemon(pokemon_name)
 
             if not target_pokemon:
                 return f"{pokemon_name.title()} not found in current Team Rocket lineups."
@@ -314,32 +318,22 @@ def register_rocket_tools(mcp: FastMCP) -> None:
 
             effectiveness = calculate_type_effectiveness(attacking_type, target_pokemon.types)
 
-            result = f"# Type Effectiveness: {attacking_type.title()} vs {target_pokemon.name}\n\n"
-            result += f"**Target Pokemon:** {target_pokemon.name}\n"
-            result += f"**Target Types:** {' / '.join(target_pokemon.types).title()}\n"
-            result += f"**Attacking Type:** {attacking_type.title()}\n\n"
+            parts = [f"# Type Effectiveness: {attacking_type.title()} vs {target_pokemon.name}\n\n"]
+            parts.append(f"**Target Pokemon:** {target_pokemon.name}\n")
+            parts.append(f"**Target Types:** {' / '.join(target_pokemon.types).title()}\n")
+            parts.append(f"**Attacking Type:** {attacking_type.title()}\n\n")
 
             # Effectiveness description
-            if effectiveness == 0.0:
-                result += "**Result:** No Effect (0× damage) 🚫\n"
-                result += f"{attacking_type.title()} attacks have no effect on {' / '.join(target_pokemon.types).title()} types."
-            elif effectiveness == 0.25:
-                result += "**Result:** Not Very Effective (0.25× damage) 🔴\n"
-                result += "This is a very poor matchup."
-            elif effectiveness == 0.5:
-                result += "**Result:** Not Very Effective (0.5× damage) 🟠\n"
-                result += "This attack is resisted."
-            elif effectiveness == 1.0:
-                result += "**Result:** Normal Effectiveness (1× damage) ⚪\n"
-                result += "This attack deals normal damage."
-            elif effectiveness == 2.0:
-                result += "**Result:** Super Effective (2× damage) 🟢\n"
-                result += "This attack is super effective!"
-            elif effectiveness == 4.0:
-                result += "**Result:** Super Effective (4× damage) 🟢🟢\n"
-                result += "This attack is super effective against both types!"
+            result = _EFFECTIVENESS_RESULTS.get(effectiveness)
+            if result:
+                label, description = result
+                parts.append(f"**Result:** {label}\n")
+                parts.append(description.format(
+                    attacking=attacking_type.title(),
+                    defending=' / '.join(target_pokemon.types).title()
+                ))
             else:
-                result += f"**Result:** {effectiveness}× damage\n"
+                parts.append(f"**Result:** {effectiveness}× damage\n")
 
             # Show weaknesses from data
             if target_pokemon.weaknesses:
@@ -347,16 +341,16 @@ def register_rocket_tools(mcp: FastMCP) -> None:
                 single_weak = target_pokemon.weaknesses.get('single', [])
 
                 if double_weak or single_weak:
-                    result += "\n**Known Weaknesses:**\n"
+                    parts.append("\n**Known Weaknesses:**\n")
                     if double_weak:
-                        result += f"• **Double weakness:** {', '.join(double_weak).title()}\n"
+                        parts.append(f"• **Double weakness:** {', '.join(double_weak).title()}\n")
                     if single_weak:
-                        result += f"• **Weak to:** {', '.join(single_weak).title()}\n"
+                        parts.append(f"• **Weak to:** {', '.join(single_weak).title()}\n")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
-            logger.error(f"Error calculating Pokemon weakness: {e}")
+            logger.error("Error calculating Pokemon weakness: %s", e)
             return f"Error calculating weakness: {str(e)}"
 
     @mcp.tool()
@@ -369,77 +363,77 @@ def register_rocket_tools(mcp: FastMCP) -> None:
         Returns comprehensive details about the trainer's lineup and Pokemon.
         """
         try:
-            trainers = await api_client.get_rocket_lineups()
+            index = await get_api_client().get_rocket_index()
+            trainer_name_lower = trainer_name.lower()
 
             # Find matching trainers
-            matching_trainers = [t for t in trainers if trainer_name.lower() in t.name.lower()]
+            matching_trainers = [t for t, name_lower in zip(index.trainers, index.names_lower) if trainer_name_lower in name_lower]
 
             if not matching_trainers:
                 return f"No Team Rocket trainer found matching '{trainer_name}'."
 
             if len(matching_trainers) > 1:
-                result = f"Multiple trainers found matching '{trainer_name}':\n\n"
-                for trainer in matching_trainers:
-                    result += f"• {trainer.name}\n"
-                result += "\nPlease be more specific."
-                return result
+                parts = [f"Multiple trainers found matching '{trainer_name}':\n\n"]
+                parts.extend(f"• {trainer.name}\n" for trainer in matching_trainers)
+                parts.append("\nPlease be more specific.")
+                return "".join(parts)
 
             trainer = matching_trainers[0]
 
-            result = f"# {trainer.name} - Team Rocket Trainer Details\n\n"
+            parts = [f"# {trainer.name} - Team Rocket Trainer Details\n\n"]
 
             # Basic info
             if trainer.title:
-                result += f"**Title:** {trainer.title}\n"
+                parts.append(f"**Title:** {trainer.title}\n")
             if trainer.type:
-                result += f"**Specialty:** {trainer.type.title()} type\n"
+                parts.append(f"**Specialty:** {trainer.type.title()} type\n")
             if trainer.quote:
-                result += f"**Quote:** *\"{trainer.quote}\"*\n"
+                parts.append(f"**Quote:** *\"{trainer.quote}\"*\n")
 
-            result += f"**Total Lineup Slots:** {len(trainer.lineups)}\n\n"
+            parts.append(f"**Total Lineup Slots:** {len(trainer.lineups)}\n\n")
 
             # Detailed lineup
-            result += "## 🔥 Pokemon Lineup\n\n"
+            parts.append("## 🔥 Pokemon Lineup\n\n")
 
             for slot in trainer.lineups:
                 encounter_indicator = " 🎁" if slot.is_encounter else ""
-                result += f"### Slot {slot.slot}{encounter_indicator}\n\n"
+                parts.append(f"### Slot {slot.slot}{encounter_indicator}\n\n")
 
                 if slot.is_encounter:
-                    result += "*This slot determines your encounter reward*\n\n"
+                    parts.append("*This slot determines your encounter reward*\n\n")
 
                 for pokemon in slot.pokemon:
                     shiny_indicator = " ✨" if pokemon.can_be_shiny else ""
-                    result += f"**{pokemon.name}**{shiny_indicator}\n"
+                    parts.append(f"**{pokemon.name}**{shiny_indicator}\n")
 
                     if pokemon.types:
-                        result += f"• **Type:** {' / '.join(pokemon.types).title()}\n"
+                        parts.append(f"• **Type:** {' / '.join(pokemon.types).title()}\n")
 
                     if pokemon.weaknesses:
                         double_weak = pokemon.weaknesses.get('double', [])
                         single_weak = pokemon.weaknesses.get('single', [])
 
                         if double_weak:
-                            result += f"• **Double weakness:** {', '.join(double_weak).title()}\n"
+                            parts.append(f"• **Double weakness:** {', '.join(double_weak).title()}\n")
                         if single_weak:
-                            result += f"• **Weak to:** {', '.join(single_weak).title()}\n"
+                            parts.append(f"• **Weak to:** {', '.join(single_weak).title()}\n")
 
-                    result += "\n"
+                    parts.append("\n")
 
-                result += "\n"
+                parts.append("\n")
 
             # Summary stats
             total_pokemon = sum(len(slot.pokemon) for slot in trainer.lineups)
             shiny_pokemon = sum(sum(1 for p in slot.pokemon if p.can_be_shiny) for slot in trainer.lineups)
             encounter_pokemon = sum(len(slot.pokemon) for slot in trainer.lineups if slot.is_encounter)
 
-            result += "## 📊 Summary\n\n"
-            result += f"• **Total Pokemon Options:** {total_pokemon}\n"
-            result += f"• **Possible Encounters:** {encounter_pokemon}\n"
-            result += f"• **Shiny Opportunities:** {shiny_pokemon} ✨\n"
+            parts.append("## 📊 Summary\n\n")
+            parts.append(f"• **Total Pokemon Options:** {total_pokemon}\n")
+            parts.append(f"• **Possible Encounters:** {encounter_pokemon}\n")
+            parts.append(f"• **Shiny Opportunities:** {shiny_pokemon} ✨\n")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
-            logger.error(f"Error getting trainer details: {e}")
+            logger.error("Error getting trainer details: %s", e)
             return f"Error getting trainer details: {str(e)}"
\ No newline at end of file
@@ -2,12 +2,15 @@
 
 import logging
 import asyncio
+import re
+import time
+from collections import defaultdict
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timezone
 
 from fastmcp import FastMCP
 
-from .api_client import api_client
+from .api_client import DATA_ENDPOINTS, get_api_client
 from .events import register_event_tools
 from .raids import register_raid_tools
 from .research import register_research_tools
@@ -16,7 +19,7 @@ from .rocket_lineups import register_rocket_tools
 from .promo_codes import register_promo_code_tools
 from .utils import (
     get_current_time_str, format_json_output, search_pokemon_by_name,
-    filter_shiny_pokemon, validate_pokemon_name, is_event_active
+    count_shiny_pokemon, filter_shiny_pokemon, validate_pokemon_name, is_event_active
 )
 from .types import PokemonInfo
 
@@ -32,6 +35,9 @@ mcp = FastMCP(
     port=int(os.environ.get('MCP_PORT', '8000'))
 )
 
+# Task text fragments that mark a research task as quick to complete
+_QUICK_RESEARCH_RE = re.compile("catch [1-3]|make 1")
+
 
 def register_cross_cutting_tools():
     """Register tools that work across all data sources."""
@@ -45,10 +51,10 @@ def register_cross_cutting_tools():
         """
         try:
             logger.info("Fetching all data for shiny Pokemon search...")
-            all_data = await api_client.get_all_data()
+            all_data = await get_api_client().get_data("events", "raids", "research", "eggs", "rocket_lineups")
             
             shiny_pokemon = set()
-            sources = {}
+            sources = defaultdict(list)
             
             # From events (spawns and shinies)
             for event in all_data["events"]:
@@ -58,16 +64,12 @@ def register_cross_cutting_tools():
                         name = shiny.get("name", "")
                         if name:
                             shiny_pokemon.add(name)
-                            if name not in sources:
-                                sources[name] = []
                             sources[name].append(f"Event: {event.name}")
             
             # From raids
             for raid in all_data["raids"]:
                 if raid.can_be_shiny:
                     shiny_pokemon.add(raid.name)
-                    if raid.name not in sources:
-                        sources[raid.name] = []
                     sources[raid.name].append(f"Raid: {raid.tier}")
             
             # From research
@@ -75,16 +77,12 @@ def register_cross_cutting_tools():
                 for reward in task.rewards:
                     if reward.can_be_shiny:
                         shiny_pokemon.add(reward.name)
-                        if reward.name not in sources:
-                            sources[reward.name] = []
                         sources[reward.name].append("Research Task")
             
             # From eggs
             for egg in all_data["eggs"]:
                 if egg.can_be_shiny:
                     shiny_pokemon.add(egg.name)
-                    if egg.name not in sources:
-                        sources[egg.name] = []
                     sources[egg.name].append(f"Egg: {egg.egg_type}")
 
             # From Team Rocket lineups
@@ -93,29 +91,27 @@ def register_cross_cutting_tools():
                     for pokemon in slot.pokemon:
                         if pokemon.can_be_shiny:
                             shiny_pokemon.add(pokemon.name)
-                            if pokemon.name not in sources:
-                                sources[pokemon.name] = []
                             encounter_text = " (Encounter)" if slot.is_encounter else ""
                             sources[pokemon.name].append(f"Team Rocket: {trainer.name}{encounter_text}")
             
             if not shiny_pokemon:
                 return "No shiny Pokemon found across all sources."
             
-            result = f"# ✨ All Available Shiny Pokemon (as of {get_current_time_str()})\n\n"
-            result += f"**Total Shiny Pokemon Available:** {len(shiny_pokemon)}\n\n"
+            parts = [f"# ✨ All Available Shiny Pokemon (as of {get_current_time_str()})\n\n"]
+            parts.append(f"**Total Shiny Pokemon Available:** {len(shiny_pokemon)}\n\n")
             
             # Sort alphabetically
             sorted_shinies = sorted(shiny_pokemon)
             
             for pokemon in sorted_shinies:
                 pokemon_sources = sources.get(pokemon, ["Unknown"])
-                result += f"**{pokemon}**\n"
-                result += f"Sources: {', '.join(pokemon_sources)}\n\n"
+                parts.append(f"**{pokemon}**\n")
+                parts.append(f"Sources: {', '.join(pokemon_sources)}\n\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error fetching all shiny Pokemon: {e}")
+            logger.error("Error fetching all shiny Pokemon: %s", e)
             return f"Error fetching all shiny Pokemon: {str(e)}"
     
     @mcp.tool()
@@ -131,10 +127,10 @@ def register_cross_cutting_tools():
             if not validate_pokemon_name(pokemon_name):
                 return f"Invalid Pokemon name: '{pokemon_name}'"
             
-            logger.info(f"Searching for {pokemon_name} across all sources...")
-            all_data = await api_client.get_all_data()
+            logger.info("Searching for %s across all sources...", pokemon_name)
+            all_data = await get_api_client().get_data("events", "raids", "research", "eggs", "rocket_lineups")
             
-            result = f"# Search Results: {pokemon_name.title()}\n\n"
+            parts = [f"# Search Results: {pokemon_name.title()}\n\n"]
             found_anywhere = False
             name_lower = pokemon_name.lower()
             
@@ -156,20 +152,19 @@ def register_cross_cutting_tools():
             
             if event_matches:
                 found_anywhere = True
-                result += "## 🎉 Events\n\n"
-                for match in event_matches:
-                    result += f"• {match}\n"
-                result += "\n"
+                parts.append("## 🎉 Events\n\n")
+                parts.extend(f"• {match}\n" for match in event_matches)
+                parts.append("\n")
             
             # Search in raids
             raid_matches = [r for r in all_data["raids"] if name_lower in r.name.lower()]
             if raid_matches:
                 found_anywhere = True
-                result += "## ⚔️ Raids\n\n"
+                parts.append("## ⚔️ Raids\n\n")
                 for raid in raid_matches:
                     shiny_status = "✨ Shiny Available" if raid.can_be_shiny else "❌ No Shiny"
-                    result += f"• **{raid.name}** ({raid.tier}) - {shiny_status}\n"
-                result += "\n"
+                    parts.append(f"• **{raid.name}** ({raid.tier}) - {shiny_status}\n")
+                parts.append("\n")
             
             # Search in research
             research_matches = []
@@ -181,16 +176,15 @@ def register_cross_cutting_tools():
             
             if research_matches:
                 found_anywhere = True
-                result += "## 🔬 Research Tasks\n\n"
-                for match in research_matches:
-                    result += f"• {match}\n"
-                result += "\n"
+                parts.append("## 🔬 Research Tasks\n\n")
+                parts.extend(f"• {match}\n" for match in research_matches)
+                parts.append("\n")
             
             # Search in eggs
             egg_matches = [e for e in all_data["eggs"] if name_lower in e.name.lower()]
             if egg_matches:
                 found_anywhere = True
-                result += "## 🥚 Egg Hatches\n\n"
+                parts.append("## 🥚 Egg Hatches\n\n")
                 for egg in egg_matches:
                     features = []
                     if egg.can_be_shiny:
@@ -201,8 +195,8 @@ def register_cross_cutting_tools():
                         features.append("🎁 Gift")
 
                     feature_str = f" ({', '.join(features)})" if features else ""
-                    result += f"• **{egg.name}** from {egg.egg_type}{feature_str}\n"
-                result += "\n"
+                    parts.append(f"• **{egg.name}** from {egg.egg_type}{feature_str}\n")
+                parts.append("\n")
 
             # Search in Team Rocket lineups
             rocket_matches = []
@@ -216,24 +210,23 @@ def register_cross_cutting_tools():
 
             if rocket_matches:
                 found_anywhere = True
-                result += "## 🚀 Team Rocket Lineups\n\n"
-                for match in rocket_matches:
-                    result += f"• {match}\n"
-                result += "\n"
+                parts.append("## 🚀 Team Rocket Lineups\n\n")
+                parts.extend(f"• {match}\n" for match in rocket_matches)
+                parts.append("\n")
             
             if not found_anywhere:
-                result += f"❌ **{pokemon_name.title()}** was not found in any current Pokemon Go data sources.\n\n"
-                result += "This could mean:\n"
-                result += "• The Pokemon is not currently available\n"
-                result += "• The name might be misspelled\n"
-                result += "• The Pokemon might be in a different form or region\n"
+                parts.append(f"❌ **{pokemon_name.title()}** was not found in any current Pokemon Go data sources.\n\n")
+                parts.append("This could mean:\n")
+                parts.append("• The Pokemon is not currently available\n")
+                parts.append("• The name might be misspelled\n")
+                parts.append("• The Pokemon might be in a different form or region\n")
             else:
-                result += f"✅ **{pokemon_name.title()}** found in Pokemon Go! Check the sources above for details.\n"
+                parts.append(f"✅ **{pokemon_name.title()}** found in Pokemon Go! Check the sources above for details.\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error searching for Pokemon: {e}")
+            logger.error("Error searching for Pokemon: %s", e)
             return f"Error searching for Pokemon: {str(e)}"
     
     @mcp.tool()
@@ -246,18 +239,19 @@ def register_cross_cutting_tools():
         try:
             logger.info("Generating daily priorities...")
             
-            # Debug: Check api_client type
-            logger.debug(f"api_client type: {type(api_client)}")
-            logger.debug(f"api_client methods: {[m for m in dir(api_client) if not m.startswith('_')]}")
+            # Debug: Check api_client type; listing its methods is skipped unless debug logging is on
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("api_client type: %s", type(get_api_client()))
+                logger.debug("api_client methods: %s", [m for m in dir(get_api_client()) if not m.startswith('_')])
             
             # Get all data with explicit error handling
-            logger.info("Calling api_client.get_all_data()...")
-            all_data = await api_client.get_all_data()
-            logger.info(f"Received all_data with keys: {list(all_data.keys()) if isinstance(all_data, dict) else 'NOT A DICT'}")
+            logger.info("Calling api_client.get_data()...")
+            all_data = await get_api_client().get_data("events", "raids", "research", "eggs")
+            logger.info("Received all_data with keys: %s", list(all_data.keys()) if isinstance(all_data, dict) else 'NOT A DICT')
             
             # Verify data structure
             if not isinstance(all_data, dict):
-                raise TypeError(f"Expected dict from get_all_data(), got {type(all_data)}")
+                raise TypeError(f"Expected dict from get_data(), got {type(all_data)}")
             
             if "events" not in all_data:
                 raise KeyError("Missing 'events' key in all_data")
@@ -266,37 +260,37 @@ def register_cross_cutting_tools():
             if not isinstance(events_data, list):
                 raise TypeError(f"Expected list for events, got {type(events_data)}")
                 
-            logger.info(f"Processing {len(events_data)} events...")
+            logger.info("Processing %s events...", len(events_data))
             
             current_time = datetime.now(timezone.utc)
             
-            result = f"# 🎯 Daily Pokemon Go Priorities ({get_current_time_str()})\n\n"
+            parts = [f"# 🎯 Daily Pokemon Go Priorities ({get_current_time_str()})\n\n"]
             
             # Active events
             active_events = [e for e in events_data if is_event_active(e, current_time)]
             
             if active_events:
-                result += "## 🔥 Active Events (Top Priority!)\n\n"
+                parts.append("## 🔥 Active Events (Top Priority!)\n\n")
                 for event in active_events[:3]:  # Top 3 events
-                    result += f"**{event.name}**\n"
+                    parts.append(f"**{event.name}**\n")
                     if event.extra_data and "communityday" in event.extra_data:
                         cd_data = event.extra_data["communityday"]
                         spawns = [s.get("name") for s in cd_data.get("spawns", [])]
                         if spawns:
-                            result += f"Focus: {', '.join(spawns)}\n"
-                    result += f"Link: {event.link}\n\n"
+                            parts.append(f"Focus: {', '.join(spawns)}\n")
+                    parts.append(f"Link: {event.link}\n\n")
             
             # Priority raids (with fallback for missing data)
             raids_data = all_data.get("raids", [])
             if raids_data:
-                shiny_raids = [r for r in raids_data if r.can_be_shiny]
+                shiny_raids = filter_shiny_pokemon(raids_data)
                 if shiny_raids:
-                    result += "## ⚔️ Priority Raids (Shiny Hunting)\n\n"
+                    parts.append("## ⚔️ Priority Raids (Shiny Hunting)\n\n")
                     
                     # Check if raids were extracted from events (fallback source)
                     is_from_events = any(r.extra_data and r.extra_data.get("source") == "events_fallback" for r in shiny_raids)
                     if is_from_events:
-                        result += "*📅 Raid data extracted from active events*\n\n"
+                        parts.append("*📅 Raid data extracted from active events*\n\n")
                     
                     for raid in shiny_raids[:5]:  # Top 5 shiny raids
                         tier_info = f" ({raid.tier})" if raid.tier != "Unknown" else ""
@@ -307,47 +301,47 @@ def register_cross_cutting_tools():
                             event_name = raid.extra_data.get("event_name", "")
                             event_info = f" - *{event_name}*"
                         
-                        result += f"• **{raid.name}**{tier_info} ✨{event_info}\n"
-                    result += "\n"
+                        parts.append(f"• **{raid.name}**{tier_info} ✨{event_info}\n")
+                    parts.append("\n")
             else:
-                result += "## ⚔️ Raids Status\n\n"
-                result += "⚠️ No raid data available from either raids.json or active events.\n\n"
+                parts.append("## ⚔️ Raids Status\n\n")
+                parts.append("⚠️ No raid data available from either raids.json or active events.\n\n")
             
             # Quick research tasks
             research_data = all_data.get("research", [])
             easy_research = []
             for task in research_data:
-                if any(pattern in task.text.lower() for pattern in ["catch 1", "catch 2", "catch 3", "make 1"]):
+                if _QUICK_RESEARCH_RE.search(task.text.lower()):
                     if any(r.can_be_shiny for r in task.rewards):
                         easy_research.append(task)
             
             if easy_research:
-                result += "## 🔬 Quick Shiny Research (Easy Completions)\n\n"
+                parts.append("## 🔬 Quick Shiny Research (Easy Completions)\n\n")
                 for task in easy_research[:3]:  # Top 3 easy tasks
                     shiny_rewards = [r.name for r in task.rewards if r.can_be_shiny]
-                    result += f"• {task.text} → {', '.join(shiny_rewards)} ✨\n"
-                result += "\n"
+                    parts.append(f"• {task.text} → {', '.join(shiny_rewards)} ✨\n")
+                parts.append("\n")
             
             # Egg recommendations
             eggs_data = all_data.get("eggs", [])
             shiny_eggs_2km = [e for e in eggs_data if e.can_be_shiny and "2 km" in e.egg_type]
             if shiny_eggs_2km:
-                result += "## 🥚 Egg Hatching Focus\n\n"
-                result += "**2km eggs with shiny potential (use infinite incubator):**\n"
+                parts.append("## 🥚 Egg Hatching Focus\n\n")
+                parts.append("**2km eggs with shiny potential (use infinite incubator):**\n")
                 for egg in shiny_eggs_2km[:3]:
-                    result += f"• {egg.name} ✨\n"
-                result += "\n"
+                    parts.append(f"• {egg.name} ✨\n")
+                parts.append("\n")
             
             # Summary recommendations (adaptive based on available data)
-            result += "## 📋 Today's Action Plan\n\n"
-            result += "1. **Events:** Participate in any active events first\n"
+            parts.append("## 📋 Today's Action Plan\n\n")
+            parts.append("1. **Events:** Participate in any active events first\n")
             if raids_data:
-                result += "2. **Raids:** Focus on shiny-eligible raid bosses\n"
+                parts.append("2. **Raids:** Focus on shiny-eligible raid bosses\n")
             else:
-                result += "2. **Raids:** Check local raid apps for current bosses\n"
-            result += "3. **Research:** Complete easy tasks with shiny rewards\n"
-            result += "4. **Eggs:** Incubate 2km eggs for quick shiny chances\n"
-            result += "5. **Walking:** Remember Adventure Sync rewards at 25km/50km\n"
+                parts.append("2. **Raids:** Check local raid apps for current bosses\n")
+            parts.append("3. **Research:** Complete easy tasks with shiny rewards\n")
+            parts.append("4. **Eggs:** Incubate 2km eggs for quick shiny chances\n")
+            parts.append("5. **Walking:** Remember Adventure Sync rewards at 25km/50km\n")
             
             # Add data source status with improved messaging
             missing_sources = []
@@ -366,21 +360,18 @@ def register_cross_cutting_tools():
                 missing_sources.append("events")
             
             if missing_sources or fallback_used:
-                result += "\n---\n"
+                parts.append("\n---\n")
                 if fallback_used:
-                    result += f"ℹ️ **Fallback data sources used:** {', '.join(fallback_used)}\n"
+                    parts.append(f"ℹ️ **Fallback data sources used:** {', '.join(fallback_used)}\n")
                 if missing_sources:
-                    result += f"⚠️ **Unavailable data sources:** {', '.join(missing_sources)}\n"
-                result += "Recommendations are based on currently available data.\n"
+                    parts.append(f"⚠️ **Unavailable data sources:** {', '.join(missing_sources)}\n")
+                parts.append("Recommendations are based on currently available data.\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
             error_msg = f"Error generating daily priorities: {str(e)}"
-            logger.error(error_msg)
-            logger.error(f"Exception type: {type(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(error_msg)
             return error_msg
     
     @mcp.tool()
@@ -392,85 +383,85 @@ def register_cross_cutting_tools():
         """
         try:
             logger.info("Checking server status...")
-            all_data = await api_client.get_all_data()
+            all_data = await get_api_client().get_all_data()
             current_time = datetime.now(timezone.utc)
             
-            result = f"# 📊 Pokemon Go MCP Server Status\n\n"
-            result += f"**Last Updated:** {get_current_time_str()}\n"
-            result += f"**Data Source:** LeekDuck API (ScrapedDuck)\n\n"
+            parts = [f"# 📊 Pokemon Go MCP Server Status\n\n"]
+            parts.append(f"**Last Updated:** {get_current_time_str()}\n")
+            parts.append(f"**Data Source:** LeekDuck API (ScrapedDuck)\n\n")
             
             # Data statistics
-            result += "## 📈 Data Statistics\n\n"
-            result += f"• **Events:** {len(all_data['events'])} total\n"
-            result += f"• **Raid Bosses:** {len(all_data['raids'])} total\n"
-            result += f"• **Research Tasks:** {len(all_data['research'])} total\n"
-            result += f"• **Egg Pokemon:** {len(all_data['eggs'])} total\n"
-            result += f"• **Team Rocket Trainers:** {len(all_data.get('rocket_lineups', []))} total\n"
-            result += f"• **Active Promo Codes:** {len(all_data.get('promo_codes', []))} total\n\n"
+            parts.append("## 📈 Data Statistics\n\n")
+            parts.append(f"• **Events:** {len(all_data['events'])} total\n")
+            parts.append(f"• **Raid Bosses:** {len(all_data['raids'])} total\n")
+            parts.append(f"• **Research Tasks:** {len(all_data['research'])} total\n")
+            parts.append(f"• **Egg Pokemon:** {len(all_data['eggs'])} total\n")
+            parts.append(f"• **Team Rocket Trainers:** {len(all_data.get('rocket_lineups', []))} total\n")
+            parts.append(f"• **Active Promo Codes:** {len(all_data.get('promo_codes', []))} total\n\n")
             
             # Active content
             active_events = [e for e in all_data["events"] if is_event_active(e, current_time)]
-            shiny_raids = [r for r in all_data["raids"] if r.can_be_shiny]
-            shiny_research = [t for t in all_data["research"] if any(r.can_be_shiny for r in t.rewards)]
-            shiny_eggs = [e for e in all_data["eggs"] if e.can_be_shiny]
+            shiny_raids = count_shiny_pokemon(all_data["raids"])
+            shiny_research = sum(1 for t in all_data["research"] if any(r.can_be_shiny for r in t.rewards))
+            shiny_eggs = count_shiny_pokemon(all_data["eggs"])
 
             # Count shiny Shadow Pokemon
-            shiny_shadows = 0
-            for trainer in all_data.get('rocket_lineups', []):
-                for slot in trainer.lineups:
-                    for pokemon in slot.pokemon:
-                        if pokemon.can_be_shiny:
-                            shiny_shadows += 1
+            shiny_shadows = sum(
+                count_shiny_pokemon(slot.pokemon)
+                for trainer in all_data.get('rocket_lineups', [])
+                for slot in trainer.lineups
+            )
 
-            result += "## 🎮 Active Content\n\n"
-            result += f"• **Active Events:** {len(active_events)}\n"
-            result += f"• **Shiny Raids:** {len(shiny_raids)}\n"
-            result += f"• **Shiny Research:** {len(shiny_research)}\n"
-            result += f"• **Shiny Eggs:** {len(shiny_eggs)}\n"
-            result += f"• **Shiny Shadow Pokemon:** {shiny_shadows}\n\n"
+            parts.append("## 🎮 Active Content\n\n")
+            parts.append(f"• **Active Events:** {len(active_events)}\n")
+            parts.append(f"• **Shiny Raids:** {shiny_raids}\n")
+            parts.append(f"• **Shiny Research:** {shiny_research}\n")
+            parts.append(f"• **Shiny Eggs:** {shiny_eggs}\n")
+            parts.append(f"• **Shiny Shadow Pokemon:** {shiny_shadows}\n\n")
             
             # Cache status
             cache_info = []
-            for endpoint in ["events", "raids", "research", "eggs", "rocket-lineups", "promo-codes"]:
-                if endpoint in api_client._cache_timestamp:
-                    last_fetch = api_client._cache_timestamp[endpoint]
-                    age_seconds = (current_time - last_fetch).total_seconds()
+            client = get_api_client()
+            for endpoint in DATA_ENDPOINTS:
+                if endpoint in client._cache_timestamp:
+                    last_fetch = client._cache_timestamp[endpoint]
+                    age_seconds = time.monotonic() - last_fetch
                     cache_info.append(f"• **{endpoint.title()}:** {age_seconds:.0f}s ago")
                 else:
                     cache_info.append(f"• **{endpoint.title()}:** Not cached")
             
-            result += "## 💾 Cache Status\n\n"
-            result += "\n".join(cache_info)
-            result += f"\n\n**Cache Duration:** {api_client._cache_duration}s (24 hours)\n"
+            parts.append("## 💾 Cache Status\n\n")
+            parts.append("\n".join(cache_info))
+            parts.append("\n\n**Cache Policy:** reloaded when a data file changes on disk\n")
             
             # Available tools
-            result += "\n## 🛠️ Available Tools\n\n"
-            result += "### Event Tools\n"
-            result += "• get_current_events, get_event_details, get_community_day_info\n"
-            result += "• get_event_spawns, get_event_bonuses, search_events\n\n"
-            
-            result += "### Raid Tools\n"
-            result += "• get_current_raids, get_raid_by_tier, get_shiny_raids\n"
-            result += "• search_raid_boss, get_raids_by_type, get_weather_boosted_raids\n\n"
-            
-            result += "### Research Tools\n"
-            result += "• get_current_research, search_research_by_reward, get_shiny_research_rewards\n"
-            result += "• get_easy_research_tasks, get_research_recommendations\n\n"
-            
-            result += "### Egg Tools\n"
-            result += "• get_egg_hatches, get_egg_hatches_by_distance, get_shiny_egg_hatches\n"
-            result += "• search_egg_pokemon, get_regional_egg_pokemon, get_gift_exchange_pokemon\n\n"
+            parts.append("\n## 🛠️ Available Tools\n\n")
+            parts.append("### Event Tools\n")
+            parts.append("• get_current_events, get_event_details, get_community_day_info\n")
+            parts.append("• get_event_spawns, get_event_bonuses, search_events\n\n")
+            
+            parts.append("### Raid Tools\n")
+            parts.append("• get_current_raids, get_raid_by_tier, get_shiny_raids\n")
+            parts.append("• search_raid_boss, get_raids_by_type, get_weather_boosted_raids\n\n")
+            
+            parts.append("### Research Tools\n")
+            parts.append("• get_current_research, search_research_by_reward, get_shiny_research_rewards\n")
+            parts.append("• get_easy_research_tasks, get_research_recommendations\n\n")
+            
+            parts.append("### Egg Tools\n")
+            parts.append("• get_egg_hatches, get_egg_hatches_by_distance, get_shiny_egg_hatches\n")
+            parts.append("• search_egg_pokemon, get_regional_egg_pokemon, get_gift_exchange_pokemon\n\n")
 
-            result += "### Promo Code Tools\n"
-            result += "• get_active_promo_codes\n\n"
+            parts.append("### Promo Code Tools\n")
+            parts.append("• get_active_promo_codes\n\n")
 
-            result += "### Cross-Platform Tools\n"
-            result += "• get_all_shiny_pokemon, search_pokemon_everywhere, get_daily_priorities\n"
+            parts.append("### Cross-Platform Tools\n")
+            parts.append("• get_all_shiny_pokemon, search_pokemon_everywhere, get_daily_priorities\n")
             
-            return result
+            return "".join(parts)
             
         except Exception as e:
-            logger.error(f"Error getting server status: {e}")
+            logger.error("Error getting server status: %s", e)
             return f"Error getting server status: {str(e)}"
     
     @mcp.tool()
@@ -481,12 +472,12 @@ def register_cross_cutting_tools():
         Use this if you suspect the data is stale or after major game updates.
         """
         try:
-            api_client.clear_cache()
+            get_api_client().clear_cache()
             logger.info("Cache cleared successfully")
             return f"✅ Cache cleared successfully at {get_current_time_str()}\n\nFresh data will be fetched on the next request."
             
         except Exception as e:
-            logger.error(f"Error clearing cache: {e}")
+            logger.error("Error clearing cache: %s", e)
             return f"Error clearing cache: {str(e)}"
 
 
@@ -505,17 +496,23 @@ def main():
 
     logger.info("All tools registered successfully")
 
+    # Load the data files up front so the first tool call doesn't pay for parsing
+    try:
+        asyncio.run(get_api_client().warm_caches())
+    except Exception as e:
+        logger.warning("Cache warm-up failed, data will load on first request: %s", e)
+
     # Run the server - check for HTTP/SSE mode via environment variable
     transport = os.environ.get('MCP_TRANSPORT', 'stdio')
 
     if transport == 'http':
         host = os.environ.get('MCP_HOST', '0.0.0.0')
         port = int(os.environ.get('MCP_PORT', '8000'))
-        logger.info(f"Starting HTTP Streamable Transport server on {host}:{port}")
+        logger.info("Starting HTTP Streamable Transport server on %s:%s", host, port)
         mcp.run(transport="http")
     elif transport == 'sse':
         port = int(os.environ.get('MCP_PORT', '8000'))
-        logger.info(f"Starting SSE server on port {port}")
+        logger.info("Starting SSE server on port %s", port)
         mcp.run(transport="sse")
     else:
         logger.info("Starting stdio server")
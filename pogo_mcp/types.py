@@ -1,23 +1,23 @@
-from typing import List, Dict, Optional, Union
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple, Union
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeInfo:
     """Pokemon type information"""
     name: str
     image: str
 
 
-@dataclass
+@dataclass(slots=True)
 class WeatherInfo:
     """Weather boost information"""
     name: str
     image: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PokemonInfo:
     """Basic Pokemon information"""
     name: str
@@ -26,14 +26,14 @@ class PokemonInfo:
     combat_power: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BonusInfo:
     """Community day bonus information"""
     text: str
     image: str
 
 
-@dataclass
+@dataclass(slots=True)
 class EventExtraData:
     """Additional event-specific data"""
     generic: Optional[Dict] = None
@@ -44,7 +44,7 @@ class EventExtraData:
     breakthrough: Optional[Dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EventInfo:
     """Event information"""
     event_id: str
@@ -58,7 +58,7 @@ class EventInfo:
     extra_data: Optional[EventExtraData] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RaidInfo:
     """Raid boss information"""
     name: str
@@ -69,17 +69,89 @@ class RaidInfo:
     boosted_weather: List[WeatherInfo]
     image: str
     extra_data: Optional[Dict] = None
+    # Memoized format_raid_summary() text; raids are rebuilt on every data load
+    _summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
+class RaidIndex:
+    """Current raid bosses grouped by lowercased tier, type and boosting weather, built in one pass"""
+    raids: List[RaidInfo]
+    by_tier: Dict[str, List[RaidInfo]] = field(default_factory=dict)
+    by_type: Dict[str, List[RaidInfo]] = field(default_factory=dict)
+    by_weather: Dict[str, List[RaidInfo]] = field(default_factory=dict)
+    names_lower: List[str] = field(default_factory=list)  # parallel to raids, for name searches
+    names_blob: str = ""  # names_lower joined with NULs, to reject a missing name in one scan
+    tiers: List[str] = field(default_factory=list)  # distinct tier names as scraped, sorted
+    shiny: List[RaidInfo] = field(default_factory=list)
+
+    @classmethod
+    def from_raids(cls, raids: List[RaidInfo]) -> "RaidIndex":
+        """Index a list of raids; the lists are shared views and must not be mutated."""
+        index = cls(raids)
+        for raid in raids:
+            index.names_lower.append(raid.name.lower())
+            if raid.can_be_shiny:
+                index.shiny.append(raid)
+            index.by_tier.setdefault(raid.tier.lower(), []).append(raid)
+            for type_name in {t.name.lower() for t in raid.types}:
+                index.by_type.setdefault(type_name, []).append(raid)
+            for weather_name in {w.name.lower() for w in raid.boosted_weather}:
+                index.by_weather.setdefault(weather_name, []).append(raid)
+        index.names_blob = "\0".join(index.names_lower)
+        index.tiers = sorted({raid.tier for raid in raids})
+        return index
+
+    def matching(self, groups: Dict[str, List[RaidInfo]], fragment: str) -> List[RaidInfo]:
+        """Return raids in any group whose key contains ``fragment`` (case-insensitive), in raid order."""
+        fragment = fragment.lower()
+        matched = [group for key, group in groups.items() if fragment in key]
+        if len(matched) <= 1:
+            return list(matched[0]) if matched else []
+        # Several keys matched: merge them back into the original raid order
+        hits = {id(raid) for group in matched for raid in group}
+        return [raid for raid in self.raids if id(raid) in hits]
+
+
+@dataclass(slots=True)
 class ResearchTaskInfo:
     """Field research task information"""
     text: str
     rewards: List[PokemonInfo]
     task_type: Optional[str] = None
+    # Memoized format_research_summary() text; tasks are rebuilt on every data load
+    _summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
+class ResearchIndex:
+    """Current research tasks with their text, type and reward names lowercased once for searching"""
+    tasks: List[ResearchTaskInfo]
+    texts_lower: List[str] = field(default_factory=list)  # the lists below run parallel to tasks
+    task_types_lower: List[str] = field(default_factory=list)
+    reward_names_lower: List[Tuple[str, ...]] = field(default_factory=list)
+    has_shiny: List[bool] = field(default_factory=list)
+    shiny_tasks: List[ResearchTaskInfo] = field(default_factory=list)
+    shiny_pokemon: List[str] = field(default_factory=list)  # sorted names of the shiny-eligible rewards
+
+    @classmethod
+    def from_tasks(cls, tasks: List[ResearchTaskInfo]) -> "ResearchIndex":
+        """Index a list of research tasks; the lists are shared views and must not be mutated."""
+        index = cls(tasks)
+        for task in tasks:
+            index.texts_lower.append(task.text.lower())
+            index.task_types_lower.append(task.task_type.lower() if task.task_type else "")
+            index.reward_names_lower.append(tuple(reward.name.lower() for reward in task.rewards))
+            shiny_names = [reward.name for reward in task.rewards if reward.can_be_shiny]
+            index.has_shiny.append(bool(shiny_names))
+            if shiny_names:
+                index.shiny_tasks.append(task)
+                index.shiny_pokemon.extend(shiny_names)
+        index.shiny_pokemon = sorted(set(index.shiny_pokemon))
+        return index
+
+
+@dataclass(slots=True)
 class EggInfo:
     """Egg hatch information"""
     name: str
@@ -94,7 +166,45 @@ class EggInfo:
     rarity: int
 
 
-@dataclass
+@dataclass(slots=True)
+class EggIndex:
+    """Current eggs grouped by egg type and by feature flag, built in one pass"""
+    eggs: List[EggInfo]
+    by_type: Dict[str, List[EggInfo]] = field(default_factory=dict)
+    shiny: List[EggInfo] = field(default_factory=list)
+    regional: List[EggInfo] = field(default_factory=list)
+    gift_exchange: List[EggInfo] = field(default_factory=list)
+    route_gift: List[EggInfo] = field(default_factory=list)
+    adventure_sync: List[EggInfo] = field(default_factory=list)
+    names_lower: List[str] = field(default_factory=list)  # parallel to eggs, for name searches
+    egg_types: List[str] = field(default_factory=list)  # the by_type keys, sorted
+    shiny_names: List[str] = field(default_factory=list)  # distinct shiny egg names, sorted
+    regional_names: List[str] = field(default_factory=list)  # regional egg names, sorted
+
+    @classmethod
+    def from_eggs(cls, eggs: List[EggInfo]) -> "EggIndex":
+        """Index a list of eggs; the lists are shared views and must not be mutated."""
+        index = cls(eggs)
+        for egg in eggs:
+            index.by_type.setdefault(egg.egg_type, []).append(egg)
+            index.names_lower.append(egg.name.lower())
+            if egg.can_be_shiny:
+                index.shiny.append(egg)
+            if egg.is_regional:
+                index.regional.append(egg)
+            if egg.is_gift_exchange:
+                index.gift_exchange.append(egg)
+            if egg.is_route_gift:
+                index.route_gift.append(egg)
+            if egg.is_adventure_sync:
+                index.adventure_sync.append(egg)
+        index.egg_types = sorted(index.by_type)
+        index.shiny_names = sorted({egg.name for egg in index.shiny})
+        index.regional_names = sorted(egg.name for egg in index.regional)
+        return index
+
+
+@dataclass(slots=True)
 class ShadowPokemonInfo:
     """Shadow Pokemon information for Team Rocket encounters"""
     name: str
@@ -104,7 +214,7 @@ class ShadowPokemonInfo:
     can_be_shiny: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class RocketLineupSlot:
     """Individual slot in a Rocket trainer's lineup"""
     slot: int
@@ -112,7 +222,7 @@ class RocketLineupSlot:
     pokemon: List[ShadowPokemonInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class RocketTrainerInfo:
     """Team Rocket trainer information"""
     name: str
@@ -123,7 +233,53 @@ class RocketTrainerInfo:
     lineups: List[RocketLineupSlot]
 
 
-@dataclass
+@dataclass(slots=True)
+class RocketIndex:
+    """Current Team Rocket trainers with their names lowercased once for searching"""
+    trainers: List[RocketTrainerInfo]
+    names_lower: List[str] = field(default_factory=list)  # parallel to trainers
+    by_pokemon: Dict[str, List[int]] = field(default_factory=dict)  # lowercased Pokemon name -> positions of trainers using it
+    pokemon: Dict[str, ShadowPokemonInfo] = field(default_factory=dict)  # lowercased name -> first entry, in lineup order
+    slot_names_lower: List[List[Tuple[str, ...]]] = field(default_factory=list)  # parallel to trainers, names per slot
+
+    @classmethod
+    def from_trainers(cls, trainers: List[RocketTrainerInfo]) -> "RocketIndex":
+        """Index a list of trainers; the lists are shared views and must not be mutated."""
+        index = cls(trainers)
+        for position, trainer in enumerate(trainers):
+            index.names_lower.append(trainer.name.lower())
+            slot_names = []
+            index.slot_names_lower.append(slot_names)
+            for slot in trainer.lineups:
+                names = tuple(pokemon.name.lower() for pokemon in slot.pokemon)
+                slot_names.append(names)
+                for pokemon, pokemon_name in zip(slot.pokemon, names):
+                    index.pokemon.setdefault(pokemon_name, pokemon)
+                    users = index.by_pokemon.setdefault(pokemon_name, [])
+                    if not users or users[-1] != position:
+                        users.append(position)
+        return index
+
+    def find_pokemon(self, pokemon_name: str) -> Optional[ShadowPokemonInfo]:
+        """Return the first Pokemon, in lineup order, whose name contains ``pokemon_name`` (case-insensitive)."""
+        fragment = pokemon_name.lower()
+        return next((pokemon for name, pokemon in self.pokemon.items() if fragment in name), None)
+
+    def positions_using(self, pokemon_name: str) -> List[int]:
+        """Return positions of trainers with a Pokemon whose name contains ``pokemon_name`` (case-insensitive), in trainer order."""
+        fragment = pokemon_name.lower()
+        matched = [group for name, group in self.by_pokemon.items() if fragment in name]
+        if len(matched) <= 1:
+            return list(matched[0]) if matched else []
+        # Several names matched: merge them back into the original trainer order
+        return sorted({position for group in matched for position in group})
+
+    def trainers_using(self, pokemon_name: str) -> List[RocketTrainerInfo]:
+        """Return trainers with a Pokemon whose name contains ``pokemon_name`` (case-insensitive), in trainer order."""
+        return [self.trainers[position] for position in self.positions_using(pokemon_name)]
+
+
+@dataclass(slots=True)
 class PromoCodeReward:
     """Reward information for a promo code"""
     name: str
@@ -131,7 +287,7 @@ class PromoCodeReward:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PromoCodeInfo:
     """Promo code information"""
     code: str
@@ -140,9 +296,10 @@ class PromoCodeInfo:
     redemption_url: str
     rewards: List[PromoCodeReward]
     expiration: str
+    expiration_dt: Optional[datetime] = None  # parsed once when the data is loaded
 
 
-@dataclass
+@dataclass(slots=True)
 class ApiData:
     """Complete API data structure"""
     events: List[EventInfo]
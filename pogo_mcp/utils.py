@@ -2,6 +2,8 @@
 
 import json
 import logging
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime, timezone
 from dateutil import parser
@@ -20,7 +22,7 @@ def parse_datetime(date_string: str) -> Optional[datetime]:
         # Try parsing with dateutil first
         return parser.parse(date_string)
     except Exception as e:
-        logger.warning(f"Failed to parse date '{date_string}': {e}")
+        logger.warning("Failed to parse date '%s': %s", date_string, e)
         return None
 
 
@@ -46,6 +48,34 @@ def is_event_active(event: EventInfo, current_time: Optional[datetime] = None) -
     return start_time <= current_time <= end_time
 
 
+def classify_event(event: EventInfo, current_time: Optional[datetime] = None) -> Optional[str]:
+    """Classify an event as "active", "upcoming" or "past", parsing each date at most once.
+    
+    Returns None when the event's dates cannot be parsed.
+    """
+    if current_time is None:
+        current_time = datetime.now(timezone.utc)
+    elif current_time.tzinfo is None:
+        current_time = current_time.replace(tzinfo=timezone.utc)
+    
+    start_time = parse_datetime(event.start)
+    if not start_time:
+        return None
+    if start_time.tzinfo is None:
+        start_time = start_time.replace(tzinfo=timezone.utc)
+    
+    if start_time > current_time:
+        return "upcoming"
+    
+    end_time = parse_datetime(event.end)
+    if not end_time:
+        return None
+    if end_time.tzinfo is None:
+        end_time = end_time.replace(tzinfo=timezone.utc)
+    
+    return "active" if current_time <= end_time else "past"
+
+
 def is_event_upcoming(event: EventInfo, current_time: Optional[datetime] = None) -> bool:
     """Check if an event is upcoming (starts in the future)."""
     if current_time is None:
@@ -65,6 +95,10 @@ def is_event_upcoming(event: EventInfo, current_time: Optional[datetime] = None)
     return start_time > current_time
 
 
+# Works for anything with a can_be_shiny flag: Pokemon, raid bosses, eggs
+_CAN_BE_SHINY = attrgetter("can_be_shiny")
+
+
 def search_pokemon_by_name(name: str, pokemon_list: List[PokemonInfo]) -> List[PokemonInfo]:
     """Search for Pokemon by name (case-insensitive, partial match)."""
     name_lower = name.lower()
@@ -73,7 +107,12 @@ def search_pokemon_by_name(name: str, pokemon_list: List[PokemonInfo]) -> List[P
 
 def filter_shiny_pokemon(pokemon_list: List[PokemonInfo]) -> List[PokemonInfo]:
     """Filter Pokemon list to only include those that can be shiny."""
-    return [p for p in pokemon_list if p.can_be_shiny]
+    return list(filter(_CAN_BE_SHINY, pokemon_list))
+
+
+def count_shiny_pokemon(pokemon_list: List[PokemonInfo]) -> int:
+    """Count the Pokemon in a list that can be shiny."""
+    return sum(1 for pokemon in pokemon_list if pokemon.can_be_shiny)
 
 
 def filter_raids_by_tier(raids: List[RaidInfo], tier: str) -> List[RaidInfo]:
@@ -130,6 +169,10 @@ def filter_research_by_reward(research: List[ResearchTaskInfo], pokemon_name: st
     return [r for r in research if any(name_lower in reward.name.lower() for reward in r.rewards)]
 
 
+# Status shown in event summaries; past or undated events read as ended
+_EVENT_STATUS_LABELS = {"active": "🟢 Active", "upcoming": "🔵 Upcoming"}
+
+
 def format_event_summary(event: EventInfo) -> str:
     """Format an event into a readable summary."""
     start_time = parse_datetime(event.start)
@@ -138,13 +181,7 @@ def format_event_summary(event: EventInfo) -> str:
     start_str = start_time.strftime("%Y-%m-%d %H:%M UTC") if start_time else "Unknown"
     end_str = end_time.strftime("%Y-%m-%d %H:%M UTC") if end_time else "Unknown"
     
-    status = "🔴 Ended"
-    current_time = datetime.now(timezone.utc)
-    
-    if is_event_active(event, current_time):
-        status = "🟢 Active"
-    elif is_event_upcoming(event, current_time):
-        status = "🔵 Upcoming"
+    status = _EVENT_STATUS_LABELS.get(classify_event(event), "🔴 Ended")
     
     summary = f"""**{event.name}** ({status})
 Type: {event.event_type}
@@ -156,7 +193,10 @@ Link: {event.link}"""
 
 
 def format_raid_summary(raid: RaidInfo) -> str:
-    """Format a raid into a readable summary."""
+    """Format a raid into a readable summary, memoized on the raid."""
+    if raid._summary is not None:
+        return raid._summary
+    
     types_str = ", ".join([t.name.title() for t in raid.types])
     weather_str = ", ".join([w.name.title() for w in raid.boosted_weather])
     
@@ -179,11 +219,15 @@ Types: {types_str}
 Weather Boost: {weather_str}
 {shiny_status}"""
     
+    raid._summary = summary
     return summary
 
 
 def format_research_summary(task: ResearchTaskInfo) -> str:
-    """Format a research task into a readable summary."""
+    """Format a research task into a readable summary, memoized on the task."""
+    if task._summary is not None:
+        return task._summary
+    
     rewards_str = ", ".join([
         f"{r.name}{'✨' if r.can_be_shiny else ''}" 
         for r in task.rewards
@@ -195,33 +239,44 @@ def format_research_summary(task: ResearchTaskInfo) -> str:
 Possible Rewards: {rewards_str}
 Note: You get ONE of the rewards listed, not all of them."""
     
+    task._summary = summary
     return summary
 
 
-def format_egg_summary(egg: EggInfo) -> str:
-    """Format an egg Pokemon into a readable summary."""
-    cp_info = ""
-    if egg.combat_power and egg.combat_power != -1:
-        cp_info = f"CP: {egg.combat_power}"
-    
+@lru_cache(maxsize=None)
+def _egg_features_str(can_be_shiny: bool, is_regional: bool, is_gift_exchange: bool,
+                      is_route_gift: bool, is_adventure_sync: bool, rarity: int) -> str:
+    """Build the feature line for an egg; only a handful of flag combinations occur."""
     features = []
-    if egg.can_be_shiny:
+    if can_be_shiny:
         features.append("✨ Can be Shiny")
-    if egg.is_regional:
+    if is_regional:
         features.append("🌍 Regional")
-    if egg.is_gift_exchange:
+    if is_gift_exchange:
         features.append("🎁 Gift Exchange")
-    if egg.is_route_gift:
+    if is_route_gift:
         features.append("🛣️ Route Gift")
-    if egg.is_adventure_sync:
+    if is_adventure_sync:
         features.append("🏃 Adventure Sync")
     
     # Add rarity indicator
-    if egg.rarity > 1:
-        rarity_stars = "⭐" * egg.rarity
+    if rarity > 1:
+        rarity_stars = "⭐" * rarity
         features.append(f"Rarity: {rarity_stars}")
     
-    features_str = " | ".join(features) if features else "Standard"
+    return " | ".join(features) if features else "Standard"
+
+
+def format_egg_summary(egg: EggInfo) -> str:
+    """Format an egg Pokemon into a readable summary."""
+    cp_info = ""
+    if egg.combat_power and egg.combat_power != -1:
+        cp_info = f"CP: {egg.combat_power}"
+    
+    features_str = _egg_features_str(
+        egg.can_be_shiny, egg.is_regional, egg.is_gift_exchange,
+        egg.is_route_gift, egg.is_adventure_sync, egg.rarity
+    )
     
     summary = f"""**{egg.name}** ({egg.egg_type})
 {cp_info}
@@ -230,18 +285,34 @@ def format_egg_summary(egg: EggInfo) -> str:
     return summary
 
 
+def append_limited(parts: List[str], entries: List[str], limit: int) -> None:
+    """Append at most ``limit`` rendered entries to ``parts``, then a note counting the rest."""
+    parts.extend(entries[:limit])
+    if len(entries) > limit:
+        parts.append(f"_... and {len(entries) - limit} more_\n\n")
+
+
 def format_json_output(data: Any, indent: int = 2) -> str:
     """Format data as pretty-printed JSON."""
     try:
         return json.dumps(data, indent=indent, default=str, ensure_ascii=False)
     except Exception as e:
-        logger.error(f"Failed to format JSON: {e}")
+        logger.error("Failed to format JSON: %s", e)
         return str(data)
 
 
-def get_current_time_str() -> str:
-    """Get current time as formatted string."""
-    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+def get_current_time_str(current_time: Optional[datetime] = None) -> str:
+    """Get current time as formatted string.
+    
+    Pass the time a tool already filtered with so its header and results agree.
+    """
+    if current_time is None:
+        current_time = datetime.now(timezone.utc)
+    return current_time.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+# Characters accepted in a Pokemon name query
+_POKEMON_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -'.")
 
 
 def validate_pokemon_name(name: str) -> bool:
@@ -254,8 +325,7 @@ def validate_pokemon_name(name: str) -> bool:
         return False
     
     # Allow letters, numbers, spaces, hyphens, and some special characters
-    allowed_chars = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 -'.")
-    return all(c in allowed_chars for c in name)
+    return _POKEMON_NAME_CHARS.issuperset(name)
 
 
 def normalize_tier_name(tier: str) -> str:
@@ -4,41 +4,84 @@ Generate README.md with live statistics for the data branch.
 This script analyzes all data files and creates a comprehensive statistics report.
 """
 
-import json
+import io
+import mmap
 import os
 from datetime import datetime
 from collections import Counter
-from typing import Dict, List, Any
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, TextIO, Tuple, Any
 
+# Pick the JSON parser once at import; every file is parsed through this callable
+try:
+    from orjson import loads as parse_buffer
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    import json
 
-def load_json_file(filepath: str) -> List[Any]:
-    """Load a JSON file and return its contents."""
+    def parse_buffer(buffer: memoryview) -> Any:
+        """Parse a JSON document from a bytes-like buffer with the stdlib parser."""
+        return json.loads(buffer.tobytes())
+
+# Display order for raid tiers; tiers not listed sort after these
+TIER_ORDER = ['Tier 1', 'Tier 3', 'Tier 5', 'Mega', 'Mega Legendary', 'Elite']
+TIER_RANK = {tier: rank for rank, tier in enumerate(TIER_ORDER)}
+
+# Pre-bound field extractors; records missing a field fall back to dict.get
+_event_type_and_heading = itemgetter('eventType', 'heading')
+_get_name = itemgetter('name')
+
+
+def iter_items(filepath: str) -> Iterator[Any]:
+    """Yield the top-level items of a JSON array file.
+
+    The file is memory-mapped read-only and parsed straight from the mapping,
+    so no intermediate copy of the raw file contents is made.
+    """
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return []
+        if not os.path.exists(filepath) or os.path.getsize(filepath) == 0:
+            return
+        with open(filepath, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                memoryview(mm) as view:
+            items = parse_buffer(view)
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
-        return []
+        return
+    yield from items
 
 
-def analyze_events(events: List[Dict]) -> Dict[str, Any]:
+def analyze_events(events: Iterable[Dict]) -> Dict[str, Any]:
     """Analyze events data and return statistics."""
-    if not events:
+    total = 0
+    event_types = Counter()
+    headings = Counter()
+    has_spawns = 0
+    has_research = 0
+
+    for event in events:
+        total += 1
+        try:
+            event_type, heading = _event_type_and_heading(event)
+        except KeyError:
+            event_type = event.get('eventType', 'unknown')
+            heading = event.get('heading', 'unknown')
+        event_types[event_type] += 1
+        headings[heading] += 1
+
+        # Count events with spawns and field research
+        extra_data = event.get('extraData') or {}
+        generic = extra_data.get('generic') or {}
+        if generic.get('hasSpawns'):
+            has_spawns += 1
+        if generic.get('hasFieldResearchTasks'):
+            has_research += 1
+
+    if not total:
         return {}
 
-    event_types = Counter(event.get('eventType', 'unknown') for event in events)
-    headings = Counter(event.get('heading', 'unknown') for event in events)
-
-    # Count events with spawns and field research
-    has_spawns = sum(1 for event in events
-                     if event.get('extraData', {}).get('generic', {}).get('hasSpawns', False))
-    has_research = sum(1 for event in events
-                       if event.get('extraData', {}).get('generic', {}).get('hasFieldResearchTasks', False))
-
     return {
-        'total': len(events),
+        'total': total,
         'by_type': dict(event_types.most_common()),
         'by_heading': dict(headings.most_common()),
         'with_spawns': has_spawns,
@@ -46,95 +89,154 @@ def analyze_events(events: List[Dict]) -> Dict[str, Any]:
     }
 
 
-def analyze_raids(raids: List[Dict]) -> Dict[str, Any]:
+def analyze_raids(raids: Iterable[Dict]) -> Dict[str, Any]:
     """Analyze raids data and return statistics."""
-    if not raids:
-        return {}
-
-    tiers = Counter(raid.get('tier', 'unknown') for raid in raids)
-    shiny_available = sum(1 for raid in raids if raid.get('canBeShiny', False))
-
+    total = 0
+    tiers = Counter()
+    shiny_available = 0
     # Count pokemon by type
     type_counter = Counter()
+
     for raid in raids:
-        for poke_type in raid.get('types', []):
-            type_counter[poke_type.get('name', 'unknown')] += 1
+        total += 1
+        tiers[raid.get('tier', 'unknown')] += 1
+        if raid.get('canBeShiny'):
+            shiny_available += 1
+        types = raid.get('types') or ()
+        try:
+            type_names = list(map(_get_name, types))
+        except KeyError:
+            type_names = [poke_type.get('name', 'unknown') for poke_type in types]
+        type_counter.update(type_names)
+
+    if not total:
+        return {}
 
     return {
-        'total': len(raids),
+        'total': total,
         'by_tier': dict(tiers.most_common()),
         'shiny_available': shiny_available,
         'top_types': dict(type_counter.most_common(10))
     }
 
 
-def analyze_research(research_tasks: List[Dict]) -> Dict[str, Any]:
+def analyze_research(research_tasks: Iterable[Dict]) -> Dict[str, Any]:
     """Analyze research tasks and return statistics."""
-    if not research_tasks:
-        return {}
+    total = 0
+    total_rewards = 0
+    shiny_rewards = 0
 
-    total_rewards = sum(len(task.get('rewards', [])) for task in research_tasks)
-    shiny_rewards = sum(
-        1 for task in research_tasks
-        for reward in task.get('rewards', [])
-        if reward.get('can_be_shiny', False)
-    )
+    for task in research_tasks:
+        total += 1
+        rewards = task.get('rewards') or ()
+        total_rewards += len(rewards)
+        shiny_rewards += sum(1 for reward in rewards if reward.get('can_be_shiny'))
+
+    if not total:
+        return {}
 
     return {
-        'total': len(research_tasks),
+        'total': total,
         'total_possible_rewards': total_rewards,
         'shiny_possible_rewards': shiny_rewards
     }
 
 
-def analyze_eggs(eggs: List[Dict]) -> Dict[str, Any]:
-    """Analyze eggs data and return statistics."""
-    if not eggs:
-        return {}
+def distance_rank(distance: Any) -> int:
+    """Sort rank for an egg distance like "2 km": its leading number, or 999."""
+    head = str(distance).split(maxsplit=1)[:1]
+    return int(head[0]) if head and head[0].isdigit() else 999
+
 
+def analyze_eggs(eggs: Iterable[Dict]) -> Dict[str, Any]:
+    """Analyze eggs data and return statistics."""
+    total = 0
     # Eggs might have different structure, adjust as needed
     egg_distances = Counter()
     shiny_available = 0
 
     for egg in eggs:
+        total += 1
         # Try to extract distance info if available
-        distance = egg.get('eggType', egg.get('distance', egg.get('eggDistance', 'unknown')))
+        distance = egg.get('eggType')
+        if distance is None:
+            distance = egg.get('distance', egg.get('eggDistance', 'unknown'))
         egg_distances[distance] += 1
-        if egg.get('canBeShiny', False):
+        if egg.get('canBeShiny'):
             shiny_available += 1
 
+    if not total:
+        return {}
+
+    # Rank each distinct distance once and store them in display order
+    ranks = {distance: distance_rank(distance) for distance in egg_distances}
+    by_distance = sorted(egg_distances.most_common(), key=lambda x: ranks[x[0]])
+
     return {
-        'total': len(eggs),
-        'by_distance': dict(egg_distances.most_common()),
+        'total': total,
+        'by_distance': dict(by_distance),
         'shiny_available': shiny_available
     }
 
 
-def analyze_rocket(rocket_lineups: List[Dict]) -> Dict[str, Any]:
+def analyze_rocket(rocket_lineups: Iterable[Dict]) -> Dict[str, Any]:
     """Analyze Team GO Rocket lineups and return statistics."""
-    if not rocket_lineups:
+    total = sum(1 for _ in rocket_lineups)
+    if not total:
         return {}
 
     return {
-        'total': len(rocket_lineups)
+        'total': total
     }
 
 
-def analyze_promo_codes(promo_codes: List[Dict]) -> Dict[str, Any]:
+def analyze_promo_codes(promo_codes: Iterable[Dict]) -> Dict[str, Any]:
     """Analyze promo codes and return statistics."""
-    if not promo_codes:
+    total = sum(1 for _ in promo_codes)
+    if not total:
         return {}
 
     return {
-        'total': len(promo_codes)
+        'total': total
     }
 
 
-def generate_readme(stats: Dict[str, Any]) -> str:
-    """Generate README content with statistics."""
-    timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+# Stats key, data file and analyzer for each data type
+ANALYSES = [
+    ('events', 'events.json', analyze_events),
+    ('raids', 'raids.json', analyze_raids),
+    ('research', 'research.json', analyze_research),
+    ('eggs', 'eggs.json', analyze_eggs),
+    ('rocket', 'rocket-lineups.json', analyze_rocket),
+    ('promo_codes', 'promo-codes.json', analyze_promo_codes),
+]
+
+# Below this much input, worker start-up costs more than the analysis itself
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
 
-    readme = f"""<div align="center">
+def load_and_analyze(filepath: str, analyze: Callable[[Iterable[Dict]], Dict[str, Any]]) -> Dict[str, Any]:
+    """Stream a data file into its analyzer."""
+    return analyze(iter_items(filepath))
+
+
+def collect_stats() -> Dict[str, Any]:
+    """Analyze every data file, in parallel worker processes when the input is large."""
+    total_bytes = sum(os.path.getsize(filepath) for _, filepath, _ in ANALYSES
+                      if os.path.exists(filepath))
+    if total_bytes < PARALLEL_MIN_BYTES:
+        return {key: load_and_analyze(filepath, analyze) for key, filepath, analyze in ANALYSES}
+
+    with ProcessPoolExecutor(max_workers=len(ANALYSES)) as executor:
+        futures = {
+            key: executor.submit(load_and_analyze, filepath, analyze)
+            for key, filepath, analyze in ANALYSES
+        }
+        return {key: future.result() for key, future in futures.items()}
+
+
+# Fixed parts of the README, built once at import time
+README_HEADER = """<div align="center">
 
 # Pokemon GO Data Statistics
 
@@ -146,174 +248,156 @@ This branch contains automatically scraped Pokemon GO data from LeekDuck.com, up
 
 """
 
+DATA_FILES = [
+    ('events.json', 'Current and upcoming events'),
+    ('raids.json', 'Active raid bosses'),
+    ('research.json', 'Field research tasks and rewards'),
+    ('eggs.json', 'Egg hatching pool'),
+    ('rocket-lineups.json', 'Team GO Rocket lineups'),
+    ('promo-codes.json', 'Active promotional codes'),
+]
+
+README_FOOTER = (
+    "\n## Data Files\n\n"
+    "| File | Description |\n"
+    "|:-----|:------------|\n"
+    + "".join(f"| `{filename}` | {description} |\n" for filename, description in DATA_FILES)
+    + "\n## Update Schedule\n\n"
+    "This data is automatically updated every hour via GitHub Actions.\n"
+    "\n## Data Source\n\n"
+    "All data is scraped from [LeekDuck.com](https://leekduck.com), a community resource for Pokemon GO information.\n"
+    "\n---\n\n"
+    "*This README is automatically generated. Do not edit manually.*\n"
+    "\n</div>\n"
+)
+
+
+def count_table(label: str, rows: Iterable[Tuple[Any, Any]]) -> str:
+    """Render a left-aligned "label | Count" Markdown table."""
+    header = f"| {label} | Count |\n|:{'-' * (len(label) + 1)}|------:|\n"
+    return header + "".join(f"| {name} | {count} |\n" for name, count in rows)
+
+
+def write_readme(stats: Dict[str, Any], out: TextIO) -> None:
+    """Write README content with statistics to a text stream, section by section."""
+    timestamp = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+
+    out.write(README_HEADER.format(timestamp=timestamp))
+
     # Overall counts
     total_items = sum(
         stats.get(key, {}).get('total', 0)
         for key in ['events', 'raids', 'research', 'eggs', 'rocket', 'promo_codes']
     )
 
-    readme += f"**Total Items:** {total_items}\n\n"
-    readme += "| Data Type | Count |\n"
-    readme += "|:---------:|:-----:|\n"
+    out.write(f"**Total Items:** {total_items}\n\n")
+    out.write("| Data Type | Count |\n")
+    out.write("|:---------:|:-----:|\n")
 
     if stats.get('events'):
-        readme += f"| Events | {stats['events']['total']} |\n"
+        out.write(f"| Events | {stats['events']['total']} |\n")
     if stats.get('raids'):
-        readme += f"| Raids | {stats['raids']['total']} |\n"
+        out.write(f"| Raids | {stats['raids']['total']} |\n")
     if stats.get('research'):
-        readme += f"| Research Tasks | {stats['research']['total']} |\n"
+        out.write(f"| Research Tasks | {stats['research']['total']} |\n")
     if stats.get('eggs'):
-        readme += f"| Eggs | {stats['eggs']['total']} |\n"
+        out.write(f"| Eggs | {stats['eggs']['total']} |\n")
     if stats.get('rocket'):
-        readme += f"| Team GO Rocket Lineups | {stats['rocket']['total']} |\n"
+        out.write(f"| Team GO Rocket Lineups | {stats['rocket']['total']} |\n")
     if stats.get('promo_codes'):
-        readme += f"| Promo Codes | {stats['promo_codes']['total']} |\n"
+        out.write(f"| Promo Codes | {stats['promo_codes']['total']} |\n")
 
     # Events breakdown
     if stats.get('events'):
-        readme += "\n## Events Breakdown\n\n"
+        out.write("\n## Events Breakdown\n\n")
 
         if stats['events'].get('by_type'):
-            readme += "### By Event Type\n\n"
-            readme += "| Event Type | Count |\n"
-            readme += "|:-----------|------:|\n"
-            for event_type, count in sorted(stats['events']['by_type'].items(), key=lambda x: x[1], reverse=True):
-                readme += f"| {event_type} | {count} |\n"
-            readme += "\n"
+            out.write("### By Event Type\n\n")
+            # by_type is built from most_common(), so it is already sorted by count
+            out.write(count_table("Event Type", stats['events']['by_type'].items()))
+            out.write("\n")
 
         if stats['events'].get('by_heading'):
-            readme += "### By Category\n\n"
-            readme += "| Category | Count |\n"
-            readme += "|:---------|------:|\n"
-            for heading, count in sorted(stats['events']['by_heading'].items(), key=lambda x: x[1], reverse=True):
-                readme += f"| {heading} | {count} |\n"
-            readme += "\n"
-
-        readme += "### Event Features\n\n"
-        readme += "| Feature | Count |\n"
-        readme += "|:--------|------:|\n"
-        readme += f"| Events with spawns | {stats['events'].get('with_spawns', 0)} |\n"
-        readme += f"| Events with field research | {stats['events'].get('with_field_research', 0)} |\n"
+            out.write("### By Category\n\n")
+            out.write(count_table("Category", stats['events']['by_heading'].items()))
+            out.write("\n")
+
+        out.write("### Event Features\n\n")
+        out.write(count_table("Feature", [
+            ("Events with spawns", stats['events'].get('with_spawns', 0)),
+            ("Events with field research", stats['events'].get('with_field_research', 0)),
+        ]))
 
     # Raids breakdown
     if stats.get('raids'):
-        readme += "\n## Raids Breakdown\n\n"
+        out.write("\n## Raids Breakdown\n\n")
 
         if stats['raids'].get('by_tier'):
-            readme += "### By Tier\n\n"
-            readme += "| Tier | Count |\n"
-            readme += "|:-----|------:|\n"
-            tier_order = ['Tier 1', 'Tier 3', 'Tier 5', 'Mega', 'Mega Legendary', 'Elite']
-            for tier in tier_order:
-                if tier in stats['raids']['by_tier']:
-                    readme += f"| {tier} | {stats['raids']['by_tier'][tier]} |\n"
-            # Add any other tiers not in the predefined order
-            for tier, count in stats['raids']['by_tier'].items():
-                if tier not in tier_order:
-                    readme += f"| {tier} | {count} |\n"
-            readme += "\n"
-
-        readme += f"**Raids with Shiny Available:** {stats['raids'].get('shiny_available', 0)}\n\n"
+            out.write("### By Tier\n\n")
+            # Known tiers in display order, then any others in count order
+            sorted_tiers = sorted(stats['raids']['by_tier'].items(),
+                                  key=lambda x: TIER_RANK.get(x[0], len(TIER_ORDER)))
+            out.write(count_table("Tier", sorted_tiers))
+            out.write("\n")
+
+        out.write(f"**Raids with Shiny Available:** {stats['raids'].get('shiny_available', 0)}\n\n")
 
         if stats['raids'].get('top_types'):
-            readme += "### Top Pokemon Types in Raids\n\n"
-            readme += "| Type | Count |\n"
-            readme += "|:-----|------:|\n"
-            for poke_type, count in list(stats['raids']['top_types'].items())[:10]:
-                readme += f"| {poke_type.title()} | {count} |\n"
+            out.write("### Top Pokemon Types in Raids\n\n")
+            top_types = list(stats['raids']['top_types'].items())[:10]
+            out.write(count_table("Type", ((poke_type.title(), count) for poke_type, count in top_types)))
 
     # Research breakdown
     if stats.get('research'):
-        readme += "\n## Research Tasks Breakdown\n\n"
-        readme += "| Metric | Count |\n"
-        readme += "|:-------|------:|\n"
-        readme += f"| Total Tasks | {stats['research']['total']} |\n"
-        readme += f"| Total Possible Rewards | {stats['research'].get('total_possible_rewards', 0)} |\n"
-        readme += f"| Rewards with Shiny Available | {stats['research'].get('shiny_possible_rewards', 0)} |\n"
+        out.write("\n## Research Tasks Breakdown\n\n")
+        out.write(count_table("Metric", [
+            ("Total Tasks", stats['research']['total']),
+            ("Total Possible Rewards", stats['research'].get('total_possible_rewards', 0)),
+            ("Rewards with Shiny Available", stats['research'].get('shiny_possible_rewards', 0)),
+        ]))
 
     # Eggs breakdown
     if stats.get('eggs'):
-        readme += "\n## Eggs Breakdown\n\n"
+        out.write("\n## Eggs Breakdown\n\n")
 
         if stats['eggs'].get('by_distance'):
-            readme += "### By Distance\n\n"
-            readme += "| Distance | Count |\n"
-            readme += "|:---------|------:|\n"
-            # Sort by extracting the numeric value from distance strings like "2 km"
-            sorted_distances = sorted(stats['eggs']['by_distance'].items(),
-                                     key=lambda x: int(x[0].split()[0]) if x[0].split()[0].isdigit() else 999)
-            for distance, count in sorted_distances:
-                readme += f"| {distance} | {count} |\n"
-            readme += "\n"
-
-        readme += f"**Eggs with Shiny Available:** {stats['eggs'].get('shiny_available', 0)}\n"
+            out.write("### By Distance\n\n")
+            # analyze_eggs already ordered by_distance by its numeric value
+            out.write(count_table("Distance", stats['eggs']['by_distance'].items()))
+            out.write("\n")
+
+        out.write(f"**Eggs with Shiny Available:** {stats['eggs'].get('shiny_available', 0)}\n")
 
     # Rocket lineups
     if stats.get('rocket'):
-        readme += f"\n## Team GO Rocket\n\n"
-        readme += "| Metric | Count |\n"
-        readme += "|:-------|------:|\n"
-        readme += f"| Total Lineups | {stats['rocket']['total']} |\n"
+        out.write("\n## Team GO Rocket\n\n")
+        out.write(count_table("Metric", [("Total Lineups", stats['rocket']['total'])]))
 
     # Promo codes
     if stats.get('promo_codes'):
-        readme += f"\n## Promo Codes\n\n"
-        readme += "| Metric | Count |\n"
-        readme += "|:-------|------:|\n"
-        readme += f"| Available Codes | {stats['promo_codes']['total']} |\n"
-
-    # Data files info
-    readme += "\n## Data Files\n\n"
-    readme += "| File | Description |\n"
-    readme += "|:-----|:------------|\n"
-    readme += "| `events.json` | Current and upcoming events |\n"
-    readme += "| `raids.json` | Active raid bosses |\n"
-    readme += "| `research.json` | Field research tasks and rewards |\n"
-    readme += "| `eggs.json` | Egg hatching pool |\n"
-    readme += "| `rocket-lineups.json` | Team GO Rocket lineups |\n"
-    readme += "| `promo-codes.json` | Active promotional codes |\n"
+        out.write("\n## Promo Codes\n\n")
+        out.write(count_table("Metric", [("Available Codes", stats['promo_codes']['total'])]))
 
-    readme += "\n## Update Schedule\n\n"
-    readme += "This data is automatically updated every hour via GitHub Actions.\n"
+    out.write(README_FOOTER)
 
-    readme += "\n## Data Source\n\n"
-    readme += "All data is scraped from [LeekDuck.com](https://leekduck.com), a community resource for Pokemon GO information.\n"
 
-    readme += "\n---\n\n"
-    readme += "*This README is automatically generated. Do not edit manually.*\n"
-    readme += "\n</div>\n"
-
-    return readme
+def generate_readme(stats: Dict[str, Any]) -> str:
+    """Generate README content with statistics."""
+    buffer = io.StringIO()
+    write_readme(stats, buffer)
+    return buffer.getvalue()
 
 
 def main():
     """Main function to generate README with statistics."""
     print("Generating data statistics README...")
 
-    # Load all data files
-    events = load_json_file('events.json')
-    raids = load_json_file('raids.json')
-    research = load_json_file('research.json')
-    eggs = load_json_file('eggs.json')
-    rocket_lineups = load_json_file('rocket-lineups.json')
-    promo_codes = load_json_file('promo-codes.json')
-
-    # Analyze each data type
-    stats = {
-        'events': analyze_events(events),
-        'raids': analyze_raids(raids),
-        'research': analyze_research(research),
-        'eggs': analyze_eggs(eggs),
-        'rocket': analyze_rocket(rocket_lineups),
-        'promo_codes': analyze_promo_codes(promo_codes)
-    }
-
-    # Generate README
-    readme_content = generate_readme(stats)
+    # Stream each data file straight into its analyzer
+    stats = collect_stats()
 
-    # Write README
-    with open('README.md', 'w', encoding='utf-8') as f:
-        f.write(readme_content)
+    # Write README straight to disk through a large buffer
+    with open('README.md', 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_readme(stats, f)
 
     print("README.md generated successfully!")
     print(f"Total items analyzed: {sum(s.get('total', 0) for s in stats.values())}")
@@ -4,7 +4,7 @@ import pytest
 import asyncio
 from pathlib import Path
 from pogo_mcp.server import mcp
-from pogo_mcp.api_client import api_client
+from pogo_mcp.api_client import get_api_client
 
 
 @pytest.fixture(scope="session")
@@ -29,13 +29,13 @@ def mcp_server():
 @pytest.fixture(scope="session")
 def api_client_instance():
     """Fixture that provides the API client instance."""
-    return api_client
+    return get_api_client()
 
 
 @pytest.fixture(scope="function")
 def fresh_cache():
     """Fixture that clears the cache before each test to ensure fresh data."""
-    api_client.clear_cache()
+    get_api_client().clear_cache()
     yield
     # Cache is cleared again after test if needed
 
@@ -196,7 +196,8 @@ class TestCrossCuttingTools:
     async def test_clear_cache(self, ensure_test_data, mcp_server):
         """Test clear_cache tool."""
         from pogo_mcp.server import register_cross_cutting_tools
-        from pogo_mcp.api_client import api_client
+        from pogo_mcp.api_client import get_api_client
+        api_client = get_api_client()
 
         captured_tools = {}
 
@@ -1,7 +1,7 @@
 """Integration tests for Event-related MCP tools."""
 
 import pytest
-from pogo_mcp.api_client import api_client
+from pogo_mcp.api_client import get_api_client
 
 
 class TestEventTools:
@@ -249,3 +249,25 @@ class TestEventTools:
         # Should indicate no results
         assert isinstance(result, str)
         assert "No events found" in result or "not found" in result.lower()
+
+    def test_classify_event_agrees_with_active_and_upcoming(self):
+        """Test that classify_event matches is_event_active / is_event_upcoming."""
+        from datetime import datetime, timezone
+        from pogo_mcp.types import EventInfo
+        from pogo_mcp.utils import classify_event, is_event_active, is_event_upcoming
+
+        now = datetime(2025, 6, 15, 12, 0, tzinfo=timezone.utc)
+
+        def event(start, end):
+            return EventInfo("id", "Test", "event", "", "", "", start, end)
+
+        cases = {
+            "active": event("2025-06-15T10:00:00Z", "2025-06-15T14:00:00Z"),
+            "upcoming": event("2025-06-16T10:00:00Z", "2025-06-16T14:00:00Z"),
+            "past": event("2025-06-14T10:00:00Z", "2025-06-14T14:00:00Z"),
+            None: event("", ""),
+        }
+        for expected, e in cases.items():
+            assert classify_event(e, now) == expected
+            assert is_event_active(e, now) == (expected == "active")
+            assert is_event_upcoming(e, now) == (expected == "upcoming")
@@ -1,8 +1,10 @@
 """Integration tests for MCP server initialization and basic functionality."""
 
+import asyncio
 import pytest
 from pogo_mcp.server import mcp
 from pogo_mcp import main
+from pogo_mcp.utils import format_json_output, format_raid_summary
 
 
 class TestMCPServerInitialization:
@@ -88,6 +90,66 @@ class TestMCPServerDataAccess:
         assert "rocket_lineups" in all_data
         assert "promo_codes" in all_data
 
+    @pytest.mark.asyncio
+    async def test_can_fetch_selected_data(self, ensure_test_data, api_client_instance):
+        """Test that only the requested data sources are fetched and returned."""
+        data = await api_client_instance.get_data("raids", "eggs")
+        assert set(data) == {"raids", "eggs"}
+        assert data["eggs"] == await api_client_instance.get_eggs()
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_data_isolates_failures(self, ensure_test_data, api_client_instance, monkeypatch):
+        """Test that one failing endpoint doesn't affect the others."""
+        async def failing_get_research():
+            raise RuntimeError("research unavailable")
+
+        monkeypatch.setattr(api_client_instance, "get_research", failing_get_research)
+
+        all_data = await api_client_instance.get_all_data()
+        assert all_data["research"] == []
+        assert len(all_data["events"]) > 0
+        assert len(all_data["eggs"]) > 0
+
+    def test_promo_code_expiration_parsed_on_load(self):
+        """Test that promo code expirations are parsed when the entry is built."""
+        from pogo_mcp.api_client import _build_promo_code
+
+        parsed = _build_promo_code({"code": "A", "expiration": "2025-01-31T23:59:00Z"})
+        unparsed = _build_promo_code({"code": "B", "expiration": "soon"})
+
+        assert parsed.expiration_dt.isoformat() == "2025-01-31T23:59:00+00:00"
+        assert unparsed.expiration_dt is None
+        assert unparsed.expiration == "soon"
+
+    def test_raid_built_from_partial_type_entries(self):
+        """Test that a raid type or weather entry missing a key falls back to an empty string."""
+        from pogo_mcp.api_client import _build_raid
+
+        raid = _build_raid({
+            "name": "Moltres",
+            "types": [{"name": "Fire", "image": "fire.png"}, {"name": "Flying"}],
+            "boostedWeather": [{"image": "sunny.png"}],
+        })
+
+        assert [(t.name, t.image) for t in raid.types] == [("Fire", "fire.png"), ("Flying", "")]
+        assert [(w.name, w.image) for w in raid.boosted_weather] == [("", "sunny.png")]
+
+    def test_extract_raids_from_events_infers_tiers(self, api_client_instance):
+        """Test that raid bosses pulled from events get a tier from their name."""
+        from pogo_mcp.types import EventInfo
+
+        event = EventInfo(
+            event_id="test", name="Raid Weekend", event_type="raid-battles", heading="",
+            link="", image="", start="", end="",
+            extra_data={"raidbattles": {"bosses": [
+                {"name": "Mega Gengar"}, {"name": "Origin Forme Dialga"}, {"name": "Ho-Oh"},
+                {"name": "Pikachu"},
+            ]}}
+        )
+
+        tiers = [raid.tier for raid in api_client_instance.extract_raids_from_events([event])]
+        assert tiers == ["Mega", "5*", "5*", "Unknown"]
+
 
 class TestMCPServerCaching:
     """Test MCP server caching functionality."""
@@ -117,3 +179,232 @@ class TestMCPServerCaching:
         # Cache should now have data
         assert "events" in api_client_instance._cache
         assert "events" in api_client_instance._cache_timestamp
+
+    @pytest.mark.asyncio
+    async def test_old_cache_reused_when_file_unchanged(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that a cache entry is reused for as long as its file is unchanged, however old."""
+        data = await api_client_instance._fetch_data("events")
+        assert "events" in api_client_instance._cache_validator
+
+        # Loaded two days ago; the file on disk has not changed
+        api_client_instance._cache_timestamp["events"] -= 2 * 86400
+
+        assert await api_client_instance._fetch_data("events") is data
+
+    @pytest.mark.asyncio
+    async def test_cache_reloads_when_file_changes(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that a changed data file is reloaded immediately, without waiting for a TTL."""
+        data = await api_client_instance._fetch_data("events")
+
+        # A validator that no longer matches the file, as after a re-scrape
+        api_client_instance._cache_validator["events"] = (0, 0)
+
+        assert await api_client_instance._fetch_data("events") is not data
+
+    @pytest.mark.asyncio
+    async def test_unreadable_file_retried_before_giving_up(self, fresh_cache, ensure_test_data, api_client_instance, monkeypatch):
+        """Test that a data file caught mid-write is read again instead of cached as empty."""
+        read_file = api_client_instance._read_local_file
+        attempts = []
+
+        def flaky_read(local_file):
+            attempts.append(local_file)
+            if len(attempts) == 1:
+                raise ValueError("cannot mmap an empty file")
+            return read_file(local_file)
+
+        monkeypatch.setattr(api_client_instance, "_read_local_file", flaky_read)
+        monkeypatch.setattr(api_client_instance, "LOAD_RETRY_DELAY", 0)
+
+        data = await api_client_instance._fetch_data("eggs")
+
+        assert len(attempts) == 2
+        assert data
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_load(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that concurrent requests for an uncached endpoint wait on a single file load."""
+        first, second = await asyncio.gather(
+            api_client_instance._fetch_data("eggs"),
+            api_client_instance._fetch_data("eggs"),
+        )
+
+        assert first is second
+        assert not api_client_instance._pending_loads
+
+    @pytest.mark.asyncio
+    async def test_file_rewritten_during_load_is_reloaded(self, fresh_cache, api_client_instance, monkeypatch, tmp_path):
+        """Test that a caller joining a load doesn't cache the old data under the rewritten file's validator."""
+        import threading
+
+        data_file = tmp_path / "eggs.json"
+        data_file.write_text('[{"name": "Old"}]')
+        monkeypatch.setattr(api_client_instance, "_data_paths", {"eggs": str(data_file)})
+
+        read_file = api_client_instance._read_local_file
+        parsed, resume = threading.Event(), threading.Event()
+
+        def slow_read(local_file):
+            result = read_file(local_file)
+            parsed.set()
+            resume.wait(5)
+            return result
+
+        monkeypatch.setattr(api_client_instance, "_read_local_file", slow_read)
+
+        first = asyncio.create_task(api_client_instance._fetch_data("eggs"))
+        await asyncio.to_thread(parsed.wait, 5)
+
+        # The scraper lands a new file after the old one was parsed; a second caller sees it and joins the load
+        data_file.write_text('[{"name": "New"}, {"name": "Newer"}]')
+        second = asyncio.create_task(api_client_instance._fetch_data("eggs"))
+        await asyncio.sleep(0)
+        resume.set()
+        await asyncio.gather(first, second)
+
+        try:
+            assert [item["name"] for item in await api_client_instance._fetch_data("eggs")] == ["New", "Newer"]
+        finally:
+            api_client_instance.clear_cache()
+
+    @pytest.mark.asyncio
+    async def test_egg_index_built_once_per_load(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that the egg index groups every egg and is reused while the data is cached."""
+        index = await api_client_instance.get_egg_index()
+
+        assert sum(len(group) for group in index.by_type.values()) == len(index.eggs)
+        assert all(egg.can_be_shiny for egg in index.shiny)
+        assert await api_client_instance.get_egg_index() is index
+
+    @pytest.mark.asyncio
+    async def test_raid_index_matches_linear_filters(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that raid index lookups return the same raids, in the same order, as scanning every raid."""
+        raids = await api_client_instance.get_raids()
+        index = await api_client_instance.get_raid_index()
+
+        for fragment in ("tier 5", "mega", "a", "nonexistent"):
+            assert index.matching(index.by_tier, fragment) == [r for r in raids if fragment in r.tier.lower()]
+        for fragment in ("Fire", "r", "nonexistent"):
+            expected = [r for r in raids if any(fragment.lower() in t.name.lower() for t in r.types)]
+            assert index.matching(index.by_type, fragment) == expected
+        for fragment in ("Sunny", "y", "nonexistent"):
+            expected = [r for r in raids if any(fragment.lower() in w.name.lower() for w in r.boosted_weather)]
+            assert index.matching(index.by_weather, fragment) == expected
+        assert index.shiny == [r for r in raids if r.can_be_shiny]
+        for name in ("mewtwo", "a", "nonexistent"):
+            assert (name in index.names_blob) == any(name in r.name.lower() for r in raids)
+
+    @pytest.mark.asyncio
+    async def test_research_index_lowercases_once_per_load(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that the research index lines up with the tasks and is reused while the data is cached."""
+        index = await api_client_instance.get_research_index()
+
+        assert index.texts_lower == [t.text.lower() for t in index.tasks]
+        assert index.reward_names_lower == [tuple(r.name.lower() for r in t.rewards) for t in index.tasks]
+        shiny_tasks = [t for t in index.tasks if any(r.can_be_shiny for r in t.rewards)]
+        assert index.shiny_tasks == shiny_tasks
+        assert index.shiny_pokemon == sorted({r.name for t in shiny_tasks for r in t.rewards if r.can_be_shiny})
+        assert await api_client_instance.get_research_index() is index
+
+    @pytest.mark.asyncio
+    async def test_raid_summary_memoized_per_raid(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that a raid's summary is formatted once and shared by later calls."""
+        raids = await api_client_instance.get_raids()
+        if not raids:
+            pytest.skip("No raid data")
+
+        summary = format_raid_summary(raids[0])
+
+        assert format_raid_summary(raids[0]) is summary
+        assert raids[0] == (await api_client_instance.get_raids())[0]
+
+    @pytest.mark.asyncio
+    async def test_rendered_text_reused_while_cached(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that rendered text is built once per data load and kept per render function."""
+        def render_names(raids):
+            return ",".join(r.name for r in raids)
+
+        def render_count(raids):
+            return str(len(raids))
+
+        names = await api_client_instance.get_rendered("raids", render_names)
+        raids = await api_client_instance.get_raids()
+
+        assert names == render_names(raids)
+        assert await api_client_instance.get_rendered("raids", render_names) is names
+        assert await api_client_instance.get_rendered("raids", render_count) == str(len(raids))
+
+    @pytest.mark.asyncio
+    async def test_rocket_index_shared_while_cached(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that the rocket tools share one index of the lineups until the data changes."""
+        index = await api_client_instance.get_rocket_index()
+
+        assert index.trainers == await api_client_instance.get_rocket_lineups()
+        assert index.names_lower == [t.name.lower() for t in index.trainers]
+        assert index.slot_names_lower == [
+            [tuple(p.name.lower() for p in slot.pokemon) for slot in trainer.lineups] for trainer in index.trainers
+        ]
+        assert await api_client_instance.get_rocket_index() is index
+
+    @pytest.mark.asyncio
+    async def test_rocket_index_matches_linear_search(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that looking trainers up by Pokemon finds the same trainers, in order, as scanning every lineup."""
+        from pogo_mcp.utils import search_rocket_trainers_by_pokemon
+
+        index = await api_client_instance.get_rocket_index()
+
+        for name in ("Larvitar", "a", "nonexistent"):
+            assert index.trainers_using(name) == search_rocket_trainers_by_pokemon(index.trainers, name)
+            assert [index.trainers[i] for i in index.positions_using(name)] == index.trainers_using(name)
+            first = next((p for t in index.trainers for slot in t.lineups for p in slot.pokemon
+                          if name.lower() in p.name.lower()), None)
+            assert index.find_pokemon(name) is first
+
+    @pytest.mark.asyncio
+    async def test_warm_caches_loads_every_endpoint(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that warming the caches loads each data file and builds the indexes."""
+        await api_client_instance.warm_caches()
+
+        assert set(api_client_instance._cache) >= {"events", "raids", "research", "eggs", "rocket-lineups", "promo-codes"}
+        index = await api_client_instance.get_egg_index()
+        assert await api_client_instance.get_egg_index() is index
+
+    @pytest.mark.asyncio
+    async def test_event_extra_data_json_formatted_once(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that an event's raw data is serialized once and reused while the data is cached."""
+        events = await api_client_instance.get_events()
+        event = next((e for e in events if e.extra_data), None)
+        if event is None:
+            pytest.skip("No events with extra data")
+
+        text = await api_client_instance.get_event_extra_data_json(event)
+
+        assert text == format_json_output(event.extra_data)
+        assert await api_client_instance.get_event_extra_data_json(event) is text
+
+        # A reloaded events file starts a fresh set of formatted payloads
+        api_client_instance._cache_validator["events"] = (0, 0)
+        reloaded = await api_client_instance.get_event_extra_data_json(event)
+        assert reloaded == text and reloaded is not text
+
+    @pytest.mark.asyncio
+    async def test_get_events_filters_by_type(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that filtering events by type keeps matching events in their original order."""
+        events = await api_client_instance.get_events()
+        expected = [e for e in events if "community" in e.event_type.lower()]
+
+        assert await api_client_instance.get_events(event_type="Community") == expected
+        assert await api_client_instance.get_events(event_type="") == events
+
+    @pytest.mark.asyncio
+    async def test_typed_objects_reused_on_cache_hit(self, fresh_cache, ensure_test_data, api_client_instance):
+        """Test that cached endpoints return the already-built objects instead of rebuilding them."""
+        first = await api_client_instance.get_events()
+        second = await api_client_instance.get_events()
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second))
+
+        # Clearing the cache forces a rebuild
+        api_client_instance.clear_cache()
+        assert len(api_client_instance._typed_cache) == 0
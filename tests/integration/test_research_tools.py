@@ -283,3 +283,29 @@ class TestResearchTools:
 
         assert isinstance(result, str)
         assert len(result) > 0
+
+    @pytest.mark.asyncio
+    async def test_get_shiny_research_rewards_limit(self, ensure_test_data, mcp_server):
+        """Test that get_shiny_research_rewards caps the tasks shown and counts the rest."""
+        from pogo_mcp.research import register_research_tools
+
+        captured_tools = {}
+
+        class MockMCP:
+            def tool(self):
+                def decorator(func):
+                    captured_tools[func.__name__] = func
+                    return func
+                return decorator
+
+        mock_mcp = MockMCP()
+        register_research_tools(mock_mcp)
+
+        get_shiny_research_rewards = captured_tools['get_shiny_research_rewards']
+        result = await get_shiny_research_rewards(limit=1)
+
+        if result.startswith("No field research"):
+            pytest.skip("No shiny research tasks")
+        assert result.count("**✨ Shiny Possible:**") == 1
+        if "Found 1 tasks" not in result:
+            assert "more_" in result
@@ -214,7 +214,8 @@ class TestRocketTools:
         register_rocket_tools(mock_mcp)
 
         # Get a pokemon name from the data
-        from pogo_mcp.api_client import api_client
+        from pogo_mcp.api_client import get_api_client
+        api_client = get_api_client()
         trainers = await api_client.get_rocket_lineups()
         if trainers and trainers[0].lineups and trainers[0].lineups[0].pokemon:
             pokemon_name = trainers[0].lineups[0].pokemon[0].name